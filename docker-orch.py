@@ -704,6 +704,11 @@ def create_task():
             compose_path=data.get('compose_path')
         )
         
+        # Optionally start the task in the same request
+        if data.get('start_immediately'):
+            started = docker_manager.start_task(task_id)
+            return jsonify({'task_id': task_id, 'status': 'created', 'started': bool(started)})
+        
         return jsonify({'task_id': task_id, 'status': 'created'})
     
     except Exception as e:
@@ -787,6 +792,24 @@ def stop_task(task_id):
     else:
         return jsonify({'error': 'Failed to stop task'}), 500
 
+@app.route('/api/tasks/<task_id>/restart', methods=['POST'])
+def restart_task(task_id):
+    """Restart a task: stop it, then start it again"""
+    data = request.json or {}
+    checkpoint = data.get('checkpoint', True)
+    
+    task = docker_manager.tasks.get(task_id)
+    if not task:
+        return jsonify({'error': 'Task not found'}), 404
+    
+    if not docker_manager.stop_task(task_id, checkpoint=checkpoint):
+        return jsonify({'error': 'Failed to stop task'}), 500
+    
+    if not docker_manager.start_task(task_id):
+        return jsonify({'error': 'Failed to start task'}), 500
+    
+    return jsonify({'status': 'restarted', 'task_id': task_id})
+
 @app.route('/api/tasks/<task_id>/resume', methods=['POST'])
 def resume_task(task_id):
     """Resume a paused task"""
@@ -31,6 +31,9 @@ import signal
 import threading
 import asyncio
 import shutil
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional, Set, Union, Tuple
 from datetime import datetime, timedelta
 import traceback
@@ -46,7 +49,6 @@ from rich import box
 from rich.text import Text
 from rich.prompt import Prompt, Confirm
 from rich.markdown import Markdown
-from rich.syntax import Syntax
 from rich.tree import Tree
 from rich.align import Align
 from rich.traceback import install as install_rich_traceback
@@ -60,8 +62,10 @@ from prompt_toolkit.styles import Style as PromptStyle
 from prompt_toolkit.history import FileHistory
 from prompt_toolkit.key_binding import KeyBindings
 
-import questionary
-from questionary import Style
+# questionary and rich.syntax (Pygments) are imported inside the functions
+# that prompt or highlight, so scripted commands don't pay for them
+
+from docker_orcha.utils.json_utils import dumps as _json_dumps, loads as _json_loads
 
 # Initialize Typer app with command groups
 app = typer.Typer(help="Modern Docker Orchestration CLI", add_completion=True)
@@ -80,7 +84,7 @@ install_rich_traceback()
 API_URL = "http://localhost:5000/api"
 
 # Custom styles
-custom_style = Style([
+custom_style = PromptStyle([
     ('qmark', 'fg:cyan bold'),
     ('question', 'bold'),
     ('answer', 'fg:green bold'),
@@ -112,6 +116,9 @@ THEME = {
     "warning_color": "yellow bold",
     "info_color": "blue bold",
     "highlight_color": "magenta",
+    "success_style": "green bold",
+    "error_style": "red bold",
+    "warning_style": "yellow bold",
     "task_state_colors": {
         "pending": "yellow",
         "running": "green",
@@ -890,27 +897,31 @@ def run_docker_command(command: List[str], show_output: bool = True) -> str:
 def api_request(endpoint: str, method: str = "GET", data: Dict = None) -> Dict:
     """Make an API request to the orchestration service"""
     url = f"{API_URL}/{endpoint.lstrip('/')}"
+    body = _json_dumps(data) if data is not None else None
+    headers = {"Content-Type": "application/json"}
     
     try:
         if method == "GET":
             response = requests.get(url, timeout=2)
         elif method == "POST":
-            response = requests.post(url, json=data, timeout=2)
+            response = requests.post(url, data=body, headers=headers, timeout=2)
         elif method == "PUT":
-            response = requests.put(url, json=data, timeout=2)
+            response = requests.put(url, data=body, headers=headers, timeout=2)
         elif method == "DELETE":
             response = requests.delete(url, timeout=2)
         else:
             return {"error": f"Unsupported method: {method}"}
         
         response.raise_for_status()
-        return response.json()
+        return _json_loads(response.content)
     except requests.exceptions.ConnectionError:
         return {"error": "Cannot connect to the Docker Orchestration API server. Is it running?", "api_unavailable": True}
     except requests.exceptions.Timeout:
         return {"error": "Connection to Docker Orchestration API server timed out", "api_unavailable": True}
     except requests.exceptions.RequestException as e:
         return {"error": f"API request failed: {str(e)}"}
+    except ValueError as e:
+        return {"error": f"Invalid response from API server: {str(e)}"}
 
 def format_task_state(state: str) -> Text:
     """Format task state with appropriate color"""
@@ -957,6 +968,28 @@ def run_command_with_spinner(command: str, args: List[str], description: str = "
         except Exception as e:
             return 1, "", str(e)
 
+async def _run_command_async(command: str, args: List[str], stdin_data: bytes = None) -> Tuple[int, str, str]:
+    """Run a command as an asyncio subprocess, optionally feeding input on stdin, and return its output"""
+    try:
+        process = await asyncio.create_subprocess_exec(
+            command, *args,
+            stdin=asyncio.subprocess.PIPE if stdin_data is not None else asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        stdout, stderr = await process.communicate(stdin_data)
+        return process.returncode, stdout.decode(errors="replace"), stderr.decode(errors="replace")
+    except Exception as e:
+        return 1, "", str(e)
+
+def run_commands_concurrently(commands: List[Tuple], description: str = "Running commands...") -> List[Tuple[int, str, str]]:
+    """Run several (command, args[, stdin bytes]) tuples at once with a spinner, returning results in order"""
+    async def run_all():
+        return await asyncio.gather(*(_run_command_async(*command) for command in commands))
+    
+    with console.status(f"[bold blue]{description}", spinner="dots"):
+        return asyncio.run(run_all())
+
 def run_command_with_live_output(command: str, args: List[str], timeout: int = None) -> int:
     """Run a command with live output streaming"""
     try:
@@ -985,6 +1018,7 @@ def run_command_with_live_output(command: str, args: List[str], timeout: int = N
 
 def select_containers(multi: bool = False, message: str = "Select container(s):") -> Union[str, List[str]]:
     """Interactive container selection"""
+    import questionary
     containers = get_available_containers()
     
     # Check if no real containers are available
@@ -1256,6 +1290,7 @@ def restart(container: str = typer.Argument(None, help="Container name to restar
 @app.command()
 def interactive():
     """Start interactive mode with a modern UI"""
+    import questionary
     console.print(f"[bold {THEME['title_color']}]{THEME['app_title']} Interactive Mode[/]")
     console.print("[cyan]Use arrow keys to navigate, Enter to select, Ctrl+C to exit[/]")
     console.print("[cyan]Press Ctrl+H at any time to display keyboard shortcuts help[/]")
@@ -1337,6 +1372,8 @@ def start_api_server():
 # Helper functions for interactive mode
 def container_submenu():
     """Container management submenu"""
+    import questionary
+    from rich.syntax import Syntax
     while True:
         container_action = questionary.select(
             "Container Management:",
@@ -1590,6 +1627,7 @@ def container_submenu():
 
 def task_submenu():
     """Task management submenu"""
+    import questionary
     while True:
         task_action = questionary.select(
             "Task Management:",
@@ -1682,6 +1720,7 @@ def task_submenu():
 
 def system_submenu():
     """System management submenu"""
+    import questionary
     while True:
         system_action = questionary.select(
             "System Management:",
@@ -1818,6 +1857,54 @@ def get_tasks(status_filter: str = None) -> List[Dict]:
     
     return []
 
+# Short-lived cache of the task list shared by the task subcommands
+TASK_CACHE_TTL = 2.0  # seconds
+_task_cache = {"timestamp": 0.0, "tasks": [], "choices_by_state": {}, "error": None}
+
+# Background worker for warm-up work that overlaps user input (created on first use)
+_executor = None
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Get the shared background executor, creating it on first use"""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=2)
+    return _executor
+
+def get_all_tasks_cached() -> Dict[str, Any]:
+    """Get all tasks and their pre-formatted picker choices, cached for TASK_CACHE_TTL seconds"""
+    now = time.monotonic()
+    if not (_task_cache["timestamp"] and now - _task_cache["timestamp"] < TASK_CACHE_TTL):
+        _refresh_task_cache()
+    
+    if _task_cache["error"]:
+        console.print(f"[bold red]Error: {_task_cache['error']}[/]")
+    return _task_cache
+
+def _refresh_task_cache() -> Dict[str, Any]:
+    """Fetch the task list and rebuild the cached picker choices without printing errors"""
+    now = time.monotonic()
+    result = api_request("tasks")
+    if "error" in result:
+        # Leave the entry expired so the next call retries
+        _task_cache.update(timestamp=0.0, tasks=[], error=result["error"],
+                           choices_by_state={state: [] for state in ("pending", "running", "paused", "all")})
+        return _task_cache
+    
+    tasks = result.get("tasks", [])
+    choices_by_state = {
+        state: [f"{t['id']} - {t['name']}" for t in tasks if t.get("state") == state]
+        for state in ("pending", "running", "paused")
+    }
+    choices_by_state["all"] = [f"{t['id']} - {t['name']} ({t['state']})" for t in tasks]
+    
+    _task_cache.update(timestamp=now, tasks=tasks, choices_by_state=choices_by_state, error=None)
+    return _task_cache
+
+def invalidate_task_cache():
+    """Drop the cached task list after a task has been modified"""
+    _task_cache["timestamp"] = 0.0
+
 def display_container_table(containers: List[Dict]):
     """Display a formatted table of containers"""
     if not containers:
@@ -2031,6 +2118,7 @@ def container_logs(
     tail: int = typer.Option(100, "--tail", "-n", help="Number of lines to show"),
 ):
     """View container logs"""
+    from rich.syntax import Syntax
     if not container:
         container = select_containers(message="Select container to view logs:")
         if not container:
@@ -2089,6 +2177,7 @@ def container_logs(
 @container_app.command("inspect")
 def container_inspect(container: str = typer.Argument(None, help="Container name to inspect")):
     """Inspect a container's details"""
+    from rich.syntax import Syntax
     if not container:
         container = select_containers(message="Select container to inspect:")
         if not container:
@@ -2164,6 +2253,7 @@ def task_list(
 @task_app.command("create")
 def task_create():
     """Create a new task interactively"""
+    import questionary
     # Collect task information interactively
     name = questionary.text("Task name:", style=custom_style).ask()
     if not name:
@@ -2247,6 +2337,9 @@ def task_create():
                 style=custom_style
             ).ask()
     
+    # Ask up front so the server can start the task in the create request
+    start_now = questionary.confirm("Start task now?", default=False, style=custom_style).ask()
+    
     # Create the task
     with console.status("[bold blue]Creating task...", spinner="dots"):
         task_data = {
@@ -2267,31 +2360,40 @@ def task_create():
             task_data["compose_content"] = compose_content
         if compose_path:
             task_data["compose_path"] = compose_path
+        if start_now:
+            task_data["start_immediately"] = True
         
         result = api_request("tasks", method="POST", data=task_data)
+    invalidate_task_cache()
     
     if "error" in result:
         console.print(f"[bold red]Error creating task: {result['error']}[/]")
     else:
-        console.print(f"[bold green]✓[/] Task created successfully with ID: {result.get('task_id')}")
-        
-        # Ask if user wants to start the task immediately
-        if questionary.confirm("Start task now?", default=False, style=custom_style).ask():
-            task_start(result.get('task_id'))
+        task_id = result.get('task_id')
+        console.print(f"[bold green]✓[/] Task created successfully with ID: {task_id}")
+        
+        if start_now:
+            if "started" not in result:
+                # Server doesn't support start_immediately, start it separately
+                task_start(task_id)
+            elif result["started"]:
+                console.print(f"[bold green]✓[/] Task {task_id} started successfully")
+            else:
+                console.print("[bold red]Error starting task: Failed to start task[/]")
 
 @task_app.command("start")
 def task_start(task_id: str = typer.Argument(None, help="Task ID to start")):
     """Start a task"""
     if not task_id:
+        import questionary
         # List pending tasks for selection
         with console.status("[bold blue]Fetching pending tasks...", spinner="dots"):
-            tasks = get_tasks("pending")
+            task_choices = get_all_tasks_cached()["choices_by_state"]["pending"]
         
-        if not tasks:
+        if not task_choices:
             console.print("[yellow]No pending tasks available to start[/]")
             return
         
-        task_choices = [f"{t['id']} - {t['name']}" for t in tasks]
         selected = questionary.select(
             "Select task to start:",
             choices=task_choices,
@@ -2302,10 +2404,11 @@ def task_start(task_id: str = typer.Argument(None, help="Task ID to start")):
             return
         
         # Extract task ID from selection
-        task_id = selected.split(" - ")[0]
+        task_id = selected.partition(" - ")[0]
     
     with console.status(f"[bold blue]Starting task {task_id}...", spinner="dots"):
         result = api_request(f"tasks/{task_id}/start", method="POST")
+    invalidate_task_cache()
     
     if "error" in result:
         console.print(f"[bold red]Error starting task: {result['error']}[/]")
@@ -2319,15 +2422,15 @@ def task_stop(
 ):
     """Stop a running task"""
     if not task_id:
+        import questionary
         # List running tasks for selection
         with console.status("[bold blue]Fetching running tasks...", spinner="dots"):
-            tasks = get_tasks("running")
+            task_choices = get_all_tasks_cached()["choices_by_state"]["running"]
         
-        if not tasks:
+        if not task_choices:
             console.print("[yellow]No running tasks available to stop[/]")
             return
         
-        task_choices = [f"{t['id']} - {t['name']}" for t in tasks]
         selected = questionary.select(
             "Select task to stop:",
             choices=task_choices,
@@ -2338,10 +2441,11 @@ def task_stop(
             return
         
         # Extract task ID from selection
-        task_id = selected.split(" - ")[0]
+        task_id = selected.partition(" - ")[0]
     
     with console.status(f"[bold blue]Stopping task {task_id}...", spinner="dots"):
         result = api_request(f"tasks/{task_id}/stop", method="POST", data={"checkpoint": checkpoint})
+    invalidate_task_cache()
     
     if "error" in result:
         console.print(f"[bold red]Error stopping task: {result['error']}[/]")
@@ -2352,15 +2456,15 @@ def task_stop(
 def task_resume(task_id: str = typer.Argument(None, help="Task ID to resume")):
     """Resume a paused task"""
     if not task_id:
+        import questionary
         # List paused tasks for selection
         with console.status("[bold blue]Fetching paused tasks...", spinner="dots"):
-            tasks = get_tasks("paused")
+            task_choices = get_all_tasks_cached()["choices_by_state"]["paused"]
         
-        if not tasks:
+        if not task_choices:
             console.print("[yellow]No paused tasks available to resume[/]")
             return
         
-        task_choices = [f"{t['id']} - {t['name']}" for t in tasks]
         selected = questionary.select(
             "Select task to resume:",
             choices=task_choices,
@@ -2371,10 +2475,11 @@ def task_resume(task_id: str = typer.Argument(None, help="Task ID to resume")):
             return
         
         # Extract task ID from selection
-        task_id = selected.split(" - ")[0]
+        task_id = selected.partition(" - ")[0]
     
     with console.status(f"[bold blue]Resuming task {task_id}...", spinner="dots"):
         result = api_request(f"tasks/{task_id}/resume", method="POST")
+    invalidate_task_cache()
     
     if "error" in result:
         console.print(f"[bold red]Error resuming task: {result['error']}[/]")
@@ -2384,16 +2489,16 @@ def task_resume(task_id: str = typer.Argument(None, help="Task ID to resume")):
 @task_app.command("delete")
 def task_delete(task_id: str = typer.Argument(None, help="Task ID to delete")):
     """Delete a task"""
+    import questionary
     if not task_id:
         # List all tasks for selection
         with console.status("[bold blue]Fetching tasks...", spinner="dots"):
-            tasks = get_tasks()
+            task_choices = get_all_tasks_cached()["choices_by_state"]["all"]
         
-        if not tasks:
+        if not task_choices:
             console.print("[yellow]No tasks available to delete[/]")
             return
         
-        task_choices = [f"{t['id']} - {t['name']} ({t['state']})" for t in tasks]
         selected = questionary.select(
             "Select task to delete:",
             choices=task_choices,
@@ -2404,7 +2509,7 @@ def task_delete(task_id: str = typer.Argument(None, help="Task ID to delete")):
             return
         
         # Extract task ID from selection
-        task_id = selected.split(" - ")[0]
+        task_id = selected.partition(" - ")[0]
     
     # Confirm deletion
     confirm = questionary.confirm(
@@ -2419,6 +2524,7 @@ def task_delete(task_id: str = typer.Argument(None, help="Task ID to delete")):
     
     with console.status(f"[bold blue]Deleting task {task_id}...", spinner="dots"):
         result = api_request(f"tasks/{task_id}", method="DELETE")
+    invalidate_task_cache()
     
     if "error" in result:
         console.print(f"[bold red]Error deleting task: {result['error']}[/]")
@@ -2427,6 +2533,7 @@ def task_delete(task_id: str = typer.Argument(None, help="Task ID to delete")):
 
 def select_docker_image():
     """Interactive Docker image selection with multiple modes"""
+    import questionary
     # First ask which selection mode the user prefers
     selection_mode = questionary.select(
         "How would you like to select a Docker image?",
@@ -2457,23 +2564,17 @@ def select_docker_image():
             "mysql:8",
             "postgres:13",
             "redis:latest",
-            "mongodb:latest",
-            "Other (type manually)"
+            "mongodb:latest"
         ]
         
-        image = questionary.select(
-            "Select an image:",
+        # Autocomplete only lays out the matching entries on each keystroke
+        # and accepts any typed name, so no separate manual-entry fallback
+        image = questionary.autocomplete(
+            "Select an image (type to filter, or enter any name:tag):",
             choices=popular_images,
             style=custom_style
         ).ask()
         
-        if image == "Other (type manually)":
-            # Fall back to manual entry
-            image = questionary.text(
-                "Enter Docker image name (format: name:tag):",
-                style=custom_style
-            ).ask()
-        
         return image
     
     elif selection_mode == "Search Docker Hub":
@@ -2501,24 +2602,15 @@ def select_docker_image():
                     if parts:
                         images.append(parts[0])  # First column is image name
             
-            images.append("Other (type manually)")
-            
-            # Let user select from results
-            image = questionary.select(
-                "Select an image:",
+            # Let user pick from results, or type any other image name
+            image = questionary.autocomplete(
+                "Select an image (type to filter, or enter any name:tag):",
                 choices=images,
                 style=custom_style
             ).ask()
-            
-            if image == "Other (type manually)":
-                # Fall back to manual entry
-                image = questionary.text(
-                    "Enter Docker image name (format: name:tag):",
-                    style=custom_style
-                ).ask()
                 
             # If tag not specified, add :latest
-            if ':' not in image:
+            if image and ':' not in image:
                 image += ":latest"
                 
             return image
@@ -2531,8 +2623,34 @@ def select_docker_image():
             ).ask()
             return image
 
-class ConfigPreview:
-    """Class to handle configuration preview and updates"""
+def batched_print(*renderables):
+    """Print several renderables with a single write to the terminal
+    
+    Each renderable is printed through the console into a capture buffer,
+    then the whole buffer is flushed to stdout at once.
+    """
+    with console.capture() as capture:
+        for renderable in renderables:
+            console.print(renderable)
+    sys.stdout.write(capture.get())
+    sys.stdout.flush()
+
+class ConfigPreview(ABC):
+    """Class to handle configuration preview and updates
+    
+    ConfigPreview("dockerfile") and ConfigPreview("compose") return a
+    DockerfilePreview or ComposePreview respectively, so each mutator is a
+    plain method on the right subclass rather than a branch on config_type.
+    """
+    
+    config_type = None
+    syntax_name = None
+    preview_title = None
+    
+    def __new__(cls, config_type="dockerfile"):
+        if cls is ConfigPreview:
+            cls = ComposePreview if config_type == "compose" else DockerfilePreview
+        return super().__new__(cls)
     
     def __init__(self, config_type="dockerfile"):
         """Initialize the configuration preview
@@ -2540,188 +2658,289 @@ class ConfigPreview:
         Args:
             config_type (str): Type of configuration ('dockerfile' or 'compose')
         """
-        self.config_type = config_type
         self.config_lines = []
         self.services = {}  # For storing multiple services in docker-compose
         self.current_service = "app"  # Default service name
+        self._config_str = None  # Joined config_lines, reset by _invalidate()
+        self._rendered_cache = (None, None)  # (config string, rendered panel)
+        self.initialize_default_config()
+    
+    def reset(self):
+        """Return to the default configuration so the preview can be reused"""
+        self.current_service = "app"
+        self._rendered_cache = (None, None)
+        self._invalidate()
         self.initialize_default_config()
     
+    @abstractmethod
     def initialize_default_config(self):
         """Set up default configuration based on the type"""
-        if self.config_type == "dockerfile":
-            self.config_lines = [
-                "FROM base_image:tag",
-                "WORKDIR /app",
-                "# Commands will be added here",
-                "# Expose ports will be added here",
-                "# Entrypoint will be added here"
-            ]
-        elif self.config_type == "compose":
-            self.services = {
-                "app": {
-                    "image": "base_image:tag",
-                    "ports": [],
-                    "volumes": [],
-                    "environment": {},
-                    "command": ""
-                }
-            }
-            self._regenerate_compose_config()
     
-    def _regenerate_compose_config(self):
-        """Regenerate the docker-compose config from services data"""
+    def add_service(self, service_name):
+        """Add a new service to the docker-compose configuration"""
+        return False
+    
+    def set_current_service(self, service_name):
+        """Set the current service for operations"""
+        return False
+    
+    @abstractmethod
+    def update_base_image(self, image_name):
+        """Update the base image in the configuration"""
+    
+    @abstractmethod
+    def add_port(self, container_port, host_port=None):
+        """Add a port mapping to the configuration"""
+    
+    @abstractmethod
+    def add_volume(self, host_path, container_path):
+        """Add a volume mapping to the configuration"""
+    
+    @abstractmethod
+    def add_command(self, command):
+        """Add a command (RUN, CMD, ENTRYPOINT) to the configuration"""
+    
+    @abstractmethod
+    def add_environment_variable(self, key, value):
+        """Add an environment variable to the configuration"""
+    
+    def _invalidate(self):
+        """Drop the cached config string after config_lines changed"""
+        self._config_str = None
+    
+    def get_config_as_string(self):
+        """Get the configuration as a formatted string"""
+        if self._config_str is None:
+            self._config_str = '\n'.join(self.config_lines)
+        return self._config_str
+    
+    def render(self):
+        """Return the configuration preview panel"""
+        from rich.syntax import Syntax
+        # Re-use the rendered panel while the configuration is unchanged, so
+        # Pygments only lexes the config again after an actual edit
+        config_text = self.get_config_as_string()
+        cached_text, panel = self._rendered_cache
+        if cached_text is not config_text:
+            # Create a panel with the configuration
+            panel = Panel(
+                Syntax(config_text, self.syntax_name, theme="ansi_dark"),
+                title=f"{self.preview_title} Preview",
+                border_style=THEME["border_style"],
+                padding=(1, 2)
+            )
+            self._rendered_cache = (config_text, panel)
+        
+        return panel
+    
+    def display_config(self):
+        """Display the current configuration in the console"""
+        console.print(self.render())
+
+class DockerfilePreview(ConfigPreview):
+    """Configuration preview for a single Dockerfile"""
+    
+    config_type = "dockerfile"
+    syntax_name = "Dockerfile"
+    preview_title = "Dockerfile"
+    
+    def initialize_default_config(self):
+        """Set up the default Dockerfile skeleton"""
         self.config_lines = [
-            "version: '3'",
-            "services:"
+            "FROM base_image:tag",
+            "WORKDIR /app",
+            "# Commands will be added here",
+            "# Expose ports will be added here",
+            "# Entrypoint will be added here"
+        ]
+    
+    @property
+    def base_image(self):
+        """Image named in the FROM line, or None if it is still the placeholder"""
+        for line in self.config_lines:
+            if line.startswith("FROM "):
+                image = line[len("FROM "):].strip()
+                return None if image == "base_image:tag" else image
+        return None
+    
+    def update_base_image(self, image_name):
+        """Update the FROM line of the Dockerfile"""
+        for i, line in enumerate(self.config_lines):
+            if line.startswith("FROM "):
+                self.config_lines[i] = f"FROM {image_name}"
+                break
+        self._invalidate()
+    
+    def add_port(self, container_port, host_port=None):
+        """Add an EXPOSE directive for the container port"""
+        # Find the expose ports comment line
+        for i, line in enumerate(self.config_lines):
+            if "# Expose ports" in line:
+                # Replace comment with actual EXPOSE directive
+                self.config_lines[i] = f"EXPOSE {container_port}"
+                break
+        self._invalidate()
+    
+    def add_volume(self, host_path, container_path):
+        """Add a VOLUME directive for the container path"""
+        # Dockerfile doesn't have volumes in the same way, could add VOLUME directive
+        for i, line in enumerate(self.config_lines):
+            if "# Commands" in line:
+                # Add VOLUME directive after WORKDIR
+                self.config_lines.insert(i, f"VOLUME [\"{container_path}\"]")
+                break
+        self._invalidate()
+    
+    def add_command(self, command):
+        """Add a RUN directive to the Dockerfile"""
+        for i, line in enumerate(self.config_lines):
+            if "# Commands" in line:
+                # Replace comment with actual command
+                self.config_lines[i] = f"RUN {command}"
+                break
+        self._invalidate()
+    
+    def add_environment_variable(self, key, value):
+        """Add an ENV directive to the Dockerfile"""
+        # Find a place to insert the ENV directive
+        for i, line in enumerate(self.config_lines):
+            if "# Commands" in line:
+                # Add ENV directive after commands
+                self.config_lines.insert(i+1, f"ENV {key}={value}")
+                break
+        self._invalidate()
+
+class ComposePreview(ConfigPreview):
+    """Configuration preview for a multi-service docker-compose file"""
+    
+    config_type = "compose"
+    syntax_name = "YAML"
+    preview_title = "Docker Compose"
+    
+    def initialize_default_config(self):
+        """Set up the default compose file with a single 'app' service"""
+        self.services = {
+            "app": {
+                "image": "base_image:tag",
+                "ports": [],
+                "ports_set": set(),  # O(1) dedup index for "ports"
+                "volumes": [],
+                "volumes_set": set(),  # O(1) dedup index for "volumes"
+                "environment": {},
+                "command": ""
+            }
+        }
+        self._regenerate_compose_config()
+    
+    def _render_service(self, service_name):
+        """Render the compose lines for a single service"""
+        service_config = self.services[service_name]
+        lines = [
+            f"  {service_name}:",
+            f"    image: {service_config['image']}"
         ]
         
-        # Add each service
-        for service_name, service_config in self.services.items():
-            self.config_lines.append(f"  {service_name}:")
-            self.config_lines.append(f"    image: {service_config['image']}")
-            
-            # Add ports if any
-            if service_config['ports']:
-                self.config_lines.append("    ports:")
-                for port in service_config['ports']:
-                    self.config_lines.append(f"      - \"{port}\"")
-            
-            # Add volumes if any
-            if service_config['volumes']:
-                self.config_lines.append("    volumes:")
-                for volume in service_config['volumes']:
-                    self.config_lines.append(f"      - {volume}")
-            
-            # Add environment if any
-            if service_config['environment']:
-                self.config_lines.append("    environment:")
-                for key, value in service_config['environment'].items():
-                    self.config_lines.append(f"      {key}: {value}")
-            
-            # Add command if specified
-            if service_config['command']:
-                self.config_lines.append(f"    command: {service_config['command']}")
-        
-        # Add networks and volumes configurations
-        self.config_lines.append("# Networks and volumes will be configured here")
+        # Add ports if any
+        if service_config['ports']:
+            lines.append("    ports:")
+            lines.extend(f"      - \"{port}\"" for port in service_config['ports'])
+        
+        # Add volumes if any
+        if service_config['volumes']:
+            lines.append("    volumes:")
+            lines.extend(f"      - {volume}" for volume in service_config['volumes'])
+        
+        # Add environment if any
+        if service_config['environment']:
+            lines.append("    environment:")
+            lines.extend(f"      {key}: {value}" for key, value in service_config['environment'].items())
+        
+        # Add command if specified
+        if service_config['command']:
+            lines.append(f"    command: {service_config['command']}")
+        
+        return lines
+    
+    def _assemble(self):
+        """Join the cached per-service fragments into the full compose config"""
+        self.config_lines = (
+            ["version: '3'", "services:"]
+            + [line for name in self.services for line in self._service_lines[name]]
+            # Add networks and volumes configurations
+            + ["# Networks and volumes will be configured here"]
+        )
+        self._invalidate()
+    
+    def _update_service(self, service_name=None):
+        """Re-render one service's fragment and splice it into the config"""
+        service_name = service_name or self.current_service
+        self._service_lines[service_name] = self._render_service(service_name)
+        self._assemble()
+    
+    def _regenerate_compose_config(self):
+        """Regenerate the docker-compose config from services data"""
+        self._service_lines = {name: self._render_service(name) for name in self.services}
+        self._assemble()
     
     def add_service(self, service_name):
         """Add a new service to the docker-compose configuration"""
-        if self.config_type != "compose":
-            return False
-        
         if service_name in self.services:
             return False  # Service already exists
         
         self.services[service_name] = {
             "image": "base_image:tag",
             "ports": [],
+            "ports_set": set(),
             "volumes": [],
+            "volumes_set": set(),
             "environment": {},
             "command": ""
         }
         
         self.current_service = service_name
-        self._regenerate_compose_config()
+        self._update_service(service_name)
         return True
     
     def set_current_service(self, service_name):
         """Set the current service for operations"""
-        if self.config_type != "compose" or service_name not in self.services:
+        if service_name not in self.services:
             return False
         
         self.current_service = service_name
         return True
     
     def update_base_image(self, image_name):
-        """Update the base image in the configuration"""
-        if self.config_type == "dockerfile":
-            for i, line in enumerate(self.config_lines):
-                if line.startswith("FROM "):
-                    self.config_lines[i] = f"FROM {image_name}"
-                    break
-        elif self.config_type == "compose":
-            # Update the current service's image
-            self.services[self.current_service]["image"] = image_name
-            self._regenerate_compose_config()
+        """Update the current service's image"""
+        self.services[self.current_service]["image"] = image_name
+        self._update_service()
     
     def add_port(self, container_port, host_port=None):
-        """Add a port mapping to the configuration"""
-        if self.config_type == "dockerfile":
-            # Find the expose ports comment line
-            for i, line in enumerate(self.config_lines):
-                if "# Expose ports" in line:
-                    # Replace comment with actual EXPOSE directive
-                    self.config_lines[i] = f"EXPOSE {container_port}"
-                    break
-        elif self.config_type == "compose":
-            # Add port mapping to the current service
-            port_mapping = f"{host_port}:{container_port}" if host_port else f"{container_port}"
-            if port_mapping not in self.services[self.current_service]["ports"]:
-                self.services[self.current_service]["ports"].append(port_mapping)
-                self._regenerate_compose_config()
+        """Add a port mapping to the current service"""
+        port_mapping = f"{host_port}:{container_port}" if host_port else f"{container_port}"
+        service = self.services[self.current_service]
+        if port_mapping not in service["ports_set"]:
+            service["ports_set"].add(port_mapping)
+            service["ports"].append(port_mapping)
+            self._update_service()
     
     def add_volume(self, host_path, container_path):
-        """Add a volume mapping to the configuration"""
-        if self.config_type == "dockerfile":
-            # Dockerfile doesn't have volumes in the same way, could add VOLUME directive
-            for i, line in enumerate(self.config_lines):
-                if "# Commands" in line:
-                    # Add VOLUME directive after WORKDIR
-                    self.config_lines.insert(i, f"VOLUME [\"{container_path}\"]")
-                    break
-        elif self.config_type == "compose":
-            # Add volume mapping to the current service
-            volume_mapping = f"{host_path}:{container_path}"
-            if volume_mapping not in self.services[self.current_service]["volumes"]:
-                self.services[self.current_service]["volumes"].append(volume_mapping)
-                self._regenerate_compose_config()
+        """Add a volume mapping to the current service"""
+        volume_mapping = f"{host_path}:{container_path}"
+        service = self.services[self.current_service]
+        if volume_mapping not in service["volumes_set"]:
+            service["volumes_set"].add(volume_mapping)
+            service["volumes"].append(volume_mapping)
+            self._update_service()
     
     def add_command(self, command):
-        """Add a command (RUN, CMD, ENTRYPOINT) to the configuration"""
-        if self.config_type == "dockerfile":
-            for i, line in enumerate(self.config_lines):
-                if "# Commands" in line:
-                    # Replace comment with actual command
-                    self.config_lines[i] = f"RUN {command}"
-                    break
-        elif self.config_type == "compose":
-            # Set command for the current service
-            self.services[self.current_service]["command"] = command
-            self._regenerate_compose_config()
+        """Set the command for the current service"""
+        self.services[self.current_service]["command"] = command
+        self._update_service()
     
     def add_environment_variable(self, key, value):
-        """Add an environment variable to the configuration"""
-        if self.config_type == "dockerfile":
-            # Find a place to insert the ENV directive
-            for i, line in enumerate(self.config_lines):
-                if "# Commands" in line:
-                    # Add ENV directive after commands
-                    self.config_lines.insert(i+1, f"ENV {key}={value}")
-                    break
-        elif self.config_type == "compose":
-            # Add environment variable to the current service
-            self.services[self.current_service]["environment"][key] = value
-            self._regenerate_compose_config()
-    
-    def get_config_as_string(self):
-        """Get the configuration as a formatted string"""
-        return '\n'.join(self.config_lines)
-    
-    def display_config(self):
-        """Display the current configuration in the console"""
-        syntax = "Dockerfile" if self.config_type == "dockerfile" else "YAML"
-        config_text = self.get_config_as_string()
-        
-        # Create a panel with the configuration
-        panel = Panel(
-            Syntax(config_text, syntax, theme="ansi_dark"),
-            title=f"{'Dockerfile' if self.config_type == 'dockerfile' else 'Docker Compose'} Preview",
-            border_style=THEME["border_style"],
-            padding=(1, 2)
-        )
-        
-        console.print(panel)
+        """Add an environment variable to the current service"""
+        self.services[self.current_service]["environment"][key] = value
+        self._update_service()
 
 class NavigationStack:
     """Navigation stack to keep track of user's navigation through menus"""
@@ -2747,7 +2966,7 @@ class NavigationStack:
     
     def clear(self):
         """Clear the navigation stack"""
-        self.stack = []
+        self.stack.clear()
     
     # Legacy methods for backwards compatibility
     def push(self, screen_id, data=None):
@@ -2765,434 +2984,564 @@ class NavigationStack:
         """Check if we can go back (legacy method)"""
         return len(self.stack) > 1
 
-def create_container_wizard():
-    """Interactive wizard for creating Docker container or compose setup"""
-    console.print("[bold]Container Creation Wizard[/bold]", style=THEME["title_style"])
+@dataclass
+class WizardContext:
+    """State shared by the container creation wizard steps"""
+    nav_stack: NavigationStack = field(default_factory=NavigationStack)
+    config_preview: Optional[ConfigPreview] = None
+    config_type: Optional[str] = None
+    container_name: str = ""
+    service_names: List[str] = field(default_factory=list)
+    service_index: Dict[str, int] = field(default_factory=dict)  # name -> position in service_names
+    
+    def add_service_name(self, name):
+        """Append a compose service name and index it"""
+        self.service_index[name] = len(self.service_names)
+        self.service_names.append(name)
+
+# "Go Back to Edit" choice -> wizard step to jump to
+EDIT_STEP_MAP = {
+    "Container/Service Type": "config_type",
+    "Container Name": "container_name",
+    "Service Setup": "service_setup",
+    "Base Image": "base_image",
+    "Port Mapping": "port_mapping",
+    "Volume Mapping": "volume_mapping",
+    "Environment Variables": "environment_variables",
+    "Command": "command",
+}
+
+# Each wizard step handler takes the WizardContext and returns the name of
+# the next step, its own name to repeat the step, or None to end the wizard.
+
+def _print_current_service(ctx):
+    """Display current service being configured if in compose mode"""
+    if ctx.config_type == "Docker Compose":
+        console.print(f"Configuring service: [bold]{ctx.config_preview.current_service}[/bold]", 
+                     style=THEME["info_style"])
+
+def _step_config_type(ctx):
+    """Ask whether to build a Dockerfile or a Docker Compose configuration"""
+    import questionary
+    ctx.nav_stack.save_step("config_type")
+    console.print("Select configuration type:", style=THEME["info_style"])
+    ctx.config_type = questionary.select(
+        "Configuration type:",
+        choices=["Dockerfile", "Docker Compose", "Cancel"],
+        style=questionary_style
+    ).ask()
     
-    # Use the NavigationStack to keep track of steps
-    nav_stack = NavigationStack()
+    if ctx.config_type == "Cancel":
+        console.print("Wizard canceled.", style=THEME["warning_style"])
+        return None
     
-    # Initialize configuration variables
-    config_preview = None
-    config_type = None
-    container_name = ""
-    service_names = []
-    current_step = "config_type"
+    preview_type = "dockerfile" if ctx.config_type == "Dockerfile" else "compose"
+    if ctx.config_preview is not None and ctx.config_preview.config_type == preview_type:
+        # Reuse the preview kept from a previous pass through the wizard
+        ctx.config_preview.reset()
+    else:
+        ctx.config_preview = ConfigPreview(preview_type)
+    return "container_name" if ctx.config_type == "Dockerfile" else "service_setup"
+
+def _step_container_name(ctx):
+    """Ask for the container name (Dockerfile mode)"""
+    import questionary
+    ctx.nav_stack.save_step("container_name")
+    ctx.container_name = questionary.text(
+        "Enter container name:",
+        style=questionary_style
+    ).ask()
     
-    while True:
-        try:
-            # Handle different steps based on the current_step
-            if current_step == "config_type":
-                nav_stack.save_step(current_step)
-                console.print("Select configuration type:", style=THEME["info_style"])
-                config_type = questionary.select(
-                    "Configuration type:",
-                    choices=["Dockerfile", "Docker Compose", "Cancel"],
-                    style=questionary_style
-                ).ask()
-                
-                if config_type == "Cancel":
-                    console.print("Wizard canceled.", style=THEME["warning_style"])
-                    return
-                
-                config_preview = ConfigPreview("dockerfile" if config_type == "Dockerfile" else "compose")
-                current_step = "container_name" if config_type == "Dockerfile" else "service_setup"
+    if not ctx.container_name:
+        console.print("Container name cannot be empty.", style=THEME["error_style"])
+        return "container_name"
+    
+    return "base_image"
+
+def _step_service_setup(ctx):
+    """Add and pick Docker Compose services"""
+    import questionary
+    ctx.nav_stack.save_step("service_setup")
+    
+    # For Docker Compose, set up services
+    if not ctx.service_names:
+        # At least add the default 'app' service
+        ctx.add_service_name("app")
+    
+    # Show current services and allow adding more
+    choices = [f"Configure Service: {name}" for name in ctx.service_names]
+    choices.append("Add New Service")
+    choices.append("Continue to Image Selection")
+    choices.append("Go Back")
+    
+    service_action = questionary.select(
+        "Service Setup:",
+        choices=choices,
+        style=questionary_style
+    ).ask()
+    
+    if service_action == "Add New Service":
+        new_service = questionary.text(
+            "Enter new service name:",
+            style=questionary_style
+        ).ask()
+        
+        if new_service and new_service not in ctx.service_index:
+            ctx.add_service_name(new_service)
+            ctx.config_preview.add_service(new_service)
+            console.print(f"Added service: {new_service}", style=THEME["success_style"])
+        return "service_setup"
+    
+    elif service_action == "Continue to Image Selection":
+        # Select the first service to configure
+        ctx.config_preview.set_current_service(ctx.service_names[0])
+        return "select_service"
+    
+    elif service_action == "Go Back":
+        return ctx.nav_stack.go_back()
+    
+    # Configure a specific service
+    selected_service = service_action.replace("Configure Service: ", "")
+    ctx.config_preview.set_current_service(selected_service)
+    return "select_service"
+
+def _step_select_service(ctx):
+    """Pick which Docker Compose service to configure next"""
+    import questionary
+    ctx.nav_stack.save_step("select_service")
+    
+    if len(ctx.service_names) > 1:
+        # Only show this step if there are multiple services
+        service_to_configure = questionary.select(
+            "Select service to configure:",
+            choices=ctx.service_names + ["Go Back"],
+            style=questionary_style
+        ).ask()
+        
+        if service_to_configure == "Go Back":
+            return ctx.nav_stack.go_back()
+        
+        ctx.config_preview.set_current_service(service_to_configure)
+    
+    # Display the current configuration
+    ctx.config_preview.display_config()
+    return "base_image"
+
+def _step_base_image(ctx):
+    """Select the base image for the Dockerfile or current service"""
+    ctx.nav_stack.save_step("base_image")
+    _print_current_service(ctx)
+    
+    # Get base image
+    selected_image = select_docker_image()
+    
+    if selected_image == "Go Back":
+        return ctx.nav_stack.go_back()
+    elif not selected_image:
+        console.print("Base image selection canceled.", style=THEME["warning_style"])
+        return None
+    
+    # Update the config preview with the selected image
+    ctx.config_preview.update_base_image(selected_image)
+    ctx.config_preview.display_config()
+    
+    return "port_mapping"
+
+def _step_port_mapping(ctx):
+    """Collect port mappings"""
+    import questionary
+    ctx.nav_stack.save_step("port_mapping")
+    _print_current_service(ctx)
+    
+    add_port = questionary.confirm(
+        "Add port mapping?",
+        style=questionary_style
+    ).ask()
+    
+    # Collect all mappings first and redraw the preview once
+    ports_added = False
+    while add_port:
+        container_port = questionary.text(
+            "Container port:",
+            style=questionary_style
+        ).ask()
+        
+        host_port = questionary.text(
+            "Host port (default: same as container port):",
+            style=questionary_style
+        ).ask()
+        
+        if not container_port:
+            break
+        
+        if not host_port:
+            host_port = container_port
+        
+        ctx.config_preview.add_port(container_port, host_port)
+        ports_added = True
+        
+        # Ask if user wants to add another port
+        add_port = questionary.confirm(
+            "Add another port mapping?",
+            style=questionary_style
+        ).ask()
+    
+    if ports_added:
+        ctx.config_preview.display_config()
+    
+    return "volume_mapping"
+
+def _step_volume_mapping(ctx):
+    """Collect volume mappings"""
+    import questionary
+    ctx.nav_stack.save_step("volume_mapping")
+    _print_current_service(ctx)
+    
+    add_volume = questionary.confirm(
+        "Add volume mapping?",
+        style=questionary_style
+    ).ask()
+    
+    # Collect all mappings first and redraw the preview once
+    volumes_added = False
+    while add_volume:
+        host_path = questionary.text(
+            "Host path:",
+            style=questionary_style
+        ).ask()
+        
+        container_path = questionary.text(
+            "Container path:",
+            style=questionary_style
+        ).ask()
+        
+        if not (host_path and container_path):
+            break
+        
+        ctx.config_preview.add_volume(host_path, container_path)
+        volumes_added = True
+        
+        # Ask if user wants to add another volume
+        add_volume = questionary.confirm(
+            "Add another volume mapping?",
+            style=questionary_style
+        ).ask()
+    
+    if volumes_added:
+        ctx.config_preview.display_config()
+    
+    return "environment_variables"
+
+def _step_environment_variables(ctx):
+    """Collect environment variables"""
+    import questionary
+    ctx.nav_stack.save_step("environment_variables")
+    _print_current_service(ctx)
+    
+    env_mode = questionary.select(
+        "Add environment variables?",
+        choices=["Add one at a time", "Paste KEY=VALUE block", "Skip"],
+        style=questionary_style
+    ).ask()
+    
+    # Collect all variables first and redraw the preview once
+    env_added = False
+    if env_mode == "Paste KEY=VALUE block":
+        env_block = questionary.text(
+            "Paste KEY=VALUE pairs, one per line (Esc then Enter to finish):",
+            multiline=True,
+            style=questionary_style
+        ).ask() or ""
+        
+        for line in env_block.splitlines():
+            env_key, sep, env_value = line.partition("=")
+            env_key = env_key.strip()
+            if sep and env_key:
+                ctx.config_preview.add_environment_variable(env_key, env_value.strip())
+                env_added = True
+    
+    add_env = env_mode == "Add one at a time"
+    while add_env:
+        env_key = questionary.text(
+            "Environment variable key:",
+            style=questionary_style
+        ).ask()
+        
+        env_value = questionary.text(
+            "Environment variable value:",
+            style=questionary_style
+        ).ask()
+        
+        if not env_key:
+            break
+        
+        ctx.config_preview.add_environment_variable(env_key, env_value)
+        env_added = True
+        
+        # Ask if user wants to add another environment variable
+        add_env = questionary.confirm(
+            "Add another environment variable?",
+            style=questionary_style
+        ).ask()
+    
+    if env_added:
+        ctx.config_preview.display_config()
+    
+    return "command"
+
+def _step_command(ctx):
+    """Set the command, then move on to the next service or the review"""
+    import questionary
+    ctx.nav_stack.save_step("command")
+    _print_current_service(ctx)
+    
+    add_command = questionary.confirm(
+        "Add command?",
+        style=questionary_style
+    ).ask()
+    
+    if add_command:
+        command = questionary.text(
+            "Command:",
+            style=questionary_style
+        ).ask()
+        
+        if command:
+            ctx.config_preview.add_command(command)
+            ctx.config_preview.display_config()
+    
+    # For Docker Compose with multiple services
+    service_names = ctx.service_names
+    if ctx.config_type == "Docker Compose" and len(service_names) > 1:
+        # Ask if user wants to configure another service
+        current_service_idx = ctx.service_index[ctx.config_preview.current_service]
+        
+        if current_service_idx < len(service_names) - 1:
+            next_service = questionary.confirm(
+                f"Configure next service ({service_names[current_service_idx + 1]})?",
+                style=questionary_style
+            ).ask()
             
-            elif current_step == "container_name":
-                nav_stack.save_step(current_step)
-                container_name = questionary.text(
-                    "Enter container name:",
-                    style=questionary_style
-                ).ask()
-                
-                if not container_name:
-                    console.print("Container name cannot be empty.", style=THEME["error_style"])
-                    continue
-                
-                current_step = "base_image"
+            if next_service:
+                ctx.config_preview.set_current_service(service_names[current_service_idx + 1])
+                return "base_image"
+        
+        # Option to go back to a previous service
+        edit_service = questionary.confirm(
+            "Edit a different service?",
+            style=questionary_style
+        ).ask()
+        
+        if edit_service:
+            return "select_service"
+    
+    return "review"
+
+def _step_review(ctx):
+    """Review the configuration and save, restart, edit or exit"""
+    import questionary
+    ctx.nav_stack.save_step("review")
+    
+    # Final review of the configuration, written in one go
+    batched_print(
+        Text.from_markup("[bold]Configuration Review:[/bold]", style=THEME["title_style"]),
+        ctx.config_preview.render()
+    )
+    
+    # Ask what to do with the configuration
+    choices = [
+        "Save Configuration",
+        "Start Over",
+        "Go Back to Edit",
+        "Exit Without Saving"
+    ]
+    
+    action = questionary.select(
+        "What would you like to do?",
+        choices=choices,
+        style=questionary_style
+    ).ask()
+    
+    if action == "Save Configuration":
+        if ctx.config_type == "Docker Compose":
+            destination = questionary.select(
+                "Write YAML to disk or pipe it directly to docker-compose?",
+                choices=["Write to disk", "Pipe directly to docker-compose"],
+                style=questionary_style
+            ).ask()
             
-            elif current_step == "service_setup":
-                nav_stack.save_step(current_step)
-                
-                # For Docker Compose, set up services
-                if not service_names:
-                    # At least add the default 'app' service
-                    service_names.append("app")
-                
-                # Show current services and allow adding more
-                choices = [f"Configure Service: {name}" for name in service_names]
-                choices.append("Add New Service")
-                choices.append("Continue to Image Selection")
-                choices.append("Go Back")
-                
-                service_action = questionary.select(
-                    "Service Setup:",
-                    choices=choices,
-                    style=questionary_style
-                ).ask()
-                
-                if service_action == "Add New Service":
-                    new_service = questionary.text(
-                        "Enter new service name:",
-                        style=questionary_style
-                    ).ask()
-                    
-                    if new_service and new_service not in service_names:
-                        service_names.append(new_service)
-                        config_preview.add_service(new_service)
-                        console.print(f"Added service: {new_service}", style=THEME["success_style"])
-                    continue
-                
-                elif service_action == "Continue to Image Selection":
-                    # Select the first service to configure
-                    config_preview.set_current_service(service_names[0])
-                    current_step = "select_service"
-                
-                elif service_action == "Go Back":
-                    current_step = nav_stack.go_back()
-                
+            if destination == "Pipe directly to docker-compose":
+                # docker-compose reads the YAML from stdin, so no file is written
+                payload = ctx.config_preview.get_config_as_string().encode('utf-8')
+                [(returncode, stdout, stderr)] = run_commands_concurrently(
+                    [("docker-compose", ["-f", "-", "up", "-d"], payload)],
+                    "Starting containers..."
+                )
+                if returncode == 0:
+                    console.print("Containers started", style=THEME["success_style"])
                 else:
-                    # Configure a specific service
-                    selected_service = service_action.replace("Configure Service: ", "")
-                    config_preview.set_current_service(selected_service)
-                    current_step = "select_service"
-            
-            elif current_step == "select_service":
-                nav_stack.save_step(current_step)
-                
-                if len(service_names) > 1:
-                    # Only show this step if there are multiple services
-                    service_to_configure = questionary.select(
-                        "Select service to configure:",
-                        choices=service_names + ["Go Back"],
-                        style=questionary_style
-                    ).ask()
-                    
-                    if service_to_configure == "Go Back":
-                        current_step = nav_stack.go_back()
-                        continue
-                    
-                    config_preview.set_current_service(service_to_configure)
-                
-                # Display the current configuration
-                config_preview.display_config()
-                current_step = "base_image"
-            
-            elif current_step == "base_image":
-                nav_stack.save_step(current_step)
-                
-                # Display current service being configured if in compose mode
-                if config_type == "Docker Compose":
-                    console.print(f"Configuring service: [bold]{config_preview.current_service}[/bold]", 
-                                 style=THEME["info_style"])
-                
-                # Get base image
-                selected_image = select_docker_image()
-                
-                if selected_image == "Go Back":
-                    current_step = nav_stack.go_back()
-                    continue
-                elif not selected_image:
-                    console.print("Base image selection canceled.", style=THEME["warning_style"])
-                    return
-                
-                # Update the config preview with the selected image
-                config_preview.update_base_image(selected_image)
-                config_preview.display_config()
-                
-                current_step = "port_mapping"
-            
-            elif current_step == "port_mapping":
-                nav_stack.save_step(current_step)
-                
-                # Display current service being configured if in compose mode
-                if config_type == "Docker Compose":
-                    console.print(f"Configuring service: [bold]{config_preview.current_service}[/bold]", 
-                                 style=THEME["info_style"])
-                
-                add_port = questionary.confirm(
-                    "Add port mapping?",
-                    style=questionary_style
-                ).ask()
-                
-                if add_port:
-                    container_port = questionary.text(
-                        "Container port:",
-                        style=questionary_style
-                    ).ask()
-                    
-                    host_port = questionary.text(
-                        "Host port (default: same as container port):",
-                        style=questionary_style
-                    ).ask()
-                    
-                    if container_port:
-                        if not host_port:
-                            host_port = container_port
-                        
-                        config_preview.add_port(container_port, host_port)
-                        config_preview.display_config()
-                        
-                        # Ask if user wants to add another port
-                        add_another = questionary.confirm(
-                            "Add another port mapping?",
-                            style=questionary_style
-                        ).ask()
-                        
-                        if add_another:
-                            continue  # Stay on this step
-                
-                current_step = "volume_mapping"
-            
-            elif current_step == "volume_mapping":
-                nav_stack.save_step(current_step)
-                
-                # Display current service being configured if in compose mode
-                if config_type == "Docker Compose":
-                    console.print(f"Configuring service: [bold]{config_preview.current_service}[/bold]", 
-                                 style=THEME["info_style"])
-                
-                add_volume = questionary.confirm(
-                    "Add volume mapping?",
-                    style=questionary_style
-                ).ask()
-                
-                if add_volume:
-                    host_path = questionary.text(
-                        "Host path:",
-                        style=questionary_style
-                    ).ask()
-                    
-                    container_path = questionary.text(
-                        "Container path:",
-                        style=questionary_style
-                    ).ask()
-                    
-                    if host_path and container_path:
-                        config_preview.add_volume(host_path, container_path)
-                        config_preview.display_config()
-                        
-                        # Ask if user wants to add another volume
-                        add_another = questionary.confirm(
-                            "Add another volume mapping?",
-                            style=questionary_style
-                        ).ask()
-                        
-                        if add_another:
-                            continue  # Stay on this step
-                
-                current_step = "environment_variables"
-            
-            elif current_step == "environment_variables":
-                nav_stack.save_step(current_step)
-                
-                # Display current service being configured if in compose mode
-                if config_type == "Docker Compose":
-                    console.print(f"Configuring service: [bold]{config_preview.current_service}[/bold]", 
-                                 style=THEME["info_style"])
-                
-                add_env = questionary.confirm(
-                    "Add environment variable?",
-                    style=questionary_style
-                ).ask()
-                
-                if add_env:
-                    env_key = questionary.text(
-                        "Environment variable key:",
-                        style=questionary_style
-                    ).ask()
-                    
-                    env_value = questionary.text(
-                        "Environment variable value:",
-                        style=questionary_style
-                    ).ask()
-                    
-                    if env_key:
-                        config_preview.add_environment_variable(env_key, env_value)
-                        config_preview.display_config()
-                        
-                        # Ask if user wants to add another environment variable
-                        add_another = questionary.confirm(
-                            "Add another environment variable?",
-                            style=questionary_style
-                        ).ask()
-                        
-                        if add_another:
-                            continue  # Stay on this step
-                
-                current_step = "command"
-            
-            elif current_step == "command":
-                nav_stack.save_step(current_step)
-                
-                # Display current service being configured if in compose mode
-                if config_type == "Docker Compose":
-                    console.print(f"Configuring service: [bold]{config_preview.current_service}[/bold]", 
-                                 style=THEME["info_style"])
-                
-                add_command = questionary.confirm(
-                    "Add command?",
+                    console.print(f"Failed to start containers: {stderr}", style=THEME["error_style"])
+                return None
+        
+        # Save the configuration to file
+        file_extension = ".dockerfile" if ctx.config_type == "Dockerfile" else ".yml"
+        filename = questionary.text(
+            f"Enter filename (will be saved with {file_extension} extension):",
+            style=questionary_style
+        ).ask()
+        
+        if not filename:
+            filename = "docker_config"
+        
+        if not filename.endswith(file_extension):
+            filename += file_extension
+        
+        try:
+            # Write the encoded config straight to the fd, bypassing the
+            # text-mode io stack
+            payload = ctx.config_preview.get_config_as_string().encode('utf-8')
+            fd = os.open(filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                while payload:
+                    written = os.write(fd, payload)
+                    payload = payload[written:]
+            finally:
+                os.close(fd)
+            console.print(f"Configuration saved to {filename}", style=THEME["success_style"])
+            
+            # If this is a Docker Compose file, ask if user wants to create the containers
+            if ctx.config_type == "Docker Compose":
+                create_containers = questionary.confirm(
+                    "Create containers from this configuration?",
                     style=questionary_style
                 ).ask()
                 
-                if add_command:
-                    command = questionary.text(
-                        "Command:",
-                        style=questionary_style
-                    ).ask()
-                    
-                    if command:
-                        config_preview.add_command(command)
-                        config_preview.display_config()
-                
-                # For Docker Compose with multiple services
-                if config_type == "Docker Compose" and len(service_names) > 1:
-                    # Ask if user wants to configure another service
-                    current_service_idx = service_names.index(config_preview.current_service)
-                    
-                    if current_service_idx < len(service_names) - 1:
-                        next_service = questionary.confirm(
-                            f"Configure next service ({service_names[current_service_idx + 1]})?",
-                            style=questionary_style
-                        ).ask()
-                        
-                        if next_service:
-                            config_preview.set_current_service(service_names[current_service_idx + 1])
-                            current_step = "base_image"
-                            continue
-                    
-                    # Option to go back to a previous service
-                    edit_service = questionary.confirm(
-                        "Edit a different service?",
-                        style=questionary_style
-                    ).ask()
-                    
-                    if edit_service:
-                        current_step = "select_service"
-                        continue
-                
-                current_step = "review"
+                if create_containers:
+                    [(returncode, stdout, stderr)] = run_commands_concurrently(
+                        [("docker-compose", ["-f", filename, "up", "-d"])],
+                        "Starting containers..."
+                    )
+                    if returncode == 0:
+                        console.print("Containers started", style=THEME["success_style"])
+                    else:
+                        console.print(f"Failed to start containers: {stderr}", style=THEME["error_style"])
             
-            elif current_step == "review":
-                nav_stack.save_step(current_step)
-                
-                # Final review of the configuration
-                console.print("[bold]Configuration Review:[/bold]", style=THEME["title_style"])
-                config_preview.display_config()
-                
-                # Ask what to do with the configuration
-                choices = [
-                    "Save Configuration",
-                    "Start Over",
-                    "Go Back to Edit",
-                    "Exit Without Saving"
-                ]
-                
-                action = questionary.select(
-                    "What would you like to do?",
-                    choices=choices,
+            elif ctx.config_type == "Dockerfile" and ctx.container_name:
+                build_image = questionary.confirm(
+                    "Build Docker image from this Dockerfile?",
                     style=questionary_style
                 ).ask()
                 
-                if action == "Save Configuration":
-                    # Save the configuration to file
-                    file_extension = ".dockerfile" if config_type == "Dockerfile" else ".yml"
-                    filename = questionary.text(
-                        f"Enter filename (will be saved with {file_extension} extension):",
+                if build_image:
+                    image_tag = questionary.text(
+                        "Enter image tag/name:",
                         style=questionary_style
                     ).ask()
                     
-                    if not filename:
-                        filename = "docker_config"
-                    
-                    if not filename.endswith(file_extension):
-                        filename += file_extension
-                    
-                    try:
-                        with open(filename, 'w') as f:
-                            f.write(config_preview.get_config_as_string())
-                        console.print(f"Configuration saved to {filename}", style=THEME["success_style"])
-                        
-                        # If this is a Docker Compose file, ask if user wants to create the containers
-                        if config_type == "Docker Compose":
-                            create_containers = questionary.confirm(
-                                "Create containers from this configuration?",
-                                style=questionary_style
-                            ).ask()
-                            
-                            if create_containers:
-                                run_command_with_spinner(f"docker-compose -f {filename} up -d", 
-                                                        "Starting containers...")
-                        
-                        elif config_type == "Dockerfile" and container_name:
-                            build_image = questionary.confirm(
-                                "Build Docker image from this Dockerfile?",
-                                style=questionary_style
-                            ).ask()
-                            
-                            if build_image:
-                                image_tag = questionary.text(
-                                    "Enter image tag/name:",
-                                    style=questionary_style
-                                ).ask()
-                                
-                                if not image_tag:
-                                    image_tag = container_name
-                                
-                                run_command_with_spinner(f"docker build -t {image_tag} -f {filename} .", 
-                                                        "Building Docker image...")
-                    except Exception as e:
-                        console.print(f"Error saving configuration: {str(e)}", style=THEME["error_style"])
-                    
-                    return
-                
-                elif action == "Start Over":
-                    console.print("Starting over...", style=THEME["warning_style"])
-                    config_preview = None
-                    config_type = None
-                    container_name = ""
-                    service_names = []
-                    nav_stack = NavigationStack()  # Reset navigation
-                    current_step = "config_type"
-                
-                elif action == "Go Back to Edit":
-                    # Jump back to a previous step
-                    edit_choices = ["Container/Service Type", "Base Image", "Port Mapping", 
-                                   "Volume Mapping", "Environment Variables", "Command"]
+                    if not image_tag:
+                        image_tag = ctx.container_name
                     
-                    if config_type == "Docker Compose":
-                        edit_choices.insert(1, "Service Setup")
-                    elif config_type == "Dockerfile":
-                        edit_choices.insert(1, "Container Name")
+                    commands = [("docker", ["build", "-t", image_tag, "-f", filename, "."])]
                     
-                    edit_step = questionary.select(
-                        "Which part would you like to edit?",
-                        choices=edit_choices + ["Cancel"],
-                        style=questionary_style
-                    ).ask()
+                    # Pull the base image alongside the build so its layers
+                    # download while the build context is being sent
+                    base_image = ctx.config_preview.base_image
+                    if base_image:
+                        commands.append(("docker", ["pull", base_image]))
                     
-                    if edit_step == "Cancel":
-                        current_step = "review"  # Stay on review
-                    elif edit_step == "Container/Service Type":
-                        current_step = "config_type"
-                    elif edit_step == "Container Name":
-                        current_step = "container_name"
-                    elif edit_step == "Service Setup":
-                        current_step = "service_setup"
-                    elif edit_step == "Base Image":
-                        current_step = "base_image"
-                    elif edit_step == "Port Mapping":
-                        current_step = "port_mapping"
-                    elif edit_step == "Volume Mapping":
-                        current_step = "volume_mapping"
-                    elif edit_step == "Environment Variables":
-                        current_step = "environment_variables"
-                    elif edit_step == "Command":
-                        current_step = "command"
-                
-                else:  # Exit Without Saving
-                    console.print("Exiting wizard without saving.", style=THEME["warning_style"])
-                    return
+                    (returncode, stdout, stderr), *pull_result = run_commands_concurrently(
+                        commands, "Building Docker image..."
+                    )
+                    # A failed pull is often why the build failed, so report it first
+                    if pull_result and pull_result[0][0] != 0:
+                        console.print(f"Failed to pull base image {base_image}: {pull_result[0][2]}",
+                                      style=THEME["warning_style"])
+                    if returncode == 0:
+                        console.print(f"Image {image_tag} built", style=THEME["success_style"])
+                    else:
+                        console.print(f"Failed to build image: {stderr}", style=THEME["error_style"])
+        except Exception as e:
+            console.print(f"Error saving configuration: {str(e)}", style=THEME["error_style"])
+        
+        return None
+    
+    elif action == "Start Over":
+        console.print("Starting over...", style=THEME["warning_style"])
+        # Keep the preview and containers for reuse; the config_type step
+        # resets the preview
+        ctx.config_type = None
+        ctx.container_name = ""
+        ctx.service_names.clear()
+        ctx.service_index.clear()
+        ctx.nav_stack.clear()  # Reset navigation
+        return "config_type"
+    
+    elif action == "Go Back to Edit":
+        # Jump back to a previous step
+        edit_choices = ["Container/Service Type", "Base Image", "Port Mapping", 
+                       "Volume Mapping", "Environment Variables", "Command"]
+        
+        if ctx.config_type == "Docker Compose":
+            edit_choices.insert(1, "Service Setup")
+        elif ctx.config_type == "Dockerfile":
+            edit_choices.insert(1, "Container Name")
+        
+        edit_step = questionary.select(
+            "Which part would you like to edit?",
+            choices=edit_choices + ["Cancel"],
+            style=questionary_style
+        ).ask()
+        
+        # Cancel (or an unknown choice) stays on review
+        return EDIT_STEP_MAP.get(edit_step, "review")
+    
+    # Exit Without Saving
+    console.print("Exiting wizard without saving.", style=THEME["warning_style"])
+    return None
+
+# Wizard step name -> handler returning the next step name
+STEP_HANDLERS = {
+    "config_type": _step_config_type,
+    "container_name": _step_container_name,
+    "service_setup": _step_service_setup,
+    "select_service": _step_select_service,
+    "base_image": _step_base_image,
+    "port_mapping": _step_port_mapping,
+    "volume_mapping": _step_volume_mapping,
+    "environment_variables": _step_environment_variables,
+    "command": _step_command,
+    "review": _step_review,
+}
+
+def _warm_wizard_imports():
+    """Load the prompt and highlighting modules the wizard needs later on"""
+    try:
+        import questionary  # noqa: F401
+        from rich.syntax import Syntax
+        from pygments.lexers import get_lexer_by_name
+        
+        # Syntax resolves its theme and lexer on first render
+        Syntax.get_theme("ansi_dark")
+        for preview_class in (DockerfilePreview, ComposePreview):
+            get_lexer_by_name(preview_class.syntax_name)
+    except Exception:
+        # Only a warm-up; the real imports happen again where they are used
+        pass
+
+def create_container_wizard():
+    """Interactive wizard for creating Docker container or compose setup"""
+    # Import the preview machinery while the user reads the first prompt,
+    # so the first preview redraw doesn't stall
+    _get_executor().submit(_warm_wizard_imports)
+    console.print("[bold]Container Creation Wizard[/bold]", style=THEME["title_style"])
+    
+    # Configuration state and the NavigationStack shared by all steps
+    ctx = WizardContext()
+    current_step = "config_type"
+    
+    while current_step:
+        try:
+            current_step = STEP_HANDLERS[current_step](ctx)
         
         except KeyboardInterrupt:
             console.print("\nOperation canceled by user", style=THEME["warning_style"])
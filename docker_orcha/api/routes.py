@@ -4,21 +4,128 @@ API routes for the Docker Orchestration System.
 This module provides the REST API endpoints for managing Docker containers and tasks.
 """
 
-from flask import Flask, request, jsonify
-from typing import Dict, Any, Optional
+import codecs
+import dataclasses
+import threading
+import time
+from flask import Flask, Response, request, jsonify, stream_with_context
+from flask.json.provider import DefaultJSONProvider
+from typing import Dict, Any, List, Optional
 
 from docker_orcha.models.enums import TaskState, Priority
 from docker_orcha.models.resources import ResourceRequirements
 from docker_orcha.core.docker_manager import DockerManager
 from docker_orcha.core.scheduler import JobScheduler
+from docker_orcha.utils.json_utils import dumps as json_dumps, loads as json_loads
 
 
 app = Flask(__name__)
+# Seconds a /api/system/status snapshot is shared between pollers
+app.config.setdefault('STATUS_TTL', 0.5)
+# Log streams (?follow=1) served at once; see get_logs
+app.config.setdefault('MAX_LOG_FOLLOWERS', 4)
+
+
+class JSONProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by json_utils, so orjson is used when installed."""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return json_dumps(obj).decode()
+
+    def loads(self, s, **kwargs: Any) -> Any:
+        return json_loads(s)
+
+
+# Make jsonify() and request.get_json() encode like _dump_json
+app.json = JSONProvider(app)
+
+
+def _dump_json(obj: Any) -> bytes:
+    """Serialize obj to a JSON response body."""
+    return json_dumps(obj)
+
+
+def _project_fields(items: List[Dict[str, Any]], fields: Optional[str]) -> List[Dict[str, Any]]:
+    """
+    Keep only the requested fields of each item.
+    
+    Args:
+        items: List of dictionaries to project
+        fields: Comma-separated field names; dotted names select nested keys
+            (e.g. "resources.memory"). None or empty keeps everything.
+    """
+    if not fields:
+        return items
+    
+    paths = [field.split('.') for field in fields.split(',') if field]
+    
+    def project(item):
+        result = {}
+        for path in paths:
+            source, target = item, result
+            for key in path[:-1]:
+                source = source.get(key) if isinstance(source, dict) else None
+                if source is None:
+                    break
+                target = target.setdefault(key, {})
+            else:
+                if isinstance(source, dict) and path[-1] in source:
+                    target[path[-1]] = source[path[-1]]
+        return result
+    
+    return [project(item) for item in items]
+
+
+def _json_response(obj: Any, status: int = 200) -> Response:
+    """Build a JSON response, skipping jsonify's intermediate str."""
+    return Response(_dump_json(obj), status=status, mimetype='application/json')
+
+@app.after_request
+def _add_etag(response: Response) -> Response:
+    """
+    Tag JSON GET responses with an ETag and honour If-None-Match.
+    
+    Pollers that send back the ETag get an empty 304 while the data is
+    unchanged. Streamed responses (logs) are left alone.
+    """
+    if (request.method == 'GET' and response.status_code == 200
+            and response.is_json and not response.is_streamed):
+        response.add_etag()
+        response.make_conditional(request)
+    return response
+
 
 # Global instances
 docker_manager = None
 job_scheduler = None
 
+# Last serialized /api/system/status body and when it was computed
+_STATUS_CACHE = {"t": 0.0, "payload": None}
+_STATUS_LOCK = threading.Lock()
+
+# Upper bound on the ?tail= line count accepted by the logs endpoint
+MAX_LOG_TAIL = 10000
+
+# Log streams currently being followed
+_FOLLOWERS = {"count": 0}
+_FOLLOWERS_LOCK = threading.Lock()
+
+# Upper bound on the number of endpoints in one /api/_batch request
+MAX_BATCH_GETS = 32
+
+# Fields a POST /api/tasks body must contain
+_CREATE_TASK_REQUIRED = frozenset({'name', 'priority'})
+
+# Resources for tasks created without a 'resources' block. Tasks only ever
+# rebind their resources, never mutate them, so this instance is shared.
+DEFAULT_RESOURCES = ResourceRequirements(cpu_shares=1024, memory='1g', memory_swap='2g')
+_RESOURCE_FIELDS = frozenset(f.name for f in dataclasses.fields(ResourceRequirements))
+
+
+def _resource_fields(resources_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Pick the ResourceRequirements fields out of a request's resources block."""
+    return {k: resources_data[k] for k in resources_data.keys() & _RESOURCE_FIELDS}
+
 
 def initialize(state_dir: str = "./container_states"):
     """Initialize the API with Docker manager and job scheduler."""
@@ -26,6 +133,19 @@ def initialize(state_dir: str = "./container_states"):
     
     docker_manager = DockerManager(state_dir=state_dir)
     job_scheduler = JobScheduler(docker_manager=docker_manager)
+
+
+def _require_task(task_id: str):
+    """
+    Look up a task for a route handler.
+    
+    Returns:
+        (task, None) if the task exists, otherwise (None, 404 error response)
+    """
+    task = docker_manager.tasks.get(task_id)
+    if task is None:
+        return None, (jsonify({'error': 'Task not found'}), 404)
+    return task, None
     
 
 @app.route('/api/tasks', methods=['GET'])
@@ -33,28 +153,31 @@ def get_tasks():
     """Get list of tasks, optionally filtered by status."""
     status_filter = request.args.get('status')
     
-    # Convert string status to TaskState enum if provided
-    task_state_filter = None
-    if status_filter:
-        try:
-            task_state_filter = TaskState(status_filter)
-        except ValueError:
-            return jsonify({'error': f"Invalid status: {status_filter}"}), 400
+    fields = request.args.get('fields')
+    
+    # Unfiltered listing is the common case
+    if not status_filter:
+        return _json_response(_project_fields(docker_manager.list_tasks(), fields))
+    
+    # Convert string status to TaskState enum
+    try:
+        task_state_filter = TaskState(status_filter)
+    except ValueError:
+        return jsonify({'error': f"Invalid status: {status_filter}"}), 400
     
     tasks = docker_manager.list_tasks(status_filter=task_state_filter)
-    return jsonify(tasks)
+    return _json_response(_project_fields(tasks, fields))
 
 
 @app.route('/api/tasks', methods=['POST'])
 def create_task():
     """Create a new task."""
-    data = request.json
+    data = request.get_json(silent=True)
     
-    # Validate required fields
-    required_fields = ['name', 'priority']
-    for field in required_fields:
-        if field not in data:
-            return jsonify({'error': f"Missing required field: {field}"}), 400
+    # Validate required fields; a body that isn't a JSON object has none
+    missing = _CREATE_TASK_REQUIRED - data.keys() if isinstance(data, dict) else _CREATE_TASK_REQUIRED
+    if missing:
+        return jsonify({'error': f"Missing required fields: {', '.join(sorted(missing))}"}), 400
     
     # Convert priority string to enum
     try:
@@ -62,13 +185,12 @@ def create_task():
     except ValueError:
         return jsonify({'error': f"Invalid priority: {data['priority']}"}), 400
     
-    # Parse resource requirements
-    resources_data = data.get('resources', {})
-    resources = ResourceRequirements(
-        cpu_shares=resources_data.get('cpu_shares', 1024),
-        memory=resources_data.get('memory', '1g'),
-        memory_swap=resources_data.get('memory_swap', '2g')
-    )
+    # Parse resource requirements, sharing the defaults when none are given
+    resources_data = data.get('resources')
+    if resources_data:
+        resources = dataclasses.replace(DEFAULT_RESOURCES, **_resource_fields(resources_data))
+    else:
+        resources = DEFAULT_RESOURCES
     
     # Create the task
     task_id = docker_manager.create_task(
@@ -81,15 +203,20 @@ def create_task():
         compose_path=data.get('compose_path')
     )
     
+    # Optionally start the task in the same request
+    if data.get('start_immediately'):
+        started = docker_manager.start_task(task_id)
+        return jsonify({'task_id': task_id, 'started': bool(started)})
+    
     return jsonify({'task_id': task_id})
 
 
 @app.route('/api/tasks/<task_id>', methods=['GET'])
 def get_task(task_id):
     """Get task details by ID."""
-    task = docker_manager.tasks.get(task_id)
-    if not task:
-        return jsonify({'error': 'Task not found'}), 404
+    task, error = _require_task(task_id)
+    if error:
+        return error
     
     return jsonify(task.to_dict())
 
@@ -97,19 +224,14 @@ def get_task(task_id):
 @app.route('/api/tasks/<task_id>', methods=['PUT'])
 def update_task(task_id):
     """Update task resources."""
-    data = request.json
-    task = docker_manager.tasks.get(task_id)
-    if not task:
-        return jsonify({'error': 'Task not found'}), 404
+    data = request.get_json(silent=True) or {}
+    task, error = _require_task(task_id)
+    if error:
+        return error
     
     # Update resources if provided
     if 'resources' in data:
-        resources_data = data['resources']
-        resources = ResourceRequirements(
-            cpu_shares=resources_data.get('cpu_shares', task.resources.cpu_shares),
-            memory=resources_data.get('memory', task.resources.memory),
-            memory_swap=resources_data.get('memory_swap', task.resources.memory_swap)
-        )
+        resources = dataclasses.replace(task.resources, **_resource_fields(data['resources']))
         
         result = docker_manager.update_task_resources(task_id, resources)
         if not result:
@@ -121,9 +243,9 @@ def update_task(task_id):
 @app.route('/api/tasks/<task_id>', methods=['DELETE'])
 def delete_task(task_id):
     """Delete a task."""
-    task = docker_manager.tasks.get(task_id)
-    if not task:
-        return jsonify({'error': 'Task not found'}), 404
+    task, error = _require_task(task_id)
+    if error:
+        return error
     
     result = docker_manager.delete_task(task_id)
     if not result:
@@ -135,9 +257,9 @@ def delete_task(task_id):
 @app.route('/api/tasks/<task_id>/start', methods=['POST'])
 def start_task(task_id):
     """Start a task."""
-    task = docker_manager.tasks.get(task_id)
-    if not task:
-        return jsonify({'error': 'Task not found'}), 404
+    task, error = _require_task(task_id)
+    if error:
+        return error
     
     result = docker_manager.start_task(task_id)
     if not result:
@@ -149,12 +271,12 @@ def start_task(task_id):
 @app.route('/api/tasks/<task_id>/stop', methods=['POST'])
 def stop_task(task_id):
     """Stop a task."""
-    data = request.json or {}
+    data = request.get_json(silent=True) or {}
     checkpoint = data.get('checkpoint', True)
     
-    task = docker_manager.tasks.get(task_id)
-    if not task:
-        return jsonify({'error': 'Task not found'}), 404
+    task, error = _require_task(task_id)
+    if error:
+        return error
     
     result = docker_manager.stop_task(task_id, checkpoint=checkpoint)
     if not result:
@@ -163,12 +285,31 @@ def stop_task(task_id):
     return jsonify({'result': 'success'})
 
 
+@app.route('/api/tasks/<task_id>/restart', methods=['POST'])
+def restart_task(task_id):
+    """Restart a task: stop it, then start it again."""
+    data = request.get_json(silent=True) or {}
+    checkpoint = data.get('checkpoint', True)
+    
+    task, error = _require_task(task_id)
+    if error:
+        return error
+    
+    if not docker_manager.stop_task(task_id, checkpoint=checkpoint):
+        return jsonify({'error': 'Failed to stop task'}), 500
+    
+    if not docker_manager.start_task(task_id):
+        return jsonify({'error': 'Failed to start task'}), 500
+    
+    return jsonify({'result': 'success'})
+
+
 @app.route('/api/tasks/<task_id>/resume', methods=['POST'])
 def resume_task(task_id):
     """Resume a paused task."""
-    task = docker_manager.tasks.get(task_id)
-    if not task:
-        return jsonify({'error': 'Task not found'}), 404
+    task, error = _require_task(task_id)
+    if error:
+        return error
     
     result = docker_manager.resume_task(task_id)
     if not result:
@@ -181,15 +322,61 @@ def resume_task(task_id):
 def list_containers():
     """List all containers."""
     containers = docker_manager.list_containers()
-    return jsonify(containers)
+    return _json_response(_project_fields(containers, request.args.get('fields')))
 
 
 @app.route('/api/containers/<container_id>/logs', methods=['GET'])
 def get_logs(container_id):
-    """Get container logs."""
-    tail = request.args.get('tail', 100, type=int)
-    logs = docker_manager.get_container_logs(container_id, tail=tail)
-    return jsonify({'logs': logs})
+    """
+    Get container logs.
+    
+    With ?follow=1 the raw log output is streamed as it is produced. Each
+    stream holds a server thread until the container stops, or until it
+    writes again after the client went away, so at most MAX_LOG_FOLLOWERS
+    run at once; further followers get a 503 and can poll instead.
+    """
+    tail = min(request.args.get('tail', 100, type=int), MAX_LOG_TAIL)
+    follow = request.args.get('follow', 0, type=int) == 1
+    since = request.args.get('since', type=float)
+    
+    if follow:
+        with _FOLLOWERS_LOCK:
+            if _FOLLOWERS["count"] >= app.config['MAX_LOG_FOLLOWERS']:
+                return jsonify({'error': 'Too many log streams being followed'}), 503
+            _FOLLOWERS["count"] += 1
+        
+        try:
+            chunks = docker_manager.get_container_logs_iter(container_id, tail=tail, follow=True, since=since)
+            response = Response(stream_with_context(chunks), mimetype='text/plain')
+        except BaseException:
+            _release_follower()
+            raise
+        response.call_on_close(_release_follower)
+        return response
+    
+    chunks = docker_manager.get_container_logs_iter(container_id, tail=tail, follow=False, since=since)
+    
+    def generate():
+        # Emit {"logs": "..."} with the string body escaped chunk by chunk,
+        # so logs flow to the client without being collected in memory
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        yield b'{"logs": "'
+        for chunk in chunks:
+            text = decoder.decode(chunk)
+            if text:
+                yield _dump_json(text)[1:-1]
+        text = decoder.decode(b'', final=True)
+        if text:
+            yield _dump_json(text)[1:-1]
+        yield b'"}'
+    
+    return Response(stream_with_context(generate()), mimetype='application/json')
+
+
+def _release_follower():
+    """Free the log stream slot taken by get_logs."""
+    with _FOLLOWERS_LOCK:
+        _FOLLOWERS["count"] -= 1
 
 
 @app.route('/api/containers/<container_id>/health', methods=['GET'])
@@ -212,24 +399,33 @@ def rebalance_resources():
 @app.route('/api/system/status', methods=['GET'])
 def system_status():
     """Get system status."""
-    # Calculate total running, pending, etc.
-    running = len([t for t in docker_manager.tasks.values() if t.state == TaskState.RUNNING])
-    pending = len([t for t in docker_manager.tasks.values() if t.state == TaskState.PENDING])
-    paused = len([t for t in docker_manager.tasks.values() if t.state == TaskState.PAUSED])
-    completed = len([t for t in docker_manager.tasks.values() if t.state == TaskState.COMPLETED])
-    failed = len([t for t in docker_manager.tasks.values() if t.state == TaskState.FAILED])
+    with _STATUS_LOCK:
+        body = _STATUS_CACHE["payload"]
+        if body is None or time.monotonic() - _STATUS_CACHE["t"] >= app.config['STATUS_TTL']:
+            # Cache the serialized body so cache hits skip encoding too
+            body = _dump_json(_build_system_status())
+            _STATUS_CACHE["payload"] = body
+            _STATUS_CACHE["t"] = time.monotonic()
+    
+    return Response(body, mimetype='application/json')
+
+
+def _build_system_status() -> Dict[str, Any]:
+    """Build the system status payload."""
+    # Per-state counts are maintained by the manager, no scan needed
+    counts = docker_manager.get_task_state_counts()
     
     # Get available resources
     available_resources = docker_manager._get_available_resources()
     
-    return jsonify({
+    return {
         'tasks': {
-            'total': len(docker_manager.tasks),
-            'running': running,
-            'pending': pending,
-            'paused': paused, 
-            'completed': completed,
-            'failed': failed
+            'total': sum(counts.values()),
+            'running': counts.get(TaskState.RUNNING, 0),
+            'pending': counts.get(TaskState.PENDING, 0),
+            'paused': counts.get(TaskState.PAUSED, 0),
+            'completed': counts.get(TaskState.COMPLETED, 0),
+            'failed': counts.get(TaskState.FAILED, 0)
         },
         'resources': {
             'cpu': available_resources['cpu'],
@@ -237,7 +433,7 @@ def system_status():
             'memory_swap': available_resources['memory_swap']
         },
         'scheduler_running': job_scheduler.running if job_scheduler else False
-    })
+    }
 
 
 @app.route('/api/scheduler/start', methods=['POST'])
@@ -251,4 +447,40 @@ def start_scheduler():
 def stop_scheduler():
     """Stop the scheduler."""
     result = job_scheduler.stop()
-    return jsonify({'result': 'success' if result else 'already stopped'}) 
\ No newline at end of file
+    return jsonify({'result': 'success' if result else 'already stopped'})
+
+
+@app.route('/api/_batch', methods=['POST'])
+def batch_get():
+    """
+    Run several GET requests in one round trip.
+    
+    The body is {"gets": ["system/status", "tasks?fields=id,name", ...]}, with
+    endpoints relative to /api. The response maps each endpoint to
+    {"status": <code>, "body": <its JSON response>}.
+    """
+    data = request.get_json(silent=True)
+    endpoints = data.get('gets') if isinstance(data, dict) else None
+    if not isinstance(endpoints, list) or not all(isinstance(e, str) for e in endpoints):
+        return jsonify({'error': "'gets' must be a list of endpoints"}), 400
+    if len(endpoints) > MAX_BATCH_GETS:
+        return jsonify({'error': f"At most {MAX_BATCH_GETS} endpoints per batch"}), 400
+    
+    # Sub-responses are already serialized, so splice their bodies into the
+    # batch body instead of decoding and re-encoding them
+    parts = []
+    for endpoint in dict.fromkeys(endpoints):
+        with app.test_request_context(f"/api/{endpoint.lstrip('/')}", method='GET'):
+            response = app.full_dispatch_request()
+            if response.is_json:
+                status, body = response.status_code, response.get_data()
+            else:
+                # Errors from Flask itself are HTML, and followed logs are
+                # an endless text stream that can't be batched
+                status = response.status_code if response.status_code >= 400 else 400
+                body = _dump_json({'error': f"Not a JSON endpoint ({response.status})"})
+            response.close()
+        
+        parts.append(b'%s: {"status": %d, "body": %s}' % (_dump_json(endpoint), status, body))
+    
+    return Response(b'{"results": {' + b', '.join(parts) + b'}}', mimetype='application/json')
\ No newline at end of file
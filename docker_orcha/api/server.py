@@ -8,6 +8,8 @@ import os
 import logging
 from docker_orcha.api.routes import app, initialize
 
+logger = logging.getLogger('docker_orchestrator.api')
+
 
 def start_api_server(host: str = '0.0.0.0', port: int = 5000, debug: bool = False, state_dir: str = None):
     """
@@ -23,11 +25,37 @@ def start_api_server(host: str = '0.0.0.0', port: int = 5000, debug: bool = Fals
     if state_dir is None:
         state_dir = os.environ.get('DOCKER_ORCHESTRATOR_STATE_DIR', './container_states')
     
+    if debug and os.environ.get('WERKZEUG_RUN_MAIN') != 'true':
+        # The reloader's parent process only watches files and respawns the
+        # server, so leave initialization to the child it starts
+        app.run(host=host, port=port, debug=True, use_reloader=True)
+        return
+    
     # Initialize the API
     initialize(state_dir=state_dir)
     
-    # Start the Flask app
-    app.run(host=host, port=port, debug=debug)
+    if debug:
+        # Werkzeug's development server, running in the reloader's child
+        app.run(host=host, port=port, debug=True, use_reloader=True)
+        return
+    
+    try:
+        from waitress import serve
+    except ImportError:
+        logger.warning("waitress is not installed, falling back to the Flask development server")
+        app.run(host=host, port=port, debug=False, threaded=True)
+        return
+    
+    # Docker calls block for tens of milliseconds, so use plenty of threads
+    default_threads = max(8, (os.cpu_count() or 1) * 4)
+    threads = int(os.environ.get('DOCKER_ORCHESTRATOR_THREADS', default_threads))
+    # Followed log streams each hold a thread for as long as they run, so
+    # keep them to a quarter of the pool and leave the rest for other requests
+    app.config['MAX_LOG_FOLLOWERS'] = int(os.environ.get('DOCKER_ORCHESTRATOR_MAX_LOG_FOLLOWERS',
+                                                         max(1, threads // 4)))
+    logger.info(f"Serving API on {host}:{port} with waitress ({threads} threads, "
+                f"up to {app.config['MAX_LOG_FOLLOWERS']} followed log streams)")
+    serve(app, host=host, port=port, threads=threads)
 
 
 if __name__ == '__main__':
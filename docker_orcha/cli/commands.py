@@ -7,28 +7,34 @@ This module provides the command-line interface commands for managing Docker con
 import os
 import time
 import sys
-import requests
+import atexit
+import functools
 import typer
-from typing import List, Dict, Optional, Any
+from urllib.parse import parse_qsl
+from typing import List, Dict, Optional, Any, Tuple, Iterable, Iterator
 from rich.console import Console
+from rich.text import Text
 from rich.table import Table
-from rich.panel import Panel
-from rich.markdown import Markdown
-from rich.syntax import Syntax
-from rich.prompt import Prompt, Confirm
+
+# requests, rich.syntax and rich.prompt are imported where they are used, so
+# commands that never reach the API (e.g. version, --help) start faster
 
 from docker_orcha.models.enums import Priority, TaskState
 from docker_orcha.utils.formatting import format_time, bytes_to_human, format_duration
+from docker_orcha.utils.json_utils import dumps as _json_dumps, loads as _json_loads
+
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
 
 
 # API URL
 API_URL = "http://localhost:5000/api"
 
 # Initialize Typer app with command groups
-app = typer.Typer(help="Modern Docker Orchestration CLI", add_completion=True)
-container_app = typer.Typer(help="Container management commands")
-task_app = typer.Typer(help="Task management commands")
-system_app = typer.Typer(help="System management commands")
+app = typer.Typer(help="Modern Docker Orchestration CLI", add_completion=True, no_args_is_help=True)
+container_app = typer.Typer(help="Container management commands", no_args_is_help=True)
+task_app = typer.Typer(help="Task management commands", no_args_is_help=True)
+system_app = typer.Typer(help="System management commands", no_args_is_help=True)
 app.add_typer(container_app, name="container")
 app.add_typer(task_app, name="task")
 app.add_typer(system_app, name="system")
@@ -36,54 +42,379 @@ app.add_typer(system_app, name="system")
 # Initialize Rich console
 console = Console()
 
+# Pre-parsed messages for the hot and error paths, so Rich doesn't
+# re-tokenize their markup on every print
+_ERROR_PREFIX = Text.from_markup("[bold red]Error:[/bold red] ")
+_MSG_NO_CONTAINERS = Text.from_markup("[yellow]No containers found[/yellow]")
+_MSG_NO_TASKS = Text.from_markup("[yellow]No tasks found[/yellow]")
+_MSG_FOLLOWING_LOGS = Text.from_markup("[yellow]Following logs. Press Ctrl+C to stop.[/yellow]")
+_MSG_STOPPED_FOLLOWING = Text.from_markup("[yellow]Stopped following logs[/yellow]")
+_MSG_RECONNECTING = Text.from_markup("[yellow]Log stream interrupted, reconnecting...[/yellow]")
+_MSG_INVALID_INDEX = Text.from_markup("[bold red]Invalid index[/bold red]")
+_MSG_INVALID_INPUT = Text.from_markup("[bold red]Invalid input[/bold red]")
+
+
+def print_error(detail: str, prefix: Text = _ERROR_PREFIX) -> None:
+    """Print an error message after a cached styled prefix; detail is printed verbatim."""
+    message = prefix.copy()
+    message.append(detail)
+    console.print(message)
+
+
+@functools.lru_cache(maxsize=None)
+def get_session():
+    """
+    Get the shared HTTP session, creating it on first use.
+    
+    The session reuses pooled keep-alive connections across API calls.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    
+    # Connection failures are retried for every method (the request never
+    # reached the server); read errors and 5xx responses only for idempotent ones
+    retry = Retry(
+        total=3,
+        connect=3,
+        read=3,
+        backoff_factor=0.3,
+        status_forcelist=(500, 502, 503, 504),
+        allowed_methods=frozenset({"GET", "PUT", "DELETE"}),
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry)
+    
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    atexit.register(session.close)
+    return session
+
+
+# (connect, read) timeouts for API requests
+API_TIMEOUT = (3.05, 30)
+
+
+class _APIFailure(dict):
+    """Empty, falsy api_request result for a request that failed after retries"""
+
+
+# Returned by api_request when the request failed and the error was already
+# printed, so callers can tell a failure apart from an empty result
+API_FAILED = _APIFailure()
+
+# Recent GET responses by _cache_key(), as (time.monotonic() when fetched, response)
+_GET_CACHE: Dict[Tuple[str, Tuple], Tuple[float, Any]] = {}
+# Long enough to span a pick-then-act flow in interactive mode; every
+# non-GET request clears the cache, and polling loops pass no_cache
+_CACHE_TTL = float(os.environ.get('DOCKER_ORCHESTRATOR_CACHE_TTL', 3.0))
 
-def api_request(endpoint: str, method: str = "GET", data: Dict = None) -> Dict:
+
+# Last ETag and body for each GET response that had one, by _cache_key().
+# Unlike _GET_CACHE entries these never go stale: the server answers 304
+# only while the body is unchanged.
+_ETAGS: Dict[Tuple[str, Tuple], Tuple[str, Any]] = {}
+
+
+def _cache_key(url: str, params: Optional[Dict[str, Any]] = None) -> Tuple[str, Tuple]:
+    """
+    Key a GET request for _GET_CACHE.
+    
+    Query parameters are sorted, whether they were given in the URL or in
+    params, so equivalent requests share a cache entry.
+    """
+    base, _, query = url.partition("?")
+    items = parse_qsl(query)
+    if params:
+        items.extend((key, str(value)) for key, value in params.items() if value is not None)
+    return base, tuple(sorted(items))
+
+
+# Verbs the API serves; Session.request dispatches on the name itself
+_HTTP_METHODS = frozenset(("GET", "POST", "PUT", "DELETE"))
+
+
+def api_request(
+    endpoint: str,
+    method: str = "GET",
+    data: Dict = None,
+    params: Optional[Dict[str, Any]] = None,
+    no_cache: bool = False,
+    quiet: bool = False
+) -> Dict:
     """
     Make a request to the API.
     
+    Successful GET responses are reused for _CACHE_TTL seconds; any other
+    method clears the cache since it may have changed server state. After
+    that, GETs are sent with the response's ETag and a 304 reuses its body.
+    
     Args:
         endpoint: API endpoint
         method: HTTP method
         data: Request data
+        params: Query parameters; None values are left out
+        no_cache: Always fetch a fresh GET response
+        quiet: Don't print errors, e.g. for requests made in the background
         
     Returns:
-        Dict: API response
+        Dict: API response, or API_FAILED if the request failed
     """
     url = f"{API_URL}/{endpoint.lstrip('/')}"
+    method = method.upper()
+    if method not in _HTTP_METHODS:
+        print_error(f"Unsupported HTTP method: {method}")
+        return API_FAILED
     
+    headers = _JSON_HEADERS
+    tagged = None
+    if method == "GET":
+        key = _cache_key(url, params)
+        cached = _GET_CACHE.get(key)
+        if not no_cache and cached and time.monotonic() - cached[0] < _CACHE_TTL:
+            return cached[1]
+        
+        tagged = _ETAGS.get(key)
+        if tagged:
+            headers = {**_JSON_HEADERS, "If-None-Match": tagged[0]}
+    else:
+        _GET_CACHE.clear()
+    
+    import requests
     try:
-        if method == "GET":
-            response = requests.get(url)
-        elif method == "POST":
-            response = requests.post(url, json=data)
-        elif method == "PUT":
-            response = requests.put(url, json=data)
-        elif method == "DELETE":
-            response = requests.delete(url)
-        else:
-            console.print(f"[bold red]Error:[/bold red] Unsupported HTTP method: {method}")
-            return {}
+        response = get_session().request(
+            method,
+            url,
+            params=params,
+            data=_json_dumps(data) if data is not None and method in ("POST", "PUT") else None,
+            headers=headers,
+            timeout=API_TIMEOUT
+        )
+        
+        if response.status_code == 304 and tagged:
+            # Unchanged since the tagged response
+            _GET_CACHE[key] = (time.monotonic(), tagged[1])
+            return tagged[1]
         
         if response.status_code >= 400:
-            console.print(f"[bold red]Error ({response.status_code}):[/bold red] {response.text}")
-            return {}
+            if not quiet:
+                print_error(response.text, prefix=Text(f"Error ({response.status_code}): ", style="bold red"))
+            return API_FAILED
+        
+        result = _json_loads(response.content)
+        if method == "GET":
+            _GET_CACHE[key] = (time.monotonic(), result)
+            etag = response.headers.get("ETag")
+            if etag:
+                _ETAGS[key] = (etag, result)
+        return result
+    except requests.RequestException as e:
+        # Transient failures have already been retried by the session adapter
+        if not quiet:
+            print_error(str(e))
+        return API_FAILED
+    except ValueError as e:
+        if not quiet:
+            print_error(f"Invalid response from API server: {str(e)}")
+        return API_FAILED
+
+
+def api_batch(endpoints: List[str], quiet: bool = False) -> List[Any]:
+    """
+    Make several GET requests to the API in one round trip.
+    
+    Uses the server's /_batch endpoint, falling back to one api_request per
+    endpoint against servers that don't have it. Results are cached like
+    api_request's GET responses, and endpoints with a response cached in the
+    last _CACHE_TTL seconds are not requested again.
+    
+    Args:
+        endpoints: API endpoints to GET
+        quiet: Don't print errors, e.g. for requests made in the background
         
-        return response.json()
+    Returns:
+        List[Any]: The response for each endpoint, in order, with API_FAILED
+            for any request that failed
+    """
+    now = time.monotonic()
+    keys = {endpoint: _cache_key(f"{API_URL}/{endpoint.lstrip('/')}") for endpoint in endpoints}
+    results = {}
+    for endpoint, key in keys.items():
+        cached = _GET_CACHE.get(key)
+        if cached and now - cached[0] < _CACHE_TTL:
+            results[endpoint] = cached[1]
+    pending = [endpoint for endpoint in keys if endpoint not in results]
+    if not pending:
+        return [results[endpoint] for endpoint in endpoints]
+    
+    import requests
+    try:
+        response = get_session().post(
+            f"{API_URL}/_batch",
+            data=_json_dumps({"gets": pending}),
+            headers=_JSON_HEADERS,
+            timeout=API_TIMEOUT
+        )
+        if response.status_code in (404, 405):
+            # Older server without batching
+            return [results[endpoint] if endpoint in results else api_request(endpoint, quiet=quiet)
+                    for endpoint in endpoints]
+        if response.status_code >= 400:
+            if not quiet:
+                print_error(response.text, prefix=Text(f"Error ({response.status_code}): ", style="bold red"))
+            batch = {}
+        else:
+            batch = _json_loads(response.content)["results"]
     except requests.RequestException as e:
-        console.print(f"[bold red]Error:[/bold red] {str(e)}")
-        return {}
+        if not quiet:
+            print_error(str(e))
+        batch = {}
+    except (ValueError, KeyError, TypeError) as e:
+        if not quiet:
+            print_error(f"Invalid response from API server: {str(e)}")
+        batch = {}
+    
+    now = time.monotonic()
+    for endpoint in pending:
+        item = batch.get(endpoint)
+        if item is None:
+            # The whole batch failed, and has been reported above
+            results[endpoint] = API_FAILED
+            continue
+        body = item.get("body")
+        if item.get("status", 500) >= 400:
+            if not quiet:
+                detail = body.get("error", body) if isinstance(body, dict) else body
+                print_error(str(detail), prefix=Text(f"Error ({item.get('status', 500)}) for {endpoint}: ", style="bold red"))
+            results[endpoint] = API_FAILED
+        else:
+            _GET_CACHE[keys[endpoint]] = (now, body)
+            results[endpoint] = body
+    return [results[endpoint] for endpoint in endpoints]
+
+
+# Whether the server has POST /tasks/<id>/restart; None until first tried
+_RESTART_SUPPORTED: Optional[bool] = None
+
+
+def api_restart_task(task_id: str, checkpoint: bool = True) -> bool:
+    """
+    Restart a task in one round trip.
+    
+    Falls back to stop then start against servers without the restart
+    endpoint; that is detected on the first call and remembered.
+    
+    Args:
+        task_id: The ID of the task to restart
+        checkpoint: Whether to checkpoint the task when stopping it
+        
+    Returns:
+        bool: True if the task was restarted
+    """
+    global _RESTART_SUPPORTED
+    
+    if _RESTART_SUPPORTED is not False:
+        import requests
+        _GET_CACHE.clear()
+        try:
+            response = get_session().post(
+                f"{API_URL}/tasks/{task_id}/restart",
+                data=_json_dumps({"checkpoint": checkpoint}),
+                headers=_JSON_HEADERS,
+                timeout=API_TIMEOUT
+            )
+        except requests.RequestException as e:
+            print_error(str(e))
+            return False
+        
+        # An unknown route gets Flask's HTML 404, a missing task a JSON error
+        if response.status_code == 404 and not response.headers.get("Content-Type", "").startswith("application/json"):
+            _RESTART_SUPPORTED = False
+        else:
+            _RESTART_SUPPORTED = True
+            if response.status_code >= 400:
+                print_error(response.text, prefix=Text(f"Error ({response.status_code}): ", style="bold red"))
+                return False
+            return True
+    
+    if not api_request(f"tasks/{task_id}/stop", method="POST", data={"checkpoint": checkpoint}):
+        return False
+    return bool(api_request(f"tasks/{task_id}/start", method="POST"))
+
+
+# Rows per table when printing long listings; fixed column widths keep
+# consecutive chunks aligned and let Rich skip measuring every cell
+TABLE_CHUNK_ROWS = 500
+
+CONTAINER_COLUMNS = [
+    ("ID", 12),
+    ("Name", 24),
+    ("Status", 10),
+    ("Task ID", 12),
+    ("Task Name", 24),
+    ("Priority", 8),
+]
+
+TASK_COLUMNS = [
+    ("ID", 8),
+    ("Name", 24),
+    ("State", 9),
+    ("Priority", 8),
+    ("CPU", 6),
+    ("Memory", 6),
+    ("Created", 19),
+    ("Started", 19),
+]
+
+
+# Fields requested from the API (?fields=) for each listing, so the server
+# only sends what the tables show
+CONTAINER_LIST_FIELDS = "id,name,status,task_id,task_name,priority"
+CONTAINER_PICKER_FIELDS = "id,name,status"
+TASK_LIST_FIELDS = "id,name,state,priority,resources.cpu_shares,resources.memory,created_at,started_at"
+
+
+def print_table_chunked(columns: List[Tuple[str, int]], rows: Iterable[Tuple]) -> None:
+    """
+    Print rows as a sequence of fixed-width tables.
+    
+    Args:
+        columns: (header, width) pairs
+        rows: Row tuples, rendered TABLE_CHUNK_ROWS at a time
+    """
+    def new_table(show_header: bool) -> Table:
+        table = Table(show_header=show_header, header_style="bold magenta")
+        for header, width in columns:
+            table.add_column(header, width=width, no_wrap=True, overflow="ellipsis")
+        return table
+    
+    table = new_table(show_header=True)
+    for row in rows:
+        if table.row_count == TABLE_CHUNK_ROWS:
+            console.print(table)
+            table = new_table(show_header=False)
+        table.add_row(*row)
+    console.print(table)
+
+
+# Rich markup for each known task state
+_STATE_MARKUP = {
+    state: f"[{color}]{state}[/{color}]"
+    for state, color in (
+        ("pending", "yellow"),
+        ("running", "green"),
+        ("paused", "cyan"),
+        ("completed", "blue"),
+        ("failed", "red"),
+    )
+}
+_DEFAULT_STATE_MARKUP = "[white]{}[/white]"
 
 
 def format_task_state(state: str) -> str:
     """Format task state with appropriate color."""
-    colors = {
-        "pending": "yellow",
-        "running": "green",
-        "paused": "cyan",
-        "completed": "blue",
-        "failed": "red"
-    }
-    return f"[{colors.get(state, 'white')}]{state}[/{colors.get(state, 'white')}]"
+    return _STATE_MARKUP.get(state) or _DEFAULT_STATE_MARKUP.format(state)
 
 
 @system_app.command("status")
@@ -93,6 +424,11 @@ def system_status():
     if not status:
         return
     
+    print_system_status(status)
+
+
+def print_system_status(status: Dict[str, Any]) -> None:
+    """Print a system/status response."""
     # System resources
     resources = status.get('resources', {})
     
@@ -118,11 +454,11 @@ def system_status():
     task_table.add_column("State")
     task_table.add_column("Count")
     
-    task_table.add_row(format_task_state("running"), str(tasks.get('running', 0)))
-    task_table.add_row(format_task_state("pending"), str(tasks.get('pending', 0)))
-    task_table.add_row(format_task_state("paused"), str(tasks.get('paused', 0)))
-    task_table.add_row(format_task_state("completed"), str(tasks.get('completed', 0)))
-    task_table.add_row(format_task_state("failed"), str(tasks.get('failed', 0)))
+    task_table.add_row(_STATE_MARKUP["running"], str(tasks.get('running', 0)))
+    task_table.add_row(_STATE_MARKUP["pending"], str(tasks.get('pending', 0)))
+    task_table.add_row(_STATE_MARKUP["paused"], str(tasks.get('paused', 0)))
+    task_table.add_row(_STATE_MARKUP["completed"], str(tasks.get('completed', 0)))
+    task_table.add_row(_STATE_MARKUP["failed"], str(tasks.get('failed', 0)))
     task_table.add_row("[bold]Total[/bold]", str(tasks.get('total', 0)))
     
     console.print(task_table)
@@ -144,24 +480,41 @@ def system_rebalance():
         console.print("\n[bold green]Successfully rebalanced system resources[/bold green]")
 
 
+@system_app.command("overview")
+def system_overview():
+    """Show system status, containers and tasks together."""
+    status, containers, tasks = api_batch([
+        "system/status",
+        f"containers?fields={CONTAINER_LIST_FIELDS}",
+        f"tasks?fields={TASK_LIST_FIELDS}",
+    ])
+    
+    if status:
+        print_system_status(status)
+    if containers is not API_FAILED:
+        print_containers(containers)
+    if tasks is not API_FAILED:
+        print_tasks(tasks)
+
+
 @container_app.command("list")
 def container_list(all: bool = typer.Option(True, "--all", "-a", help="Show all containers including stopped ones")):
     """List containers."""
-    containers = api_request("containers")
-    if not containers:
-        console.print("[yellow]No containers found[/yellow]")
+    containers = api_request("containers", params={"fields": CONTAINER_LIST_FIELDS})
+    if containers is API_FAILED:
         return
     
-    table = Table(show_header=True, header_style="bold magenta")
-    table.add_column("ID")
-    table.add_column("Name")
-    table.add_column("Status")
-    table.add_column("Task ID")
-    table.add_column("Task Name")
-    table.add_column("Priority")
+    print_containers(containers)
+
+
+def print_containers(containers: List[Dict[str, Any]]) -> None:
+    """Print a containers listing."""
+    if not containers:
+        console.print(_MSG_NO_CONTAINERS)
+        return
     
-    for container in containers:
-        table.add_row(
+    rows = (
+        (
             container.get('id', '')[:12],
             container.get('name', ''),
             container.get('status', ''),
@@ -169,9 +522,11 @@ def container_list(all: bool = typer.Option(True, "--all", "-a", help="Show all
             container.get('task_name', ''),
             container.get('priority', '')
         )
+        for container in containers
+    )
     
     console.print("\n[bold cyan]Containers[/bold cyan]")
-    console.print(table)
+    print_table_chunked(CONTAINER_COLUMNS, rows)
 
 
 @container_app.command("logs")
@@ -182,68 +537,200 @@ def container_logs(
 ):
     """View container logs."""
     if not container:
-        containers = api_request("containers")
+        containers = api_request("containers", params={"fields": CONTAINER_PICKER_FIELDS})
+        if containers is API_FAILED:
+            return
         if not containers:
-            console.print("[yellow]No containers found[/yellow]")
+            console.print(_MSG_NO_CONTAINERS)
             return
         
-        # Select a container
-        table = Table(show_header=True, header_style="bold magenta")
-        table.add_column("Index")
-        table.add_column("ID")
-        table.add_column("Name")
-        table.add_column("Status")
-        
-        for i, container_data in enumerate(containers):
-            table.add_row(
-                str(i + 1),
-                container_data.get('id', '')[:12],
-                container_data.get('name', ''),
-                container_data.get('status', '')
-            )
-        
-        console.print("\n[bold cyan]Select a container:[/bold cyan]")
-        console.print(table)
-        
-        choice = Prompt.ask("Enter container index", default="1")
-        try:
-            index = int(choice) - 1
-            if 0 <= index < len(containers):
-                container = containers[index].get('id', '')
+        if len(containers) == 1:
+            # Nothing to choose between
+            container = containers[0].get('id', '')
+        else:
+            # Select a container
+            table = Table(show_header=True, header_style="bold magenta")
+            table.add_column("Index")
+            table.add_column("ID")
+            table.add_column("Name")
+            table.add_column("Status")
+            
+            for i, container_data in enumerate(containers):
+                table.add_row(
+                    str(i + 1),
+                    container_data.get('id', '')[:12],
+                    container_data.get('name', ''),
+                    container_data.get('status', '')
+                )
+            
+            console.print("\n[bold cyan]Select a container:[/bold cyan]")
+            console.print(table)
+            
+            if sys.stdin.isatty():
+                # A plain prompt avoids importing rich.prompt on this path
+                choice = input("Enter container index [1]: ").strip() or "1"
             else:
-                console.print("[bold red]Invalid index[/bold red]")
+                from rich.prompt import Prompt
+                choice = Prompt.ask("Enter container index", default="1")
+            try:
+                index = int(choice) - 1
+                if 0 <= index < len(containers):
+                    container = containers[index].get('id', '')
+                else:
+                    console.print(_MSG_INVALID_INDEX)
+                    return
+            except ValueError:
+                console.print(_MSG_INVALID_INPUT)
                 return
-        except ValueError:
-            console.print("[bold red]Invalid input[/bold red]")
+    
+    if follow:
+        console.print(_MSG_FOLLOWING_LOGS)
+        try:
+            if follow_logs(container, tail):
+                return
+        except KeyboardInterrupt:
+            console.print(_MSG_STOPPED_FOLLOWING)
             return
+        # The server can't stream logs, poll it instead
     
-    logs = api_request(f"containers/{container}/logs?tail={tail}")
+    logs = api_request(f"containers/{container}/logs", params={"tail": tail})
     if not logs:
         return
     
     # Display logs
+    from rich.syntax import Syntax
     syntax = Syntax(logs.get('logs', ''), "log", theme="monokai", line_numbers=True)
     console.print(syntax)
     
     # Follow logs if requested
     if follow:
-        console.print("[yellow]Following logs. Press Ctrl+C to stop.[/yellow]")
         try:
-            last_line_count = len(logs.get('logs', '').split('\n'))
+            prev_logs = logs.get('logs', '')
             while True:
                 time.sleep(1)
-                new_logs = api_request(f"containers/{container}/logs?tail={tail}")
+                new_logs = api_request(f"containers/{container}/logs", params={"tail": tail}, no_cache=True)
                 
                 # Check if we got new logs
                 if new_logs:
-                    log_lines = new_logs.get('logs', '').split('\n')
-                    if len(log_lines) > last_line_count:
-                        # Print only new lines
-                        new_content = '\n'.join(log_lines[-(len(log_lines) - last_line_count):])
-                        console.print(new_content)
-                        last_line_count = len(log_lines)
+                    delta = _logs_delta(prev_logs, new_logs.get('logs', ''))
+                    if delta:
+                        # Print only the new output, as plain text; the
+                        # snapshot above is the only part run through Syntax
+                        console.print(delta, end="", markup=False, highlight=False)
+                    prev_logs = new_logs.get('logs', '')
         except KeyboardInterrupt:
-            console.print("[yellow]Stopped following logs[/yellow]")
+            console.print(_MSG_STOPPED_FOLLOWING)
+
+
+# Characters from the end of the previous log window used to find where
+# the new output starts once the tail window has scrolled
+_LOG_ANCHOR_CHARS = 256
+
+# Reconnection attempts after a log stream drops, waiting 1s, 2s, 4s, ...
+# before each
+_LOG_RECONNECT_ATTEMPTS = 5
+
+
+def _logs_delta(prev_logs: str, new_logs: str) -> str:
+    """
+    Get the output in new_logs that was not already in prev_logs.
+    
+    Both are tail windows of the same log, so either new_logs extends
+    prev_logs, or the window has scrolled and the end of prev_logs appears
+    somewhere inside new_logs. If neither holds, all of new_logs is new.
+    """
+    if new_logs.startswith(prev_logs):
+        return new_logs[len(prev_logs):]
+    
+    anchor = prev_logs[-_LOG_ANCHOR_CHARS:]
+    index = new_logs.rfind(anchor) if anchor else -1
+    if index == -1:
+        return new_logs
+    return new_logs[index + len(anchor):]
+
+
+def stream_logs(container: str, tail: int) -> Optional[Iterator[str]]:
+    """
+    Stream a container's log lines from the API as they are written.
+    
+    The returned iterator reconnects after an established stream drops,
+    resuming from the last line received and backing off between up to
+    _LOG_RECONNECT_ATTEMPTS attempts, and ends when the server ends the
+    stream. A failed first connection is reported and yields no lines.
+    
+    Args:
+        container: Container name or ID
+        tail: Number of existing lines to start with
+        
+    Returns:
+        Optional[Iterator[str]]: Log lines, or None if the server doesn't support following
+    """
+    import requests
+    url = f"{API_URL}/containers/{container}/logs"
+    
+    def connect(params):
+        response = get_session().get(url, params=params, stream=True, timeout=(API_TIMEOUT[0], None))
+        # Servers without follow support answer with a JSON snapshot, and
+        # ones already serving their limit of followers with a 503
+        if (response.status_code in (404, 501, 503)
+                or not response.headers.get("Content-Type", "").startswith("text/plain")):
+            response.close()
+            return None
+        return response
+    
+    try:
+        response = connect({"follow": 1, "tail": tail})
+    except requests.ConnectionError as e:
+        print_error(str(e))
+        return iter(())
+    if response is None:
+        return None
+    
+    def reconnect(since):
+        params = {"follow": 1, "since": since} if since else {"follow": 1, "tail": tail}
+        for attempt in range(_LOG_RECONNECT_ATTEMPTS):
+            console.print(_MSG_RECONNECTING)
+            time.sleep(2 ** attempt)
+            try:
+                return connect(params)
+            except requests.ConnectionError as e:
+                error = e
+        print_error(str(error))
+        return None
+    
+    def lines(response):
+        since = None
+        while response is not None:
+            try:
+                with response:
+                    for line in response.iter_lines(decode_unicode=True):
+                        since = time.time()
+                        yield line
+                return
+            except (requests.ConnectionError, requests.exceptions.ChunkedEncodingError):
+                response = reconnect(since)
+    
+    return lines(response)
+
+
+def follow_logs(container: str, tail: int) -> bool:
+    """
+    Print a container's logs from the API as they are written.
+    
+    Args:
+        container: Container name or ID
+        tail: Number of existing lines to show first
+        
+    Returns:
+        bool: True once the stream ends, False if the server doesn't support following
+    """
+    lines = stream_logs(container, tail)
+    if lines is None:
+        return False
+    
+    for line in lines:
+        console.print(line, markup=False, highlight=False)
+    return True
 
 
 @task_app.command("list")
@@ -252,27 +739,21 @@ def task_list(
     all: bool = typer.Option(True, "--all", "-a", help="Show all tasks")
 ):
     """List tasks."""
-    url = "tasks"
-    if status:
-        url += f"?status={status}"
+    tasks = api_request("tasks", params={"fields": TASK_LIST_FIELDS, "status": status})
+    if tasks is API_FAILED:
+        return
     
-    tasks = api_request(url)
+    print_tasks(tasks)
+
+
+def print_tasks(tasks: List[Dict[str, Any]]) -> None:
+    """Print a tasks listing."""
     if not tasks:
-        console.print("[yellow]No tasks found[/yellow]")
+        console.print(_MSG_NO_TASKS)
         return
     
-    table = Table(show_header=True, header_style="bold magenta")
-    table.add_column("ID")
-    table.add_column("Name")
-    table.add_column("State")
-    table.add_column("Priority")
-    table.add_column("CPU")
-    table.add_column("Memory")
-    table.add_column("Created")
-    table.add_column("Started")
-    
-    for task in tasks:
-        table.add_row(
+    rows = (
+        (
             task.get('id', '')[:8],
             task.get('name', ''),
             format_task_state(task.get('state', '')),
@@ -282,9 +763,11 @@ def task_list(
             format_time(task.get('created_at')),
             format_time(task.get('started_at'))
         )
+        for task in tasks
+    )
     
     console.print("\n[bold cyan]Tasks[/bold cyan]")
-    console.print(table)
+    print_table_chunked(TASK_COLUMNS, rows)
 
 
 @app.command()
@@ -4,9 +4,14 @@ Interactive CLI for the Docker Orchestration System.
 This module provides an interactive command-line interface for managing Docker containers and tasks.
 """
 
+import functools
 import os
 import sys
+import threading
 import time
+from concurrent.futures import Future
+from collections import deque
+from operator import itemgetter
 from typing import Dict, List, Any, Optional, Callable
 
 from rich.console import Console
@@ -18,11 +23,12 @@ from rich.prompt import Prompt, Confirm
 from rich.markdown import Markdown
 from rich import box
 from rich.live import Live
+from rich.rule import Rule
 
 import questionary
 from questionary import Style
 
-from docker_orcha.cli.commands import api_request, format_task_state
+from docker_orcha.cli.commands import api_batch, api_request, api_restart_task, stream_logs
 from docker_orcha.models.enums import Priority, TaskState
 from docker_orcha.utils.formatting import format_time, bytes_to_human
 
@@ -64,6 +70,53 @@ THEME = {
 }
 
 
+# Templates for action results; fill in with .format(message)
+_OK_FMT = f"[{THEME['success_color']}]{{}}[/{THEME['success_color']}]"
+_ERR_FMT = f"[{THEME['error_color']}]{{}}[/{THEME['error_color']}]"
+
+# Header/footer separator; a Rule spans the console width at render time
+_RULE = Rule(characters="=", style=THEME["border_style"])
+
+
+# Menu choices, built once rather than on every redraw
+_MAIN_MENU = (
+    "Container Management",
+    "Task Management",
+    "System Management",
+    "Keyboard Shortcuts",
+    "Exit",
+)
+_CONTAINER_MENU = (
+    "List Containers",
+    "View Logs",
+    "Stop Container",
+    "Restart Container",
+    "Back to Main Menu",
+)
+_TASK_MENU = (
+    "List Tasks",
+    "Create Task",
+    "Start Task",
+    "Stop Task",
+    "Resume Task",
+    "Delete Task",
+    "Back to Main Menu",
+)
+_SYSTEM_MENU = (
+    "System Status",
+    "Rebalance Resources",
+    "Start Scheduler",
+    "Stop Scheduler",
+    "Back to Main Menu",
+)
+
+
+# Fields read for each table row, in column order. The API always includes
+# them in full container and task listings, so they're fetched in one call.
+_CONTAINER_FIELDS = itemgetter('id', 'name', 'status', 'task_id', 'task_name', 'priority')
+_TASK_FIELDS = itemgetter('id', 'name', 'state', 'priority', 'resources', 'created_at', 'started_at')
+
+
 class NavigationStack:
     """Simple navigation stack for interactive UI."""
     
@@ -102,33 +155,136 @@ class NavigationStack:
         return len(self.screens) > 1
 
 
+# Requests running in the background while a menu waits for input, by
+# endpoint. Their responses land in api_request's GET cache, so _fetch() only
+# reuses them while that cache would; see _prefetch() and _fetch().
+_prefetched: Dict[str, Future] = {}
+
+# Endpoints the main menu prefetches in one batch, one per submenu listing
+_OVERVIEW_ENDPOINTS = ("containers", "tasks", "system/status")
+
+
+def _in_background(func: Callable, *args, **kwargs) -> Future:
+    """Start a call on a daemon thread."""
+    future = Future()
+    
+    def run():
+        try:
+            future.set_result(func(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+    
+    # Daemon threads, so a slow request never holds up exiting
+    threading.Thread(target=run, daemon=True).start()
+    return future
+
+
+def _prefetch(*endpoints: str):
+    """Start fetching endpoints in the background, filling the GET cache."""
+    _prefetched.clear()
+    for endpoint in endpoints:
+        _prefetched[endpoint] = _in_background(api_request, endpoint, quiet=True)
+
+
+def _prefetch_overview():
+    """
+    Prefetch containers, tasks and system status with one batch request.
+    
+    api_batch skips endpoints still fresh in the GET cache, so redrawing the
+    main menu, e.g. after the shortcuts screen, doesn't request them again.
+    """
+    _prefetched.clear()
+    future = _in_background(api_batch, list(_OVERVIEW_ENDPOINTS), quiet=True)
+    for endpoint in _OVERVIEW_ENDPOINTS:
+        _prefetched[endpoint] = future
+
+
+def _fetch(endpoint: str) -> Any:
+    """
+    GET endpoint, waiting for its prefetch if one is still running.
+    
+    The prefetched response is only used through the GET cache, so one
+    that has sat behind a menu for longer than _CACHE_TTL is fetched again,
+    and a failed prefetch is repeated in the foreground to report its error.
+    """
+    future = _prefetched.pop(endpoint, None)
+    if future is not None:
+        try:
+            future.result()
+        except Exception:
+            pass
+    
+    return api_request(endpoint)
+
+
+class _LogWindow:
+    """The last lines of a followed log, rendered as a panel when Live redraws."""
+    
+    def __init__(self, size: int):
+        self.lines = deque(maxlen=max(size, 1))
+    
+    def __rich__(self) -> Panel:
+        # Live renders from its refresh thread while lines are appended; the
+        # join copies the deque in one C call, so it never sees it mid-append
+        return Panel(Text("\n".join(self.lines)), expand=False)
+
+
 def display_header():
     """Display the application header."""
     console.print(f"[{THEME['title_color']}]{THEME['app_title']}[/{THEME['title_color']}]", justify="center")
-    console.print("=" * console.width, style=THEME["border_style"])
+    console.print(_RULE)
 
 
 def display_footer():
     """Display the application footer."""
-    console.print("=" * console.width, style=THEME["border_style"])
+    console.print(_RULE)
     console.print("Press Ctrl+C to exit", justify="center", style="dim")
 
 
+def _await_continue():
+    """Wait for Enter before redisplaying a menu; scripted (non-TTY) input doesn't wait."""
+    if sys.stdin.isatty():
+        console.print("\nPress Enter to continue...", style="dim")
+        sys.stdin.readline()
+
+
+def display_menu_header(title: str, drawn_for=None):
+    """
+    Display a menu's header, unless it was already drawn for this console size.
+    
+    Menus redisplay after every action, so the full header is only redrawn
+    after a resize; otherwise a dim rule carrying the title separates the
+    action's output from the menu.
+    
+    Args:
+        title: Menu title
+        drawn_for: Console size the header was last drawn for, if any
+        
+    Returns:
+        The console size the header is now drawn for
+    """
+    size = console.size
+    if size != drawn_for:
+        display_header()
+        console.print(f"[bold]{title}[/bold]", justify="center")
+    else:
+        console.print(Rule(title, style="dim"))
+    return size
+
+
 def container_submenu():
     """Container management submenu."""
+    header = None
     while True:
-        display_header()
-        console.print("[bold]Container Management[/bold]", justify="center")
+        if header is not None:
+            # Every option but Back lists containers, so fetch them while the
+            # menu waits; on entry the main menu's overview prefetch has them
+            _prefetch("containers")
+        header = display_menu_header("Container Management", header)
         
         choice = questionary.select(
             "Select an option:",
-            choices=[
-                "List Containers",
-                "View Logs",
-                "Stop Container",
-                "Restart Container",
-                "Back to Main Menu"
-            ],
+            choices=_CONTAINER_MENU,
             style=custom_style
         ).ask()
         
@@ -145,13 +301,12 @@ def container_submenu():
         
         # Wait for user input before returning to menu
         if choice is not None and choice != "Back to Main Menu":
-            console.print("\nPress Enter to continue...", style="dim")
-            input()
+            _await_continue()
 
 
 def display_container_table():
     """Display a table of containers."""
-    containers = api_request("containers")
+    containers = _fetch("containers")
     if not containers:
         console.print("[yellow]No containers found[/yellow]")
         return
@@ -164,60 +319,73 @@ def display_container_table():
     table.add_column("Task Name")
     table.add_column("Priority")
     
-    for container in containers:
-        table.add_row(
-            container.get('id', '')[:12],
-            container.get('name', ''),
-            container.get('status', ''),
-            container.get('task_id', '')[:8] if container.get('task_id') else '',
-            container.get('task_name', ''),
-            container.get('priority', '')
-        )
+    for row in map(_container_row, containers):
+        table.add_row(*row)
     
     console.print("\n[bold cyan]Containers[/bold cyan]")
     console.print(table)
 
 
-def select_container() -> Optional[str]:
-    """Select a container from the list."""
-    containers = api_request("containers")
+def _container_row(container: Dict[str, Any]) -> tuple:
+    """Build a container table row."""
+    container_id, name, status, task_id, task_name, priority = _CONTAINER_FIELDS(container)
+    # Text cells are taken verbatim, so names are never parsed as markup
+    return (
+        Text((container_id or '')[:12]),
+        Text(name or ''),
+        Text(status or ''),
+        Text((task_id or '')[:8]),
+        Text(task_name or ''),
+        Text(priority or '')
+    )
+
+
+def _lookup_choice(by_label: Dict[str, Any], choice: Optional[str]) -> Any:
+    """Map an autocomplete answer back to its entry, or None if cancelled or unknown."""
+    if not choice:
+        return None
+    
+    selected = by_label.get(choice)
+    if selected is None:
+        console.print(Text(f"No match for '{choice}'", style="yellow"))
+    return selected
+
+
+def select_container() -> Optional[Dict[str, Any]]:
+    """Select a container from the list, returning its listing entry."""
+    containers = _fetch("containers")
     if not containers:
         console.print("[yellow]No containers found[/yellow]")
         return None
     
-    choices = [
-        f"{c.get('name', 'unnamed')} ({c.get('id', '')[:12]}) - {c.get('status', 'unknown')}"
+    by_label = {
+        f"{c.get('name', 'unnamed')} ({c.get('id', '')[:12]}) - {c.get('status', 'unknown')}": c
         for c in containers
-    ]
-    choices.append("Cancel")
+    }
     
-    choice = questionary.select(
-        "Select a container:",
-        choices=choices,
+    # Autocomplete only lays out the entries matching what has been typed,
+    # which keeps long lists responsive; an empty answer cancels
+    choice = questionary.autocomplete(
+        "Select a container (type to filter, Enter on empty to cancel):",
+        choices=list(by_label),
+        match_middle=True,
         style=custom_style
     ).ask()
     
-    if choice == "Cancel" or choice is None:
-        return None
-    
-    # Extract container ID from selection
-    selected_index = choices.index(choice)
-    if selected_index < len(containers):
-        return containers[selected_index].get('id', '')
-    
-    return None
+    return _lookup_choice(by_label, choice)
 
 
 def view_container_logs():
     """View container logs."""
-    container_id = select_container()
-    if not container_id:
+    container = select_container()
+    if not container or not container.get('id'):
         return
+    container_id = container['id']
     
     tail = questionary.text(
         "Number of lines to show:",
         default="100",
-        validate=lambda text: text.isdigit(),
+        validate=str.isdigit,
         style=custom_style
     ).ask()
     
@@ -241,32 +409,40 @@ def view_container_logs():
     if follow:
         console.print("[yellow]Following logs. Press Ctrl+C to stop.[/yellow]")
         try:
-            last_line_count = len(logs.get('logs', '').split('\n'))
-            with Live("", refresh_per_second=4) as live:
-                while True:
-                    time.sleep(1)
-                    new_logs = api_request(f"containers/{container_id}/logs?tail={tail}")
-                    
-                    if new_logs:
-                        live.update(Panel(new_logs.get('logs', 'No logs available'), expand=False))
+            lines = stream_logs(container_id, int(tail))
+            if lines is not None:
+                # Keep the last `tail` lines client-side; the server only
+                # sends lines as they are written. Lines can arrive in
+                # bursts, so Live redraws on a timer and the panel is only
+                # built when it does.
+                window = _LogWindow(int(tail))
+                with Live(window, refresh_per_second=4):
+                    for line in lines:
+                        window.lines.append(line)
+            else:
+                # The server can't stream logs, poll it instead and redraw
+                # only when a poll brings new output
+                prev_logs = logs.get('logs', '')
+                with Live("", auto_refresh=False) as live:
+                    while True:
+                        time.sleep(1)
+                        new_logs = api_request(f"containers/{container_id}/logs?tail={tail}", no_cache=True)
+                        
+                        if new_logs and new_logs.get('logs', '') != prev_logs:
+                            prev_logs = new_logs.get('logs', '')
+                            live.update(Panel(prev_logs or 'No logs available', expand=False), refresh=True)
         except KeyboardInterrupt:
             console.print("[yellow]Stopped following logs[/yellow]")
 
 
 def stop_container():
     """Stop a container."""
-    container_id = select_container()
-    if not container_id:
+    container = select_container()
+    if not container:
         return
     
-    # Find the task ID for this container
-    containers = api_request("containers")
-    task_id = None
-    for container in containers:
-        if container.get('id', '') == container_id:
-            task_id = container.get('task_id')
-            break
-    
+    # The listing already carries the container's task
+    task_id = container.get('task_id')
     if not task_id:
         console.print("[yellow]Could not find task ID for this container[/yellow]")
         return
@@ -283,60 +459,42 @@ def stop_container():
     result = api_request(f"tasks/{task_id}/stop", method="POST", data={"checkpoint": checkpoint})
     
     if result:
-        console.print(f"[{THEME['success_color']}]Container stopped successfully[/{THEME['success_color']}]")
+        console.print(_OK_FMT.format("Container stopped successfully"))
     else:
-        console.print(f"[{THEME['error_color']}]Failed to stop container[/{THEME['error_color']}]")
+        console.print(_ERR_FMT.format("Failed to stop container"))
 
 
 def restart_container():
     """Restart a container."""
-    container_id = select_container()
-    if not container_id:
+    container = select_container()
+    if not container:
         return
     
-    # Find the task ID for this container
-    containers = api_request("containers")
-    task_id = None
-    for container in containers:
-        if container.get('id', '') == container_id:
-            task_id = container.get('task_id')
-            break
-    
+    # The listing already carries the container's task
+    task_id = container.get('task_id')
     if not task_id:
         console.print("[yellow]Could not find task ID for this container[/yellow]")
         return
     
-    # First stop the task
-    stop_result = api_request(f"tasks/{task_id}/stop", method="POST")
-    if not stop_result:
-        console.print(f"[{THEME['error_color']}]Failed to stop container[/{THEME['error_color']}]")
-        return
-    
-    # Then start it again
-    start_result = api_request(f"tasks/{task_id}/start", method="POST")
-    if start_result:
-        console.print(f"[{THEME['success_color']}]Container restarted successfully[/{THEME['success_color']}]")
+    if api_restart_task(task_id):
+        console.print(_OK_FMT.format("Container restarted successfully"))
     else:
-        console.print(f"[{THEME['error_color']}]Failed to restart container[/{THEME['error_color']}]")
+        console.print(_ERR_FMT.format("Failed to restart container"))
 
 
 def task_submenu():
     """Task management submenu."""
+    header = None
     while True:
-        display_header()
-        console.print("[bold]Task Management[/bold]", justify="center")
+        if header is not None:
+            # Most options start by picking a task, so fetch them while the
+            # menu waits; on entry the main menu's overview prefetch has them
+            _prefetch("tasks")
+        header = display_menu_header("Task Management", header)
         
         choice = questionary.select(
             "Select an option:",
-            choices=[
-                "List Tasks",
-                "Create Task",
-                "Start Task",
-                "Stop Task",
-                "Resume Task",
-                "Delete Task",
-                "Back to Main Menu"
-            ],
+            choices=_TASK_MENU,
             style=custom_style
         ).ask()
         
@@ -357,8 +515,7 @@ def task_submenu():
         
         # Wait for user input before returning to menu
         if choice is not None and choice != "Back to Main Menu":
-            console.print("\nPress Enter to continue...", style="dim")
-            input()
+            _await_continue()
 
 
 def display_task_table():
@@ -383,7 +540,7 @@ def display_task_table():
     if status_filter != "All":
         url += f"?status={status_filter.lower()}"
     
-    tasks = api_request(url)
+    tasks = _fetch(url)
     if not tasks:
         console.print("[yellow]No tasks found[/yellow]")
         return
@@ -398,50 +555,55 @@ def display_task_table():
     table.add_column("Created")
     table.add_column("Started")
     
-    for task in tasks:
-        table.add_row(
-            task.get('id', '')[:8],
-            task.get('name', ''),
-            format_task_state(task.get('state', '')),
-            task.get('priority', ''),
-            str(task.get('resources', {}).get('cpu_shares', '')),
-            task.get('resources', {}).get('memory', ''),
-            format_time(task.get('created_at')),
-            format_time(task.get('started_at'))
-        )
+    for row in map(_task_row, tasks):
+        table.add_row(*row)
     
     console.print("\n[bold cyan]Tasks[/bold cyan]")
     console.print(table)
 
 
+@functools.lru_cache(maxsize=16)
+def _state_text(state: str) -> Text:
+    """Get the styled cell for a task state; instances are shared between rows."""
+    return Text(state, style=THEME["task_state_colors"].get(state, "white"))
+
+
+def _task_row(task: Dict[str, Any]) -> tuple:
+    """Build a task table row."""
+    task_id, name, state, priority, resources, created_at, started_at = _TASK_FIELDS(task)
+    resources = resources or {}
+    return (
+        Text((task_id or '')[:8]),
+        Text(name or ''),
+        _state_text(state or ''),
+        Text(priority or ''),
+        Text(str(resources.get('cpu_shares', ''))),
+        Text(resources.get('memory', '')),
+        Text(format_time(created_at)),
+        Text(format_time(started_at))
+    )
+
+
 def select_task() -> Optional[str]:
     """Select a task from the list."""
-    tasks = api_request("tasks")
+    tasks = _fetch("tasks")
     if not tasks:
         console.print("[yellow]No tasks found[/yellow]")
         return None
     
-    choices = [
-        f"{t.get('name', 'unnamed')} ({t.get('id', '')[:8]}) - {t.get('state', 'unknown')}"
+    by_label = {
+        f"{t.get('name', 'unnamed')} ({t.get('id', '')[:8]}) - {t.get('state', 'unknown')}": t.get('id', '')
         for t in tasks
-    ]
-    choices.append("Cancel")
+    }
     
-    choice = questionary.select(
-        "Select a task:",
-        choices=choices,
+    choice = questionary.autocomplete(
+        "Select a task (type to filter, Enter on empty to cancel):",
+        choices=list(by_label),
+        match_middle=True,
         style=custom_style
     ).ask()
     
-    if choice == "Cancel" or choice is None:
-        return None
-    
-    # Extract task ID from selection
-    selected_index = choices.index(choice)
-    if selected_index < len(tasks):
-        return tasks[selected_index].get('id', '')
-    
-    return None
+    return _lookup_choice(by_label, choice)
 
 
 def create_task():
@@ -449,7 +611,7 @@ def create_task():
     # Get task name
     name = questionary.text(
         "Task name:",
-        validate=lambda text: len(text) > 0,
+        validate=bool,
         style=custom_style
     ).ask()
     
@@ -475,7 +637,7 @@ def create_task():
     cpu_shares = questionary.text(
         "CPU shares (default: 1024):",
         default="1024",
-        validate=lambda text: text.isdigit(),
+        validate=str.isdigit,
         style=custom_style
     ).ask()
     
@@ -518,18 +680,19 @@ def create_task():
     dockerfile_path = None
     
     if dockerfile_type == "Inline content":
-        console.print("\nEnter Dockerfile content (Ctrl+D to finish):")
+        console.print("\nEnter Dockerfile content, then a line containing only EOF (or Ctrl+D) to finish:")
+        # Dockerfiles have blank lines, so a sentinel line ends the input;
+        # stdin stays open for the menus that follow
         lines = []
-        try:
-            while True:
-                line = input()
-                lines.append(line)
-        except EOFError:
-            dockerfile_content = "\n".join(lines)
+        for line in iter(sys.stdin.readline, ''):
+            if line.rstrip('\r\n') == 'EOF':
+                break
+            lines.append(line)
+        dockerfile_content = ''.join(lines)
     elif dockerfile_type == "File path":
         dockerfile_path = questionary.text(
             "Dockerfile path:",
-            validate=lambda text: os.path.exists(text),
+            validate=os.path.exists,
             style=custom_style
         ).ask()
         
@@ -555,7 +718,7 @@ def create_task():
     result = api_request("tasks", method="POST", data=data)
     
     if result and "task_id" in result:
-        console.print(f"[{THEME['success_color']}]Task created successfully. ID: {result['task_id']}[/{THEME['success_color']}]")
+        console.print(_OK_FMT.format(f"Task created successfully. ID: {result['task_id']}"))
         
         # Ask if the user wants to start the task immediately
         start_now = questionary.confirm(
@@ -567,11 +730,11 @@ def create_task():
         if start_now:
             start_result = api_request(f"tasks/{result['task_id']}/start", method="POST")
             if start_result:
-                console.print(f"[{THEME['success_color']}]Task started successfully[/{THEME['success_color']}]")
+                console.print(_OK_FMT.format("Task started successfully"))
             else:
-                console.print(f"[{THEME['error_color']}]Failed to start task[/{THEME['error_color']}]")
+                console.print(_ERR_FMT.format("Failed to start task"))
     else:
-        console.print(f"[{THEME['error_color']}]Failed to create task[/{THEME['error_color']}]")
+        console.print(_ERR_FMT.format("Failed to create task"))
 
 
 def start_task():
@@ -583,9 +746,9 @@ def start_task():
     result = api_request(f"tasks/{task_id}/start", method="POST")
     
     if result:
-        console.print(f"[{THEME['success_color']}]Task started successfully[/{THEME['success_color']}]")
+        console.print(_OK_FMT.format("Task started successfully"))
     else:
-        console.print(f"[{THEME['error_color']}]Failed to start task[/{THEME['error_color']}]")
+        console.print(_ERR_FMT.format("Failed to start task"))
 
 
 def stop_task():
@@ -606,9 +769,9 @@ def stop_task():
     result = api_request(f"tasks/{task_id}/stop", method="POST", data={"checkpoint": checkpoint})
     
     if result:
-        console.print(f"[{THEME['success_color']}]Task stopped successfully[/{THEME['success_color']}]")
+        console.print(_OK_FMT.format("Task stopped successfully"))
     else:
-        console.print(f"[{THEME['error_color']}]Failed to stop task[/{THEME['error_color']}]")
+        console.print(_ERR_FMT.format("Failed to stop task"))
 
 
 def resume_task():
@@ -620,9 +783,9 @@ def resume_task():
     result = api_request(f"tasks/{task_id}/resume", method="POST")
     
     if result:
-        console.print(f"[{THEME['success_color']}]Task resumed successfully[/{THEME['success_color']}]")
+        console.print(_OK_FMT.format("Task resumed successfully"))
     else:
-        console.print(f"[{THEME['error_color']}]Failed to resume task[/{THEME['error_color']}]")
+        console.print(_ERR_FMT.format("Failed to resume task"))
 
 
 def delete_task():
@@ -643,26 +806,24 @@ def delete_task():
     result = api_request(f"tasks/{task_id}", method="DELETE")
     
     if result:
-        console.print(f"[{THEME['success_color']}]Task deleted successfully[/{THEME['success_color']}]")
+        console.print(_OK_FMT.format("Task deleted successfully"))
     else:
-        console.print(f"[{THEME['error_color']}]Failed to delete task[/{THEME['error_color']}]")
+        console.print(_ERR_FMT.format("Failed to delete task"))
 
 
 def system_submenu():
     """System management submenu."""
+    header = None
     while True:
-        display_header()
-        console.print("[bold]System Management[/bold]", justify="center")
+        if header is not None:
+            # Fetch the status while the menu waits, in case it is picked; on
+            # entry the main menu's overview prefetch has it
+            _prefetch("system/status")
+        header = display_menu_header("System Management", header)
         
         choice = questionary.select(
             "Select an option:",
-            choices=[
-                "System Status",
-                "Rebalance Resources",
-                "Start Scheduler",
-                "Stop Scheduler",
-                "Back to Main Menu"
-            ],
+            choices=_SYSTEM_MENU,
             style=custom_style
         ).ask()
         
@@ -679,13 +840,12 @@ def system_submenu():
         
         # Wait for user input before returning to menu
         if choice is not None and choice != "Back to Main Menu":
-            console.print("\nPress Enter to continue...", style="dim")
-            input()
+            _await_continue()
 
 
 def display_system_status():
     """Display system status."""
-    status = api_request("system/status")
+    status = _fetch("system/status")
     if not status:
         return
     
@@ -714,11 +874,11 @@ def display_system_status():
     task_table.add_column("State")
     task_table.add_column("Count")
     
-    task_table.add_row(format_task_state("running"), str(tasks.get('running', 0)))
-    task_table.add_row(format_task_state("pending"), str(tasks.get('pending', 0)))
-    task_table.add_row(format_task_state("paused"), str(tasks.get('paused', 0)))
-    task_table.add_row(format_task_state("completed"), str(tasks.get('completed', 0)))
-    task_table.add_row(format_task_state("failed"), str(tasks.get('failed', 0)))
+    task_table.add_row(_state_text("running"), str(tasks.get('running', 0)))
+    task_table.add_row(_state_text("pending"), str(tasks.get('pending', 0)))
+    task_table.add_row(_state_text("paused"), str(tasks.get('paused', 0)))
+    task_table.add_row(_state_text("completed"), str(tasks.get('completed', 0)))
+    task_table.add_row(_state_text("failed"), str(tasks.get('failed', 0)))
     task_table.add_row("[bold]Total[/bold]", str(tasks.get('total', 0)))
     
     console.print(task_table)
@@ -737,9 +897,9 @@ def rebalance_resources():
     result = api_request("system/rebalance", method="POST")
     
     if result:
-        console.print(f"[{THEME['success_color']}]Resources rebalanced successfully[/{THEME['success_color']}]")
+        console.print(_OK_FMT.format("Resources rebalanced successfully"))
     else:
-        console.print(f"[{THEME['error_color']}]Failed to rebalance resources[/{THEME['error_color']}]")
+        console.print(_ERR_FMT.format("Failed to rebalance resources"))
 
 
 def start_scheduler():
@@ -747,9 +907,9 @@ def start_scheduler():
     result = api_request("scheduler/start", method="POST")
     
     if result:
-        console.print(f"[{THEME['success_color']}]Scheduler started successfully[/{THEME['success_color']}]")
+        console.print(_OK_FMT.format("Scheduler started successfully"))
     else:
-        console.print(f"[{THEME['error_color']}]Failed to start scheduler[/{THEME['error_color']}]")
+        console.print(_ERR_FMT.format("Failed to start scheduler"))
 
 
 def stop_scheduler():
@@ -757,9 +917,9 @@ def stop_scheduler():
     result = api_request("scheduler/stop", method="POST")
     
     if result:
-        console.print(f"[{THEME['success_color']}]Scheduler stopped successfully[/{THEME['success_color']}]")
+        console.print(_OK_FMT.format("Scheduler stopped successfully"))
     else:
-        console.print(f"[{THEME['error_color']}]Failed to stop scheduler[/{THEME['error_color']}]")
+        console.print(_ERR_FMT.format("Failed to stop scheduler"))
 
 
 def display_keyboard_shortcuts():
@@ -781,19 +941,15 @@ def interactive_mode():
         # Create navigation stack
         nav_stack = NavigationStack()
         
+        header = None
         while True:
-            display_header()
-            console.print("[bold]Main Menu[/bold]", justify="center")
+            # Whichever submenu is picked opens with one of these listings
+            _prefetch_overview()
+            header = display_menu_header("Main Menu", header)
             
             choice = questionary.select(
                 "Select an option:",
-                choices=[
-                    "Container Management",
-                    "Task Management",
-                    "System Management",
-                    "Keyboard Shortcuts",
-                    "Exit"
-                ],
+                choices=_MAIN_MENU,
                 style=custom_style
             ).ask()
             
@@ -805,15 +961,14 @@ def interactive_mode():
                 system_submenu()
             elif choice == "Keyboard Shortcuts":
                 display_keyboard_shortcuts()
-                console.print("\nPress Enter to continue...", style="dim")
-                input()
+                _await_continue()
             elif choice == "Exit" or choice is None:
                 break
     
     except KeyboardInterrupt:
         console.print("\n[bold]Exiting...[/bold]")
     
-    console.print(f"[{THEME['success_color']}]Goodbye![/{THEME['success_color']}]")
+    console.print(_OK_FMT.format("Goodbye!"))
 
 
 if __name__ == "__main__":
@@ -6,17 +6,42 @@ including creation, monitoring, and resource management.
 """
 
 import os
-import json
+import re
 import time
+import heapq
+import itertools
+import atexit
 import logging
 import threading
 import yaml
+from concurrent.futures import ThreadPoolExecutor
+from uuid import uuid4
 import docker
-from typing import Dict, List, Optional, Union
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple, Union
+
+try:
+    from yaml import CSafeDumper as YamlDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as YamlDumper
 
 from docker_orcha.models.enums import Priority, TaskState
 from docker_orcha.models.resources import ResourceRequirements
 from docker_orcha.models.task import Task
+from docker_orcha.utils.json_utils import dumps as json_dumps, loads as json_loads
+
+
+def _dump_compose_yaml(content: Dict) -> str:
+    """
+    Serialize a compose file dictionary to YAML.
+    
+    The safe dumper writes plain data exactly as yaml.dump() does, keys
+    sorted; content it can't represent (e.g. enum values) is dumped with
+    yaml.dump() as before.
+    """
+    try:
+        return yaml.dump(content, Dumper=YamlDumper, default_flow_style=False, sort_keys=True)
+    except yaml.representer.RepresenterError:
+        return yaml.dump(content)
 
 
 # Configure logging
@@ -32,26 +57,97 @@ class DockerManager:
     """
     Manages Docker containers with advanced scheduling and resource allocation.
     """
+    # Base image of a Dockerfile: the first FROM instruction
+    _FROM_RE = re.compile(r'^\s*FROM\s+(\S+)', re.MULTILINE | re.IGNORECASE)
+    
     def __init__(self, state_dir: str = "./container_states"):
         # Configure Docker client for Windows with WSL2
         self.client = docker.DockerClient(base_url='npipe:////./pipe/docker_engine')
+        # Low-level client for calls whose raw JSON is all we need
+        self.api = self.client.api
         self.state_dir = state_dir
+        # Paths under state_dir, joined once
+        self._state_file = os.path.join(state_dir, "tasks_state.json")
+        self._journal_file = os.path.join(state_dir, "tasks_state.journal")
+        self._checkpoints_dir = os.path.join(state_dir, "checkpoints")
+        self._dockerfiles_dir = os.path.join(state_dir, "dockerfiles")
         self.tasks = {}  # Task ID -> Task object
         self.lock = threading.RLock()
+        # Serializes state writes; taken before self.lock, so changes reach
+        # disk in the order they were captured
+        self._save_lock = threading.Lock()
+        # Tasks changed since the last write, to be appended to the journal,
+        # and whether a change that isn't tied to one task needs a full save
+        self._changed_tasks = set()
+        self._full_save_needed = False
+        # Records in the journal for the current state file; None when there
+        # is no usable journal and the next write must be a full save
+        self.journal_max_records = 1000
+        self._journal_records: Optional[int] = None
+        # (task_id, task) pairs as of the last add or delete, rebuilt under
+        # self.lock, so readers can iterate without taking it
+        self._tasks_snapshot = ()
+        # TaskState -> IDs of the tasks in that state, kept in sync with self.tasks
+        self._by_state: Dict[TaskState, Set[str]] = {state: set() for state in TaskState}
+        # Running tasks as a min-heap of [priority rank, start order, task_id]
+        # entries, lowest priority first. An entry is live while it is the
+        # one in _running_entries for its task; others are skipped when popped.
+        self._running_heap: List[list] = []
+        self._running_entries: Dict[str, list] = {}
+        self._running_order = itertools.count()
+        # Called with each task that is created or changes state; see add_state_listener
+        self._state_listeners: List[Callable[[Task], None]] = []
+        # Tasks whose containers we are stopping ourselves, so their reaper
+        # threads leave the task state to the stopping call
+        self._stopping = set()
+        
+        # Last list_containers() result and when it was built (time.monotonic()).
+        # Task state changes reset the timestamp, so only changes Docker makes
+        # on its own (e.g. a container exiting) can be up to the TTL old.
+        self.container_cache_ttl = 10.0
+        self._containers_cache: List[Dict] = []
+        self._containers_cached_at = 0.0
+        
+        # Base image per (Dockerfile path, st_mtime_ns), so an edited
+        # Dockerfile is parsed again and an unchanged one is never re-read
+        self._image_cache: Dict[Tuple[str, int], str] = {}
         
-        # Ensure state directory exists
-        os.makedirs(self.state_dir, exist_ok=True)
+        # Ensure state directories exist, so per-task directories need a
+        # single mkdir
+        os.makedirs(self._checkpoints_dir, exist_ok=True)
+        os.makedirs(self._dockerfiles_dir, exist_ok=True)
         
         # Load saved state if available
         self._load_state()
         
+        # State saves are written by a background thread; a burst of changes
+        # within state_save_delay seconds is written once
+        self.state_save_delay = 0.05
+        self._dirty = threading.Event()
+        self._persistence_thread = threading.Thread(
+            target=self._persistence_loop, name="state-writer", daemon=True
+        )
+        self._persistence_thread.start()
+        atexit.register(self.flush_state)
+        
+        # Watch the containers of tasks that were running when state was saved
+        for task in self.get_tasks_in_state(TaskState.RUNNING):
+            self._watch_container(task)
+        
     def _load_state(self):
-        """Load saved tasks state from disk"""
-        state_file = os.path.join(self.state_dir, "tasks_state.json")
+        """
+        Load saved tasks state from disk.
+        
+        The state file is read first, then the task changes journaled since
+        it was written are applied on top; see _write_state.
+        """
+        state_file = self._state_file
         if os.path.exists(state_file):
             try:
-                with open(state_file, 'r') as f:
-                    tasks_data = json.load(f)
+                with open(state_file, 'rb') as f:
+                    raw = f.read()
+                tasks_data = json_loads(raw)
+                self._replay_journal(state_file, tasks_data)
                 
                 for task_id, task_dict in tasks_data.items():
                     # Convert dictionary back to Task object
@@ -62,23 +158,268 @@ class DockerManager:
                     task_dict['priority'] = Priority(task_dict['priority'])
                     task_dict['state'] = TaskState(task_dict['state'])
                     
-                    self.tasks[task_id] = Task(**task_dict)
+                    task = Task(**task_dict)
+                    self.tasks[task_id] = task
+                    self._by_state[task.state].add(task_id)
+                    if task.state == TaskState.RUNNING:
+                        self._index_running(task)
                 
+                self._tasks_snapshot = tuple(self.tasks.items())
                 logger.info(f"Loaded state with {len(self.tasks)} tasks")
             except Exception as e:
                 logger.error(f"Failed to load state: {str(e)}")
     
-    def _save_state(self):
-        """Save current tasks state to disk"""
-        state_file = os.path.join(self.state_dir, "tasks_state.json")
+    def _replay_journal(self, state_file: str, tasks_data: Dict):
+        """
+        Apply journaled task changes to the loaded state file contents.
+        
+        The journal's first line names the state file it follows; a journal
+        left over from an older state file is ignored. A record cut short by
+        a crash ends the replay, and the next write then saves in full.
+        
+        Args:
+            state_file: Path of the state file that was loaded
+            tasks_data: Task dictionaries by ID, updated in place
+        """
+        try:
+            with open(self._journal_file, 'rb') as f:
+                lines = f.read().split(b'\n')
+        except FileNotFoundError:
+            return
+        
+        try:
+            header = json_loads(lines[0])
+        except ValueError:
+            return
+        if header.get('state_file') != self._state_file_id(state_file):
+            return
+        
+        # Every complete record ends with a newline, leaving b'' last
+        complete = lines[-1] == b''
+        replayed = 0
+        for line in lines[1:-1]:
+            try:
+                record = json_loads(line)
+            except ValueError:
+                complete = False
+                break
+            if record['task'] is None:
+                tasks_data.pop(record['id'], None)
+            else:
+                tasks_data[record['id']] = record['task']
+            replayed += 1
+        
+        if complete:
+            self._journal_records = replayed
+        if replayed:
+            logger.info(f"Replayed {replayed} journaled task changes")
+    
+    @staticmethod
+    def _state_file_id(state_file: str) -> List[int]:
+        """Identify one write of the state file; each write is a new file"""
+        st = os.stat(state_file)
+        return [st.st_ino, st.st_mtime_ns, st.st_size]
+    
+    def _set_task_state(self, task: Task, state: TaskState):
+        """Move a task to a new state, keeping the per-state index current"""
+        with self.lock:
+            self._by_state[task.state].discard(task.id)
+            self._by_state[state].add(task.id)
+            if state == TaskState.RUNNING:
+                self._index_running(task)
+                self._watch_container(task)
+            elif task.state == TaskState.RUNNING:
+                self._unindex_running(task.id)
+            task.state = state
+            self._containers_cached_at = 0.0
+            for listener in self._state_listeners:
+                listener(task)
+    
+    def _watch_container(self, task: Task):
+        """Start a reaper thread that records when a running task's container exits"""
+        if task.container_id:
+            threading.Thread(
+                target=self._reap_container, args=(task.id, task.container_id),
+                name=f"reaper-{task.id[:8]}", daemon=True
+            ).start()
+    
+    def _reap_container(self, task_id: str, container_id: str):
+        """
+        Wait for a task's container to exit and mark the task completed or failed.
+        
+        The wait blocks in the Docker daemon until the container exits, so
+        running containers need no polling. The exit is recorded through
+        _record_exit, like the scheduler's event and poll checks.
+        
+        Args:
+            task_id: The ID of the task
+            container_id: The container it was started in
+        """
         try:
-            tasks_dict = {task_id: task.to_dict() for task_id, task in self.tasks.items()}
-            with open(state_file, 'w') as f:
-                json.dump(tasks_dict, f, indent=2)
-            logger.info(f"Saved state with {len(self.tasks)} tasks")
+            exit_code = self.api.wait(container_id).get('StatusCode', -1)
         except Exception as e:
+            # The scheduler's own checks still cover this container
+            logger.error(f"Failed to wait for container {container_id}: {str(e)}")
+            return
+        
+        self._record_exit(task_id, container_id, exit_code)
+    
+    def _record_exit(self, task_id: str, container_id: str, exit_code: int) -> bool:
+        """
+        Mark a running task completed or failed after its container exited.
+        
+        Every exit detector goes through here. The checks run under
+        self.lock, so an exit is ignored once the task has left RUNNING, has
+        moved to another container, or is being stopped by stop_task,
+        rescheduling or delete_task, which set the state themselves.
+        
+        Args:
+            task_id: The ID of the task
+            container_id: The container that exited
+            exit_code: The container's exit code; 0 means the task completed
+            
+        Returns:
+            bool: True if the task state was changed
+        """
+        with self.lock:
+            task = self.tasks.get(task_id)
+            if (not task or task.state != TaskState.RUNNING or task.container_id != container_id
+                    or task_id in self._stopping):
+                return False
+            self._set_task_state(task, TaskState.COMPLETED if exit_code == 0 else TaskState.FAILED)
+            task.completed_at = time.time()
+        self._save_state(task_id)
+        return True
+    
+    def add_state_listener(self, listener: Callable[[Task], None]):
+        """
+        Register a callback for task state changes.
+        
+        The listener is called with the task, already in its new state, when
+        it is created or changes state. It runs under self.lock, so it must
+        be quick and must not wait on other threads.
+        """
+        with self.lock:
+            self._state_listeners.append(listener)
+    
+    def _index_running(self, task: Task):
+        """Add a task to the running-by-priority heap"""
+        entry = [task.priority.rank, next(self._running_order), task.id]
+        self._running_entries[task.id] = entry
+        # Rebuild once stale entries outnumber the live ones
+        if len(self._running_heap) > 2 * len(self._running_entries) + 32:
+            self._running_heap = list(self._running_entries.values())
+            heapq.heapify(self._running_heap)
+        else:
+            heapq.heappush(self._running_heap, entry)
+    
+    def _unindex_running(self, task_id: str):
+        """Drop a task from the running-by-priority heap; its entry goes stale"""
+        self._running_entries.pop(task_id, None)
+    
+    def get_task_state_counts(self) -> Dict[TaskState, int]:
+        """Get the number of tasks in each state without scanning the tasks"""
+        with self.lock:
+            return {state: len(task_ids) for state, task_ids in self._by_state.items()}
+    
+    def get_tasks_in_state(self, state: TaskState) -> List[Task]:
+        """Get the tasks in a state without scanning the other tasks"""
+        with self.lock:
+            return [self.tasks[task_id] for task_id in self._by_state[state]]
+    
+    def _save_state(self, task_id: Optional[str] = None):
+        """
+        Schedule a save of the tasks state; see _persistence_loop.
+        
+        Args:
+            task_id: The task that changed, or None for changes to several
+        """
+        with self.lock:
+            if task_id is None:
+                self._full_save_needed = True
+            else:
+                self._changed_tasks.add(task_id)
+        self._dirty.set()
+    
+    def flush_state(self):
+        """Write the full tasks state to disk now, e.g. before shutting down"""
+        self._dirty.clear()
+        self._write_state(full=True)
+    
+    def _persistence_loop(self):
+        """Write the tasks state whenever it has been marked dirty"""
+        while True:
+            self._dirty.wait()
+            # Let the rest of a burst of changes land before writing
+            time.sleep(self.state_save_delay)
+            self._dirty.clear()
+            self._write_state()
+    
+    def _write_state(self, full: bool = False):
+        """
+        Save changes to the tasks state to disk.
+        
+        Each changed task is appended to tasks_state.journal as one JSON line
+        holding the whole task, or null once it has been deleted. The state
+        file is rewritten in full instead when asked to, when a change isn't
+        tied to one task, when there is no journal for the current state
+        file, or once the journal would pass journal_max_records. A full save
+        starts a new journal naming the new state file, so _load_state never
+        replays changes the state file already has.
+        
+        Tasks are encoded while self.lock is held; with orjson that is
+        straight from their dataclasses, skipping the Task.to_dict() copy.
+        The state file is written next to its final path and renamed over
+        it, so a reader or a crash never sees a partly written state.
+        
+        Args:
+            full: Rewrite the state file even if the changes could be journaled
+        """
+        state_file = self._state_file
+        journal_file = self._journal_file
+        try:
+            with self._save_lock:
+                with self.lock:
+                    changed = self._changed_tasks
+                    self._changed_tasks = set()
+                    full = (full or self._full_save_needed or self._journal_records is None
+                            or self._journal_records + len(changed) > self.journal_max_records)
+                    self._full_save_needed = False
+                    task_count = len(self.tasks)
+                    if not full:
+                        records = [self._journal_record(task_id) for task_id in changed]
+                    else:
+                        payload = json_dumps(self.tasks)
+                
+                if not full:
+                    if records:
+                        with open(journal_file, 'ab') as f:
+                            f.write(b''.join(records))
+                        self._journal_records += len(records)
+                    return
+                
+                # Compact output in one write; the state file is read back by
+                # _load_state, not by people
+                tmp_file = state_file + ".tmp"
+                with open(tmp_file, 'wb') as f:
+                    f.write(payload)
+                os.replace(tmp_file, state_file)
+                
+                header = json_dumps({"state_file": self._state_file_id(state_file)})
+                with open(journal_file + ".tmp", 'wb') as f:
+                    f.write(header + b'\n')
+                os.replace(journal_file + ".tmp", journal_file)
+                self._journal_records = 0
+            logger.info(f"Saved state with {task_count} tasks")
+        except Exception as e:
+            # Whatever reached disk, the next save rewrites everything
+            self._journal_records = None
             logger.error(f"Failed to save state: {str(e)}")
     
+    def _journal_record(self, task_id: str) -> bytes:
+        """Encode one journal line: the task as it is now, or null if deleted"""
+        return json_dumps({"id": task_id, "task": self.tasks.get(task_id)}) + b'\n'
+    
     def create_dockerfile(self, path: str, content: str) -> bool:
         """Create a Dockerfile at the specified path"""
         try:
@@ -92,27 +433,27 @@ class DockerManager:
     
     def edit_dockerfile(self, path: str, content: str) -> bool:
         """Edit an existing Dockerfile"""
-        if not os.path.exists(path):
-            logger.error(f"Dockerfile not found at {path}")
-            return False
-        
         try:
-            with open(path, 'w') as f:
+            # 'r+' fails on a missing file instead of creating it
+            with open(path, 'r+') as f:
                 f.write(content)
+                f.truncate()
             return True
+        except FileNotFoundError:
+            logger.error(f"Dockerfile not found at {path}")
+            return False
         except Exception as e:
             logger.error(f"Failed to edit Dockerfile: {str(e)}")
             return False
     
     def delete_dockerfile(self, path: str) -> bool:
         """Delete a Dockerfile"""
-        if not os.path.exists(path):
-            logger.error(f"Dockerfile not found at {path}")
-            return False
-        
         try:
             os.remove(path)
             return True
+        except FileNotFoundError:
+            logger.error(f"Dockerfile not found at {path}")
+            return False
         except Exception as e:
             logger.error(f"Failed to delete Dockerfile: {str(e)}")
             return False
@@ -124,7 +465,7 @@ class DockerManager:
             
             # If content is a dictionary, convert to YAML
             if isinstance(content, dict):
-                content = yaml.dump(content)
+                content = _dump_compose_yaml(content)
                 
             with open(path, 'w') as f:
                 f.write(content)
@@ -135,71 +476,121 @@ class DockerManager:
     
     def edit_compose_file(self, path: str, content: Union[str, Dict]) -> bool:
         """Edit an existing docker-compose.yml file"""
-        if not os.path.exists(path):
-            logger.error(f"Compose file not found at {path}")
-            return False
-        
         try:
             # If content is a dictionary, convert to YAML
             if isinstance(content, dict):
-                content = yaml.dump(content)
+                content = _dump_compose_yaml(content)
                 
-            with open(path, 'w') as f:
+            # 'r+' fails on a missing file instead of creating it
+            with open(path, 'r+') as f:
                 f.write(content)
+                f.truncate()
             return True
+        except FileNotFoundError:
+            logger.error(f"Compose file not found at {path}")
+            return False
         except Exception as e:
             logger.error(f"Failed to edit compose file: {str(e)}")
             return False
     
     def delete_compose_file(self, path: str) -> bool:
         """Delete a docker-compose.yml file"""
-        if not os.path.exists(path):
-            logger.error(f"Compose file not found at {path}")
-            return False
-        
         try:
             os.remove(path)
             return True
+        except FileNotFoundError:
+            logger.error(f"Compose file not found at {path}")
+            return False
         except Exception as e:
             logger.error(f"Failed to delete compose file: {str(e)}")
             return False
     
     def list_containers(self) -> List[Dict]:
-        """List all containers managed by this orchestrator"""
+        """
+        List all containers managed by this orchestrator.
+        
+        The result is cached for container_cache_ttl seconds, or until a
+        task changes state.
+        """
+        if time.monotonic() - self._containers_cached_at < self.container_cache_ttl:
+            return self._containers_cache
+        
         try:
+            tasks = self._tasks_snapshot
+            
+            # One listing returns every task container's ID, names and state
+            # in a single daemon call, as raw dicts rather than Container
+            # objects. Task containers are all named task_<task ID>; older
+            # ones predate the orchestrator label, so filter by name.
+            by_id = {c['Id']: c for c in self.api.containers(all=True, filters={'name': 'task_'})}
+            
             containers = []
-            for task_id, task in self.tasks.items():
+            for task_id, task in tasks:
                 if task.container_id:
-                    try:
-                        container = self.client.containers.get(task.container_id)
-                        containers.append({
-                            'id': container.id,
-                            'name': container.name,
-                            'status': container.status,
-                            'task_id': task_id,
-                            'task_name': task.name,
-                            'priority': task.priority,
-                        })
-                    except docker.errors.NotFound:
+                    container = by_id.get(task.container_id)
+                    if container is None:
                         # Container no longer exists
                         logger.warning(f"Container {task.container_id} for task {task_id} not found")
                         task.container_id = None
+                        continue
+                    
+                    names = container.get('Names') or ['']
+                    containers.append({
+                        'id': container['Id'],
+                        'name': names[0].lstrip('/'),
+                        'status': container['State'],
+                        'task_id': task_id,
+                        'task_name': task.name,
+                        'priority': task.priority.value,
+                    })
             
+            self._containers_cache = containers
+            self._containers_cached_at = time.monotonic()
             return containers
         except Exception as e:
             logger.error(f"Failed to list containers: {str(e)}")
             return []
     
-    def get_container_logs(self, container_id: str, tail: int = 100) -> str:
-        """Get logs from a container"""
+    def get_container_logs(self, container_id: str, tail: int = 100,
+                           since: Optional[float] = None) -> str:
+        """
+        Get logs from a container.
+        
+        Args:
+            container_id: Container ID or name
+            tail: Number of lines to return
+            since: Only return logs newer than this Unix timestamp
+        """
         try:
-            container = self.client.containers.get(container_id)
-            logs = container.logs(tail=tail).decode('utf-8')
-            return logs
+            kwargs = {'since': since} if since is not None else {}
+            logs = self.api.logs(container_id, tail=tail, **kwargs)
+            # A multi-byte character split by the daemon shouldn't fail the request
+            return logs.decode('utf-8', errors='replace')
         except Exception as e:
             logger.error(f"Failed to get container logs: {str(e)}")
             return f"Error retrieving logs: {str(e)}"
     
+    def get_container_logs_iter(self, container_id: str, tail: int = 100, follow: bool = False,
+                                since: Optional[float] = None) -> Iterator[bytes]:
+        """
+        Get logs from a container as a stream of byte chunks.
+        
+        The request is made immediately, so a missing container is reported
+        before the caller starts consuming the stream.
+        
+        Args:
+            container_id: Container ID or name
+            tail: Number of lines to start from
+            follow: Keep streaming new output until the container stops
+            since: Only return logs newer than this Unix timestamp
+        """
+        try:
+            kwargs = {'since': since} if since is not None else {}
+            return self.api.logs(container_id, stream=True, follow=follow, tail=tail, **kwargs)
+        except Exception as e:
+            logger.error(f"Failed to get container logs: {str(e)}")
+            return iter([f"Error retrieving logs: {str(e)}".encode('utf-8')])
+    
     def create_task(self, name: str, priority: Priority, resources: ResourceRequirements,
                  dockerfile_content: str = None, dockerfile_path: str = None,
                  compose_content: str = None, compose_path: str = None) -> str:
@@ -209,9 +600,7 @@ class DockerManager:
         Returns:
             str: The ID of the created task
         """
-        from uuid import uuid4
-        
-        task_id = str(uuid4())
+        task_id = uuid4().hex
         task = Task(
             id=task_id,
             name=name,
@@ -223,10 +612,22 @@ class DockerManager:
             compose_content=compose_content
         )
         
+        if dockerfile_path:
+            # Parse the base image now so starting the task doesn't read the file
+            try:
+                self._get_task_image(task)
+            except OSError:
+                pass
+        
         with self.lock:
             self.tasks[task_id] = task
-            self._save_state()
-            
+            self._by_state[task.state].add(task_id)
+            self._tasks_snapshot = tuple(self.tasks.items())
+            for listener in self._state_listeners:
+                listener(task)
+        self._save_state(task_id)
+        
+        with self.lock:
             # If priority is high or critical, reschedule to accommodate
             if priority in [Priority.HIGH, Priority.CRITICAL]:
                 self._reschedule_if_needed(task_id)
@@ -247,23 +648,29 @@ class DockerManager:
         required_resources = self._calculate_required_resources(new_task)
         
         if not self._has_sufficient_resources(available_resources, required_resources):
-            # Find candidate tasks to pause
-            candidate_tasks = []
-            for task_id, task in self.tasks.items():
-                if task.state == TaskState.RUNNING and task.priority.value < new_task.priority.value:
-                    candidate_tasks.append((task_id, task))
-            
-            # Sort by priority (lowest first)
-            candidate_tasks.sort(key=lambda x: x[1].priority.value)
-            
-            # Pause tasks until we have enough resources
-            for task_id, _ in candidate_tasks:
-                self._checkpoint_and_stop_task(task_id)
+            # Pause running tasks of lower priority, lowest first, until we
+            # have enough resources
+            new_rank = new_task.priority.rank
+            heap = self._running_heap
+            kept = []
+            while heap and heap[0][0] < new_rank:
+                entry = heapq.heappop(heap)
+                task_id = entry[2]
+                if self._running_entries.get(task_id) is not entry:
+                    continue
+                if not self._checkpoint_and_stop_task(task_id):
+                    kept.append(entry)
+                    continue
                 
                 # Check if we now have enough resources
                 available_resources = self._get_available_resources()
                 if self._has_sufficient_resources(available_resources, required_resources):
                     break
+            
+            # Tasks that could not be paused are still running
+            for entry in kept:
+                if self._running_entries.get(entry[2]) is entry:
+                    heapq.heappush(self._running_heap, entry)
     
     def _checkpoint_and_stop_task(self, task_id: str) -> bool:
         """
@@ -280,23 +687,25 @@ class DockerManager:
             return False
         
         try:
-            container = self.client.containers.get(task.container_id)
-            
             # Create checkpoint directory if it doesn't exist
-            checkpoint_dir = os.path.join(self.state_dir, "checkpoints", task_id)
-            os.makedirs(checkpoint_dir, exist_ok=True)
-            
-            # Generate checkpoint
-            container.pause()
-            
-            # Update task state
-            task.state = TaskState.PAUSED
-            task.checkpoint_path = checkpoint_dir
+            checkpoint_dir = os.path.join(self._checkpoints_dir, task_id)
+            try:
+                os.mkdir(checkpoint_dir)
+            except FileExistsError:
+                pass
             
-            # Stop container
-            container.stop(timeout=10)
+            # Stop container; one call by ID, without fetching it first
+            self._stopping.add(task_id)
+            try:
+                self.api.stop(task.container_id, timeout=10)
+                
+                # Update task state
+                self._set_task_state(task, TaskState.PAUSED)
+                task.checkpoint_path = checkpoint_dir
+            finally:
+                self._stopping.discard(task_id)
             
-            self._save_state()
+            self._save_state(task_id)
             return True
         except Exception as e:
             logger.error(f"Failed to checkpoint and stop task {task_id}: {str(e)}")
@@ -325,19 +734,11 @@ class DockerManager:
                 logger.warning(f"Not enough resources to resume task {task_id}")
                 return False
             
-            # Create a new container
-            container_config = {
-                "image": self._get_task_image(task),
-                "name": f"task_{task_id}",
-                "detach": True,
-                "cpu_shares": task.resources.cpu_shares,
-                "mem_limit": task.resources.memory,
-                "memswap_limit": task.resources.memory_swap,
-            }
-            
-            container = self.client.containers.run(**container_config)
+            # Create a new container from the image the task first started with
+            image_name = task.resolved_image or self._get_task_image(task)
+            container = self.client.containers.run(**self._build_container_config(task, image_name))
             task.container_id = container.id
-            task.state = TaskState.RUNNING
+            self._set_task_state(task, TaskState.RUNNING)
             task.started_at = time.time()
             
             # Restore from checkpoint if available
@@ -345,7 +746,7 @@ class DockerManager:
                 # Restore checkpoint (implementation depends on Docker version)
                 pass
             
-            self._save_state()
+            self._save_state(task_id)
             return True
         except Exception as e:
             logger.error(f"Failed to resume task {task_id}: {str(e)}")
@@ -365,16 +766,40 @@ class DockerManager:
         # the image from the Dockerfile or extract it from the docker-compose.yml
         if task.dockerfile_path:
             # Build from Dockerfile
-            with open(task.dockerfile_path, 'r') as f:
-                content = f.read()
-                # Extract base image
-                for line in content.split('\n'):
-                    if line.strip().startswith('FROM '):
-                        return line.strip().split(' ')[1]
+            key = (task.dockerfile_path, os.stat(task.dockerfile_path).st_mtime_ns)
+            image = self._image_cache.get(key)
+            if image is None:
+                with open(task.dockerfile_path, 'r') as f:
+                    # Extract base image
+                    match = self._FROM_RE.search(f.read())
+                image = match.group(1) if match else "alpine:latest"
+                self._image_cache[key] = image
+            return image
         
         # Default to a base image
         return "alpine:latest"
     
+    def _build_container_config(self, task: Task, image_name: str) -> Dict:
+        """
+        Build the containers.run() arguments for a task.
+        
+        Args:
+            task: The task
+            image_name: The image to run
+            
+        Returns:
+            Dict: Container configuration
+        """
+        return {
+            "image": image_name,
+            "name": f"task_{task.id}",
+            "detach": True,
+            "cpu_shares": task.resources.cpu_shares,
+            "mem_limit": task.resources.memory,
+            "memswap_limit": task.resources.memory_swap,
+            "labels": {"orchestrator": "docker_orcha", "task_id": task.id},
+        }
+    
     def start_task(self, task_id: str) -> bool:
         """
         Start a task.
@@ -406,8 +831,11 @@ class DockerManager:
                 self.client.images.build(path=build_path, tag=image_name, quiet=False)
             elif task.dockerfile_content:
                 # Create temporary Dockerfile
-                temp_dir = os.path.join(self.state_dir, "dockerfiles", task_id)
-                os.makedirs(temp_dir, exist_ok=True)
+                temp_dir = os.path.join(self._dockerfiles_dir, task_id)
+                try:
+                    os.mkdir(temp_dir)
+                except FileExistsError:
+                    pass
                 
                 with open(os.path.join(temp_dir, "Dockerfile"), 'w') as f:
                     f.write(task.dockerfile_content)
@@ -422,26 +850,19 @@ class DockerManager:
                 pass
             
             # Create and start the container
-            container_config = {
-                "image": image_name or self._get_task_image(task),
-                "name": f"task_{task_id}",
-                "detach": True,
-                "cpu_shares": task.resources.cpu_shares,
-                "mem_limit": task.resources.memory,
-                "memswap_limit": task.resources.memory_swap,
-            }
-            
-            container = self.client.containers.run(**container_config)
+            image_name = image_name or self._get_task_image(task)
+            container = self.client.containers.run(**self._build_container_config(task, image_name))
+            task.resolved_image = image_name
             task.container_id = container.id
-            task.state = TaskState.RUNNING
+            self._set_task_state(task, TaskState.RUNNING)
             task.started_at = time.time()
             
-            self._save_state()
+            self._save_state(task_id)
             return True
         except Exception as e:
             logger.error(f"Failed to start task {task_id}: {str(e)}")
-            task.state = TaskState.FAILED
-            self._save_state()
+            self._set_task_state(task, TaskState.FAILED)
+            self._save_state(task_id)
             return False
     
     def stop_task(self, task_id: str, checkpoint: bool = True) -> bool:
@@ -464,12 +885,16 @@ class DockerManager:
         
         try:
             container = self.client.containers.get(task.container_id)
-            container.stop(timeout=10)
-            
-            task.state = TaskState.PAUSED
-            task.completed_at = time.time()
+            self._stopping.add(task_id)
+            try:
+                container.stop(timeout=10)
+                
+                self._set_task_state(task, TaskState.PAUSED)
+                task.completed_at = time.time()
+            finally:
+                self._stopping.discard(task_id)
             
-            self._save_state()
+            self._save_state(task_id)
             return True
         except Exception as e:
             logger.error(f"Failed to stop task {task_id}: {str(e)}")
@@ -489,6 +914,8 @@ class DockerManager:
         if not task:
             return False
         
+        # Keep exit detectors from finishing the task while we stop its container
+        self._stopping.add(task_id)
         try:
             # Stop the container if it's running
             if task.state == TaskState.RUNNING and task.container_id:
@@ -502,17 +929,23 @@ class DockerManager:
             # Remove the task from the state
             with self.lock:
                 del self.tasks[task_id]
-                self._save_state()
+                self._by_state[task.state].discard(task_id)
+                self._unindex_running(task_id)
+                self._tasks_snapshot = tuple(self.tasks.items())
+                self._containers_cached_at = 0.0
+            self._save_state(task_id)
             
             # Clean up any resources
-            if task.checkpoint_path and os.path.exists(task.checkpoint_path):
+            if task.checkpoint_path:
                 import shutil
-                shutil.rmtree(task.checkpoint_path)
+                shutil.rmtree(task.checkpoint_path, ignore_errors=True)
             
             return True
         except Exception as e:
             logger.error(f"Failed to delete task {task_id}: {str(e)}")
             return False
+        finally:
+            self._stopping.discard(task_id)
     
     def update_task_resources(self, task_id: str, resources: ResourceRequirements) -> bool:
         """
@@ -546,7 +979,7 @@ class DockerManager:
                 task.resources = old_resources
                 return False
         
-        self._save_state()
+        self._save_state(task_id)
         return True
     
     def list_tasks(self, status_filter: Optional[TaskState] = None) -> List[Dict]:
@@ -560,7 +993,7 @@ class DockerManager:
             List[Dict]: List of task dictionaries
         """
         result = []
-        for task in self.tasks.values():
+        for _, task in self._tasks_snapshot:
             if status_filter is None or task.state == status_filter:
                 result.append(task.to_dict())
         return result
@@ -574,11 +1007,10 @@ class DockerManager:
         """
         try:
             # Get all running tasks
-            running_tasks = [(task_id, task) for task_id, task in self.tasks.items() 
-                            if task.state == TaskState.RUNNING]
+            running_tasks = [(task.id, task) for task in self.get_tasks_in_state(TaskState.RUNNING)]
             
-            # Sort by priority (highest first)
-            running_tasks.sort(key=lambda x: x[1].priority.value, reverse=True)
+            # Sort by priority (highest first), oldest first within a priority
+            running_tasks.sort(key=lambda x: (x[1].priority.rank, -x[1].created_at), reverse=True)
             
             # Calculate total resources
             available_resources = self._get_system_resources()
@@ -589,34 +1021,31 @@ class DockerManager:
                 return True
             
             # Simple allocation strategy: higher priority gets more resources
+            updates = []
             for i, (task_id, task) in enumerate(running_tasks):
                 priority_weight = (4 - i % 4) / 10  # Simple weighting based on priority
                 
-                # Adjust container resources
                 if task.container_id:
-                    try:
-                        container = self.client.containers.get(task.container_id)
-                        
-                        # Calculate new resource limits
-                        cpu_shares = int(1024 * priority_weight)
-                        memory = f"{int(available_resources['memory'] * priority_weight)}m"
-                        memory_swap = f"{int(available_resources['memory_swap'] * priority_weight)}m"
-                        
-                        # Update container
-                        container.update(
-                            cpu_shares=cpu_shares,
-                            mem_limit=memory,
-                            memswap_limit=memory_swap
-                        )
-                        
-                        # Update task resources
-                        task.resources = ResourceRequirements(
-                            cpu_shares=cpu_shares,
-                            memory=memory,
-                            memory_swap=memory_swap
-                        )
-                    except Exception as e:
-                        logger.error(f"Failed to update container {task.container_id}: {str(e)}")
+                    # Calculate new resource limits
+                    cpu_shares = int(1024 * priority_weight)
+                    memory = f"{int(available_resources['memory'] * priority_weight)}m"
+                    memory_swap = f"{int(available_resources['memory_swap'] * priority_weight)}m"
+                    updates.append((task, ResourceRequirements(
+                        cpu_shares=cpu_shares,
+                        memory=memory,
+                        memory_swap=memory_swap
+                    )))
+            
+            # Adjust container resources; each update is a round trip to the
+            # Docker daemon, so send them concurrently
+            if updates:
+                with ThreadPoolExecutor(max_workers=min(16, len(updates))) as executor:
+                    results = list(executor.map(self._apply_container_update, updates))
+                
+                # Update task resources where the container accepted them
+                for (task, resources), updated in zip(updates, results):
+                    if updated:
+                        task.resources = resources
             
             self._save_state()
             return True
@@ -624,6 +1053,29 @@ class DockerManager:
             logger.error(f"Failed to rebalance resources: {str(e)}")
             return False
     
+    def _apply_container_update(self, update) -> bool:
+        """
+        Apply new resource limits to a task's container.
+        
+        Args:
+            update: The task and its new resource requirements
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        task, resources = update
+        try:
+            container = self.client.containers.get(task.container_id)
+            container.update(
+                cpu_shares=resources.cpu_shares,
+                mem_limit=resources.memory,
+                memswap_limit=resources.memory_swap
+            )
+            return True
+        except Exception as e:
+            logger.error(f"Failed to update container {task.container_id}: {str(e)}")
+            return False
+    
     def _get_available_resources(self) -> Dict:
         """
         Get available system resources.
@@ -664,42 +1116,13 @@ class DockerManager:
         Returns:
             Dict: Required resources
         """
-        # Convert memory string to bytes
-        memory_bytes = self._parse_memory_string(task.resources.memory)
-        memory_swap_bytes = self._parse_memory_string(task.resources.memory_swap)
-        
+        resources = task.resources
         return {
-            "cpu": task.resources.cpu_shares / 1024,  # Approximate CPU cores
-            "memory": memory_bytes,
-            "memory_swap": memory_swap_bytes,
+            "cpu": resources.cpu_shares / 1024,  # Approximate CPU cores
+            "memory": resources.memory_bytes,
+            "memory_swap": resources.memory_swap_bytes,
         }
     
-    def _parse_memory_string(self, memory_str: str) -> int:
-        """
-        Parse a memory string (e.g., "1g", "512m") to bytes.
-        
-        Args:
-            memory_str: The memory string
-            
-        Returns:
-            int: Memory in bytes
-        """
-        if not memory_str:
-            return 0
-        
-        memory_str = memory_str.lower()
-        if memory_str.endswith('k'):
-            return int(memory_str[:-1]) * 1024
-        elif memory_str.endswith('m'):
-            return int(memory_str[:-1]) * 1024 * 1024
-        elif memory_str.endswith('g'):
-            return int(memory_str[:-1]) * 1024 * 1024 * 1024
-        else:
-            try:
-                return int(memory_str)
-            except ValueError:
-                return 0
-    
     def _has_sufficient_resources(self, available: Dict, required: Dict) -> bool:
         """
         Check if there are sufficient resources to satisfy requirements.
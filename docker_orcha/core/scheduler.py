@@ -6,9 +6,11 @@ Docker containers based on their priority and resource requirements.
 """
 
 import time
+import heapq
+import queue
 import logging
 import threading
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Set, Tuple
 
 from docker_orcha.models.enums import TaskState, Priority
 from docker_orcha.models.task import Task
@@ -33,6 +35,70 @@ class JobScheduler:
         self.running = False
         self.thread = None
         self.check_interval = 5  # seconds
+        self.optimize_interval = 300  # seconds
+        self._next_optimize_at = time.monotonic() + self.optimize_interval
+        # Set when there may be work before the next check is due; see notify()
+        self._wake = threading.Event()
+        
+        # Pending tasks as a min-heap of (-priority rank, created_at, task_id),
+        # so the highest priority, oldest task is on top. Tasks that have
+        # left PENDING are dropped when popped; the set keeps a task from
+        # being queued twice.
+        self._pending_lock = threading.Lock()
+        self._pending_heap: List[Tuple[int, float, str]] = []
+        self._pending_set: Set[str] = set()
+        
+        # Container exits reported by the Docker events stream, as
+        # (task_id, container_id, exit code), and the running task behind
+        # each container. While the stream is down, running tasks are polled.
+        self._exits: "queue.Queue[Tuple[str, str, int]]" = queue.Queue()
+        self._container_tasks: Dict[str, str] = {}
+        self._events_thread = None
+        self._events_stream = None
+        self._events_connected = False
+        self._resync = False
+        
+        docker_manager.add_state_listener(self._on_task_state)
+        with docker_manager.lock:
+            for task in docker_manager.tasks.values():
+                self._on_task_state(task)
+    
+    def enqueue_pending(self, task_id: str):
+        """
+        Queue a pending task to be started.
+        
+        Args:
+            task_id: The ID of the task
+        """
+        task = self.docker_manager.tasks.get(task_id)
+        if not task:
+            return
+        
+        with self._pending_lock:
+            if task_id not in self._pending_set:
+                self._pending_set.add(task_id)
+                heapq.heappush(self._pending_heap, (-task.priority_rank, task.created_at, task_id))
+    
+    def notify(self):
+        """Wake the scheduler loop to run a pass now instead of at the next interval."""
+        self._wake.set()
+    
+    def _on_task_state(self, task: Task):
+        """
+        State listener registered with the Docker manager.
+        
+        A new pending task, or a task that stopped running and freed its
+        resources, wakes the scheduler.
+        """
+        if task.state == TaskState.PENDING:
+            self.enqueue_pending(task.id)
+        elif task.state == TaskState.RUNNING:
+            if task.container_id:
+                self._container_tasks[task.container_id] = task.id
+            return
+        elif task.container_id:
+            self._container_tasks.pop(task.container_id, None)
+        self.notify()
     
     def start(self):
         """Start the scheduler."""
@@ -42,6 +108,8 @@ class JobScheduler:
         self.running = True
         self.thread = threading.Thread(target=self._scheduler_loop, daemon=True)
         self.thread.start()
+        self._events_thread = threading.Thread(target=self._events_loop, daemon=True)
+        self._events_thread.start()
         logger.info("Scheduler started")
         return True
     
@@ -51,9 +119,16 @@ class JobScheduler:
             return
         
         self.running = False
+        self.notify()
+        stream = self._events_stream
+        if stream is not None:
+            stream.close()
         if self.thread:
             self.thread.join(timeout=10)
             self.thread = None
+        if self._events_thread:
+            self._events_thread.join(timeout=10)
+            self._events_thread = None
         
         logger.info("Scheduler stopped")
         return True
@@ -61,6 +136,7 @@ class JobScheduler:
     def _scheduler_loop(self):
         """Main scheduler loop."""
         while self.running:
+            self._wake.clear()
             try:
                 # Process pending tasks
                 self._process_pending_tasks()
@@ -68,108 +144,149 @@ class JobScheduler:
                 # Check running tasks
                 self._check_running_tasks()
                 
-                # Optimize resource allocation
-                self._optimize_resource_allocation()
+                # Optimize resource allocation every optimize_interval seconds
+                now = time.monotonic()
+                if now >= self._next_optimize_at:
+                    self._next_optimize_at = now + self.optimize_interval
+                    self._optimize_resource_allocation()
             except Exception as e:
                 logger.error(f"Error in scheduler loop: {str(e)}")
             
-            # Sleep for the check interval
-            time.sleep(self.check_interval)
+            # Sleep for the check interval, or until notified
+            self._wake.wait(self.check_interval)
     
     def _process_pending_tasks(self):
-        """Process pending tasks."""
-        # Get all pending tasks
-        pending_tasks = []
-        for task_id, task in self.docker_manager.tasks.items():
-            if task.state == TaskState.PENDING:
-                pending_tasks.append((task_id, task))
-        
-        # Sort by priority (highest first) and creation time (oldest first)
-        pending_tasks.sort(key=lambda x: (
-            -x[1].priority.value,  # Negative because we want highest priority first
-            x[1].created_at
-        ))
-        
-        # Try to start each task
-        for task_id, _ in pending_tasks:
-            # Check if we have sufficient resources
-            if self._has_sufficient_resources(task_id):
-                self.docker_manager.start_task(task_id)
-    
-    def _has_sufficient_resources(self, task_id: str) -> bool:
         """
-        Check if there are sufficient resources to start a task.
+        Process pending tasks.
         
-        Args:
-            task_id: The ID of the task to check
+        Tasks are started highest priority first, oldest first within a
+        priority. Once one can't be started, it is queued again and the rest
+        wait for the next pass.
+        
+        Available resources are read once per pass; each task started is
+        taken off the local copy rather than asking the manager again.
+        """
+        docker_manager = self.docker_manager
+        tasks = docker_manager.tasks
+        available = None
+        while True:
+            with self._pending_lock:
+                if not self._pending_heap:
+                    return
+                _, _, task_id = heapq.heappop(self._pending_heap)
+                self._pending_set.discard(task_id)
             
-        Returns:
-            bool: True if there are sufficient resources
+            task = tasks.get(task_id)
+            if not task or task.state != TaskState.PENDING:
+                continue
+            
+            if available is None:
+                available = docker_manager._get_available_resources()
+            
+            # Check if we have sufficient resources
+            required = docker_manager._calculate_required_resources(task)
+            if docker_manager._has_sufficient_resources(available, required):
+                if docker_manager.start_task(task_id):
+                    available = {key: available[key] - required[key] for key in available}
+                    continue
+                if task.state != TaskState.PENDING:
+                    continue
+            
+            # Still pending; try again on the next pass
+            self.enqueue_pending(task_id)
+            return
+    
+    def _events_loop(self):
+        """Queue the exits of task containers reported by the Docker events stream."""
+        while self.running:
+            try:
+                self._events_stream = self.docker_manager.client.events(
+                    filters={'type': 'container', 'event': ['die', 'destroy']},
+                    decode=True
+                )
+                # Containers that exited before the stream connected are
+                # picked up by one more poll
+                self._resync = True
+                self._events_connected = True
+                
+                for event in self._events_stream:
+                    actor = event.get('Actor', {})
+                    container_id = actor.get('ID')
+                    task_id = self._container_tasks.get(container_id)
+                    if task_id is None:
+                        continue
+                    
+                    if event.get('Action') == 'die':
+                        exit_code = int(actor.get('Attributes', {}).get('exitCode', -1))
+                    else:
+                        # Removed while we still had it as running
+                        exit_code = -1
+                    self._exits.put((task_id, container_id, exit_code))
+                    self.notify()
+            except Exception as e:
+                if self.running:
+                    logger.error(f"Docker events stream failed, polling running tasks: {str(e)}")
+            finally:
+                self._events_connected = False
+                self._events_stream = None
+            
+            if self.running:
+                time.sleep(self.check_interval)
+    
+    def _check_running_tasks(self):
         """
-        task = self.docker_manager.tasks.get(task_id)
-        if not task:
-            return False
+        Check the status of running tasks.
         
-        # Get available resources
-        available_resources = self.docker_manager._get_available_resources()
-        
-        # Calculate required resources
-        required_resources = self.docker_manager._calculate_required_resources(task)
+        Exits queued from the events stream are applied. Containers are only
+        polled while the stream is down, and once after it connects.
+        """
+        if not self._events_connected or self._resync:
+            self._resync = False
+            self._poll_running_tasks()
         
-        # Check if there are sufficient resources
-        return self.docker_manager._has_sufficient_resources(available_resources, required_resources)
+        while True:
+            try:
+                task_id, container_id, exit_code = self._exits.get_nowait()
+            except queue.Empty:
+                break
+            self.docker_manager._record_exit(task_id, container_id, exit_code)
     
-    def _check_running_tasks(self):
-        """Check the status of running tasks."""
-        for task_id, task in list(self.docker_manager.tasks.items()):
-            if task.state == TaskState.RUNNING and task.container_id:
+    def _poll_running_tasks(self):
+        """Check the status of each running task's container."""
+        docker_manager = self.docker_manager
+        for task in docker_manager.get_tasks_in_state(TaskState.RUNNING):
+            container_id = task.container_id
+            if container_id:
                 try:
                     # Get container status
-                    container = self.docker_manager.client.containers.get(task.container_id)
-                    status = container.status
+                    container = docker_manager.client.containers.get(container_id)
                     
                     # If the container has exited, update the task state
-                    if status == 'exited':
+                    if container.status == 'exited':
                         exit_code = container.attrs.get('State', {}).get('ExitCode', -1)
-                        if exit_code == 0:
-                            task.state = TaskState.COMPLETED
-                        else:
-                            task.state = TaskState.FAILED
-                        
-                        task.completed_at = time.time()
-                        self.docker_manager._save_state()
+                        docker_manager._record_exit(task.id, container_id, exit_code)
                 except Exception as e:
-                    logger.error(f"Error checking container {task.container_id}: {str(e)}")
+                    logger.error(f"Error checking container {container_id}: {str(e)}")
                     # If the container no longer exists, mark the task as failed
-                    task.state = TaskState.FAILED
-                    task.completed_at = time.time()
-                    self.docker_manager._save_state()
+                    docker_manager._record_exit(task.id, container_id, -1)
     
     def _optimize_resource_allocation(self):
         """Optimize resource allocation based on task priorities."""
-        # Only run optimization every 5 minutes
-        if int(time.time()) % 300 < self.check_interval:
-            # Get all running tasks
-            running_tasks = [(task_id, task) for task_id, task in self.docker_manager.tasks.items() 
-                           if task.state == TaskState.RUNNING]
-            
-            # If there are no running tasks, nothing to optimize
-            if not running_tasks:
-                return
-            
-            # Check if rebalancing is needed
-            need_rebalancing = False
-            
-            # Check for critical tasks that might need more resources
-            critical_tasks = [t for _, t in running_tasks if t.priority == Priority.CRITICAL]
-            if critical_tasks:
-                need_rebalancing = True
-            
-            # Check for high priority tasks that might need more resources
-            high_priority_tasks = [t for _, t in running_tasks if t.priority == Priority.HIGH]
-            if high_priority_tasks and len(running_tasks) > len(high_priority_tasks):
-                need_rebalancing = True
-            
-            # If rebalancing is needed, do it
-            if need_rebalancing:
-                self.docker_manager.rebalance_resources() 
\ No newline at end of file
+        # Count running tasks by priority in one pass
+        running = high_priority = 0
+        has_critical = False
+        for task in self.docker_manager.get_tasks_in_state(TaskState.RUNNING):
+            running += 1
+            if task.priority is Priority.CRITICAL:
+                has_critical = True
+            elif task.priority is Priority.HIGH:
+                high_priority += 1
+        
+        # If there are no running tasks, nothing to optimize
+        if not running:
+            return
+        
+        # Rebalance if critical tasks, or high priority tasks sharing with
+        # lower priority ones, might need more resources
+        if has_critical or 0 < high_priority < running:
+            self.docker_manager.rebalance_resources() 
\ No newline at end of file
@@ -11,6 +11,11 @@ class Priority(str, Enum):
     MEDIUM = "medium"
     HIGH = "high"
     CRITICAL = "critical"
+    
+    @property
+    def rank(self) -> int:
+        """Numeric level for ordering; the values themselves sort alphabetically."""
+        return _PRIORITY_RANKS[self]
 
 
 class TaskState(str, Enum):
@@ -19,4 +24,12 @@ class TaskState(str, Enum):
     RUNNING = "running"
     PAUSED = "paused"
     COMPLETED = "completed"
-    FAILED = "failed" 
\ No newline at end of file
+    FAILED = "failed"
+
+
+_PRIORITY_RANKS = {
+    Priority.LOW: 0,
+    Priority.MEDIUM: 1,
+    Priority.HIGH: 2,
+    Priority.CRITICAL: 3,
+}
@@ -2,7 +2,33 @@
 Resource requirement models for Docker containers.
 """
 
+import re
 from dataclasses import dataclass
+from functools import lru_cache
+
+
+_MEMORY_RE = re.compile(r'(\d+)([kmg]?)')
+_MEMORY_UNITS = {'': 1, 'k': 1024, 'm': 1024 * 1024, 'g': 1024 * 1024 * 1024}
+
+
+@lru_cache(maxsize=None)
+def parse_memory_string(memory_str: str) -> int:
+    """
+    Parse a memory string (e.g., "1g", "512m") to bytes.
+    
+    Results are cached; tasks share a handful of distinct values. Anything
+    that isn't a whole number with an optional k/m/g unit parses as 0.
+    
+    Args:
+        memory_str: The memory string
+        
+    Returns:
+        int: Memory in bytes
+    """
+    match = _MEMORY_RE.fullmatch(memory_str.lower()) if memory_str else None
+    if match is None:
+        return 0
+    return int(match.group(1)) * _MEMORY_UNITS[match.group(2)]
 
 
 @dataclass
@@ -22,4 +48,16 @@ class ResourceRequirements:
         if isinstance(self.memory_swap, str):
             # Ensure memory_swap value has a unit
             if self.memory_swap.isdigit():
-                self.memory_swap = f"{self.memory_swap}m" 
\ No newline at end of file
+                self.memory_swap = f"{self.memory_swap}m"
+    
+    # Plain properties rather than cached attributes: anything stored on the
+    # instance would be written to the state file along with the fields
+    @property
+    def memory_bytes(self) -> int:
+        """Memory limit in bytes."""
+        return parse_memory_string(self.memory)
+    
+    @property
+    def memory_swap_bytes(self) -> int:
+        """Memory plus swap limit in bytes."""
+        return parse_memory_string(self.memory_swap)
\ No newline at end of file
@@ -3,7 +3,7 @@ Task model for the Docker Orchestration System.
 """
 
 import time
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from typing import Dict, Optional
 
 from docker_orcha.models.enums import Priority, TaskState
@@ -30,7 +30,20 @@ class Task:
     created_at: float = field(default_factory=time.time)
     started_at: Optional[float] = None
     completed_at: Optional[float] = None
+    resolved_image: Optional[str] = None  # Image the task's container was first started from
+    
+    @property
+    def priority_rank(self) -> int:
+        """Numeric priority for ordering; higher is more important."""
+        return self.priority.rank
     
     def to_dict(self) -> Dict:
-        """Convert task to dictionary representation."""
-        return asdict(self) 
\ No newline at end of file
+        """
+        Convert task to dictionary representation.
+        
+        Equivalent to asdict(self), without its recursive deep copy: every
+        field is a scalar or enum apart from resources, which is flat too.
+        """
+        data = self.__dict__.copy()
+        data['resources'] = self.resources.__dict__.copy()
+        return data 
\ No newline at end of file
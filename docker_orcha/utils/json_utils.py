@@ -0,0 +1,55 @@
+"""
+JSON utilities for the Docker Orchestration System.
+
+orjson is used when it is installed, falling back to the standard json
+module; both produce the same compact documents.
+"""
+
+import dataclasses
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _default(obj: Any) -> Any:
+    """Encode the dataclasses json doesn't know, as orjson does."""
+    to_dict = getattr(obj, 'to_dict', None)
+    if to_dict is not None:
+        return to_dict()
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Serialize obj to compact JSON.
+
+    Dataclasses are encoded as objects, enums as their values and non-string
+    dict keys as strings.
+
+    Args:
+        obj: The object to serialize
+
+    Returns:
+        bytes: UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_DATACLASS)
+    return json.dumps(obj, separators=(',', ':'), default=_default).encode('utf-8')
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Deserialize a JSON document.
+
+    Raises:
+        ValueError: If data is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Test Suite for the Docker Orchestration API routes
+
+These tests drive the Flask app through its test client: the /api/_batch
+endpoint and the ?fields= projection of list endpoints. The API runs on a
+real DockerManager with a stubbed Docker client and a temporary state
+directory, so no Docker daemon is needed.
+
+Usage:
+  python test_api_routes.py
+
+Requirements:
+  - flask
+  - pytest
+"""
+
+import shutil
+import tempfile
+import unittest
+import pytest
+from unittest.mock import patch
+
+pytest.importorskip("flask")
+
+from testing_utils import make_manager
+from docker_orcha.api import routes
+from docker_orcha.models.enums import Priority
+from docker_orcha.models.resources import ResourceRequirements
+
+
+class TestAPIRoutes(unittest.TestCase):
+    """Test cases for the batch endpoint and field projection"""
+
+    def setUp(self):
+        """Set up a manager with two tasks behind the API"""
+        self.state_dir = tempfile.mkdtemp(prefix="orcha_api_")
+        manager = make_manager(self.state_dir)
+
+        self.web_id = manager.create_task("web", Priority.LOW, ResourceRequirements(memory="256m"))
+        self.db_id = manager.create_task("db", Priority.MEDIUM, ResourceRequirements(memory="1g"))
+
+        patcher = patch.multiple(routes, docker_manager=manager, job_scheduler=None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        routes._STATUS_CACHE.update(t=0.0, payload=None)
+        self.client = routes.app.test_client()
+
+    def tearDown(self):
+        """Remove the temporary state directory"""
+        shutil.rmtree(self.state_dir, ignore_errors=True)
+
+    def batch(self, endpoints):
+        """POST a batch of endpoints and return the response"""
+        return self.client.post("/api/_batch", json={"gets": endpoints})
+
+    def test_batch_mixed_results(self):
+        """Test that each batched endpoint gets its own status code and body"""
+        response = self.batch([
+            f"tasks/{self.web_id}",
+            "tasks/no-such-task",
+            "tasks?status=bogus",
+            "no/such/endpoint",
+        ])
+        self.assertEqual(response.status_code, 200)
+        results = response.get_json()["results"]
+
+        found = results[f"tasks/{self.web_id}"]
+        self.assertEqual(found["status"], 200)
+        self.assertEqual(found["body"]["name"], "web")
+
+        self.assertEqual(results["tasks/no-such-task"]["status"], 404)
+        self.assertEqual(results["tasks/no-such-task"]["body"], {"error": "Task not found"})
+
+        self.assertEqual(results["tasks?status=bogus"]["status"], 400)
+        self.assertIn("Invalid status", results["tasks?status=bogus"]["body"]["error"])
+
+        # Flask's own 404 page is HTML, so it is replaced by a JSON error
+        self.assertEqual(results["no/such/endpoint"]["status"], 404)
+        self.assertIn("Not a JSON endpoint", results["no/such/endpoint"]["body"]["error"])
+
+    def test_batch_matches_single_requests(self):
+        """Test that batched bodies are the same as fetching each endpoint alone"""
+        endpoints = ["system/status", "tasks?fields=id,name", f"tasks/{self.db_id}"]
+        results = self.batch(endpoints).get_json()["results"]
+
+        self.assertEqual(list(results), endpoints)
+        for endpoint in endpoints:
+            single = self.client.get(f"/api/{endpoint}")
+            self.assertEqual(results[endpoint], {"status": 200, "body": single.get_json()})
+
+    def test_batch_repeated_endpoint_runs_once(self):
+        """Test that an endpoint listed twice appears once in the results"""
+        results = self.batch(["tasks", "tasks"]).get_json()["results"]
+        self.assertEqual(list(results), ["tasks"])
+        self.assertEqual(len(results["tasks"]["body"]), 2)
+
+    def test_batch_rejects_bad_requests(self):
+        """Test that malformed or oversized batches are rejected as a whole"""
+        for body in ({}, {"gets": "tasks"}, {"gets": ["tasks", 1]}, ["tasks"]):
+            response = self.client.post("/api/_batch", json=body)
+            self.assertEqual(response.status_code, 400, body)
+
+        response = self.batch(["tasks"] * (routes.MAX_BATCH_GETS + 1))
+        self.assertEqual(response.status_code, 400)
+
+    def test_create_task_requires_object_body(self):
+        """Test that a task body that isn't a JSON object gets the missing fields error"""
+        for body in ([], ["name", "priority"], "web", 1, None):
+            response = self.client.post("/api/tasks", json=body)
+            self.assertEqual(response.status_code, 400, body)
+            self.assertEqual(response.get_json(), {"error": "Missing required fields: name, priority"})
+
+    def test_tasks_fields_projection(self):
+        """Test that ?fields= keeps only the named fields, including nested ones"""
+        response = self.client.get("/api/tasks?fields=id,resources.memory")
+        self.assertEqual(response.status_code, 200)
+        by_id = {task["id"]: task for task in response.get_json()}
+        self.assertEqual(by_id, {
+            self.web_id: {"id": self.web_id, "resources": {"memory": "256m"}},
+            self.db_id: {"id": self.db_id, "resources": {"memory": "1g"}},
+        })
+
+    def test_tasks_fields_projection_with_status(self):
+        """Test that projection applies to a status-filtered listing too"""
+        response = self.client.get("/api/tasks?status=pending&fields=name")
+        self.assertEqual(sorted(response.get_json(), key=lambda t: t["name"]),
+                         [{"name": "db"}, {"name": "web"}])
+
+    def test_follow_streams_are_capped(self):
+        """Test that followers past MAX_LOG_FOLLOWERS get a 503 until a stream closes"""
+        url = "/api/containers/c1/logs?follow=1"
+        manager = routes.docker_manager
+        with patch.dict(routes.app.config, {"MAX_LOG_FOLLOWERS": 1}), \
+                patch.object(manager, "get_container_logs_iter", side_effect=lambda *a, **kw: iter([b"line\n"])):
+            first = self.client.get(url, buffered=False)
+            self.assertEqual(first.status_code, 200)
+            self.assertEqual(self.client.get(url).status_code, 503)
+
+            first.close()
+            second = self.client.get(url, buffered=False)
+            self.assertEqual(second.status_code, 200)
+            second.close()
+        self.assertEqual(routes._FOLLOWERS["count"], 0)
+
+
+class TestProjectFields(unittest.TestCase):
+    """Test cases for _project_fields"""
+
+    ITEMS = [
+        {"id": "a", "name": "web", "resources": {"memory": "1g", "cpu_shares": 512}},
+        {"id": "b", "resources": None},
+    ]
+
+    def test_no_fields_keeps_items(self):
+        """Test that no or empty fields returns the items unchanged"""
+        self.assertIs(routes._project_fields(self.ITEMS, None), self.ITEMS)
+        self.assertIs(routes._project_fields(self.ITEMS, ""), self.ITEMS)
+
+    def test_top_level_and_nested_fields(self):
+        """Test selecting top-level and dotted nested fields"""
+        self.assertEqual(routes._project_fields(self.ITEMS, "id,resources.memory"), [
+            {"id": "a", "resources": {"memory": "1g"}},
+            {"id": "b"},
+        ])
+
+    def test_missing_fields_are_left_out(self):
+        """Test that unknown fields and empty names are skipped rather than nulled"""
+        self.assertEqual(routes._project_fields(self.ITEMS, "name,,missing,resources.missing"), [
+            {"name": "web", "resources": {}},
+            {},
+        ])
+
+
+if __name__ == "__main__":
+    unittest.main()
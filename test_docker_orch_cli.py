@@ -215,7 +215,7 @@ class TestDockerOrchCLI(unittest.TestCase):
         
         # Mock the response
         mock_response = MagicMock()
-        mock_response.json.return_value = {"status": "ok"}
+        mock_response.content = b'{"status": "ok"}'
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
         
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Test Suite for Docker Orchestration helper functions
+
+These tests cover small parsing helpers that the API and CLI rely on:
+memory limit strings and the new output between two polls of a log tail.
+
+Usage:
+  python test_helpers.py
+"""
+
+import unittest
+import pytest
+
+from docker_orcha.models.resources import ResourceRequirements, parse_memory_string
+
+
+class TestParseMemoryString(unittest.TestCase):
+    """Test cases for parse_memory_string"""
+
+    def test_units(self):
+        """Test plain byte counts and k/m/g units"""
+        self.assertEqual(parse_memory_string("100"), 100)
+        self.assertEqual(parse_memory_string("4k"), 4 * 1024)
+        self.assertEqual(parse_memory_string("512m"), 512 * 1024 * 1024)
+        self.assertEqual(parse_memory_string("2g"), 2 * 1024 * 1024 * 1024)
+
+    def test_units_are_case_insensitive(self):
+        """Test that upper-case units parse like lower-case ones"""
+        self.assertEqual(parse_memory_string("1G"), parse_memory_string("1g"))
+        self.assertEqual(parse_memory_string("256M"), 256 * 1024 * 1024)
+
+    def test_invalid_strings_parse_as_zero(self):
+        """Test that anything but a whole number with an optional unit gives 0"""
+        for value in (None, "", "g", "1.5g", "1gb", "-1m", " 1g", "1g ", "1g\n", "1t", "abc"):
+            self.assertEqual(parse_memory_string(value), 0, value)
+
+    def test_resource_requirements_bytes(self):
+        """Test the byte properties, including bare numbers read as megabytes"""
+        resources = ResourceRequirements(memory="512", memory_swap="1g")
+        self.assertEqual(resources.memory, "512m")
+        self.assertEqual(resources.memory_bytes, 512 * 1024 * 1024)
+        self.assertEqual(resources.memory_swap_bytes, 1024 * 1024 * 1024)
+
+
+class TestLogsDelta(unittest.TestCase):
+    """Test cases for the CLI's _logs_delta"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Import the CLI commands, which need typer and rich"""
+        pytest.importorskip("typer")
+        pytest.importorskip("rich")
+        from docker_orcha.cli import commands
+        cls.commands = commands
+
+    def delta(self, prev_logs, new_logs):
+        """Get the new output between two polls"""
+        return self.commands._logs_delta(prev_logs, new_logs)
+
+    def test_appended_output(self):
+        """Test that output appended to the previous window is returned"""
+        self.assertEqual(self.delta("a\nb\n", "a\nb\nc\n"), "c\n")
+
+    def test_unchanged_and_first_poll(self):
+        """Test unchanged logs and a first poll with nothing before it"""
+        self.assertEqual(self.delta("a\nb\n", "a\nb\n"), "")
+        self.assertEqual(self.delta("", "a\n"), "a\n")
+
+    def test_scrolled_window(self):
+        """Test that a scrolled tail window yields only the lines after the old end"""
+        lines = [f"line {i}\n" for i in range(200)]
+        prev_logs = "".join(lines[:100])
+        new_logs = "".join(lines[50:150])
+        self.assertEqual(self.delta(prev_logs, new_logs), "".join(lines[100:150]))
+
+    def test_unrelated_logs(self):
+        """Test that logs sharing nothing with the previous window are all new"""
+        self.assertEqual(self.delta("a\nb\n", "x\ny\n"), "x\ny\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Test Suite for the JobScheduler
+
+These tests run single scheduler passes against a DockerManager with a
+stubbed Docker client: starting pending tasks in priority order as resources
+allow, and recording container exits from the events stream or by polling.
+No Docker daemon is needed.
+
+Usage:
+  python test_scheduler.py
+"""
+
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch, MagicMock
+
+from testing_utils import make_manager
+from docker_orcha.core.scheduler import JobScheduler
+from docker_orcha.models.enums import Priority, TaskState
+from docker_orcha.models.resources import ResourceRequirements
+
+
+class SchedulerTestCase(unittest.TestCase):
+    """Base class setting up a manager whose start_task only records the call"""
+
+    def setUp(self):
+        """Set up a manager with a fake start_task"""
+        self.state_dir = tempfile.mkdtemp(prefix="orcha_scheduler_")
+        self.manager = make_manager(self.state_dir)
+        self.started = []
+        self.start_result = True
+
+        # No reaper threads; exits are fed to the scheduler by the tests
+        watch_patch = patch.object(self.manager, "_watch_container")
+        watch_patch.start()
+        self.addCleanup(watch_patch.stop)
+
+        def start_task(task_id):
+            self.started.append(task_id)
+            if self.start_result:
+                self.run_task(self.manager.tasks[task_id])
+            return self.start_result
+
+        self.manager.start_task = start_task
+
+    def tearDown(self):
+        """Remove the temporary state directory"""
+        shutil.rmtree(self.state_dir, ignore_errors=True)
+
+    def create_task(self, name, priority=Priority.MEDIUM, created_at=None, cpu_shares=1024):
+        """Create a pending task; cpu_shares of 1024 needs one of the 4 available cores"""
+        task_id = self.manager.create_task(name, priority, ResourceRequirements(cpu_shares=cpu_shares))
+        if created_at is not None:
+            self.manager.tasks[task_id].created_at = created_at
+        return task_id
+
+    def run_task(self, task):
+        """Mark a task running in its own container, as start_task would"""
+        task.container_id = f"container_{task.id}"
+        self.manager._set_task_state(task, TaskState.RUNNING)
+
+
+class TestProcessPendingTasks(SchedulerTestCase):
+    """Test cases for starting pending tasks"""
+
+    def test_highest_priority_then_oldest_first(self):
+        """Test that tasks start by priority rank, oldest first within a rank"""
+        low = self.create_task("low", Priority.LOW, created_at=1.0)
+        high_new = self.create_task("high-new", Priority.HIGH, created_at=3.0)
+        high_old = self.create_task("high-old", Priority.HIGH, created_at=2.0)
+        critical = self.create_task("critical", Priority.CRITICAL, created_at=4.0)
+        # The queue is built from the tasks' created_at when the scheduler starts
+        scheduler = JobScheduler(self.manager)
+
+        scheduler._process_pending_tasks()
+        self.assertEqual(self.started, [critical, high_old, high_new, low])
+        self.assertEqual(scheduler._pending_heap, [])
+
+    def test_task_that_does_not_fit_is_requeued(self):
+        """Test that a task without room is queued again and lower tasks wait behind it"""
+        first = self.create_task("first", Priority.HIGH, created_at=1.0, cpu_shares=2048)
+        second = self.create_task("second", Priority.HIGH, created_at=2.0, cpu_shares=2048)
+        third = self.create_task("third", Priority.HIGH, created_at=3.0, cpu_shares=2048)
+        small = self.create_task("small", Priority.LOW, created_at=4.0, cpu_shares=512)
+        scheduler = JobScheduler(self.manager)
+
+        # Four cores fit the first two; the resources they took are
+        # subtracted locally for the rest of the pass
+        scheduler._process_pending_tasks()
+        self.assertEqual(self.started, [first, second])
+        self.assertEqual(self.manager.tasks[third].state, TaskState.PENDING)
+        self.assertEqual(scheduler._pending_set, {third, small})
+
+        # The next pass reads available resources afresh
+        scheduler._process_pending_tasks()
+        self.assertEqual(self.started, [first, second, third, small])
+
+    def test_failed_start_is_requeued(self):
+        """Test that a task start_task couldn't start stays queued for the next pass"""
+        task_id = self.create_task("task")
+        scheduler = JobScheduler(self.manager)
+
+        self.start_result = False
+        scheduler._process_pending_tasks()
+        self.assertEqual(self.started, [task_id])
+        self.assertEqual(scheduler._pending_set, {task_id})
+
+        self.start_result = True
+        scheduler._process_pending_tasks()
+        self.assertEqual(self.started, [task_id, task_id])
+        self.assertEqual(self.manager.tasks[task_id].state, TaskState.RUNNING)
+
+    def test_tasks_no_longer_pending_are_skipped(self):
+        """Test that queued tasks that were deleted or left PENDING are dropped"""
+        deleted = self.create_task("deleted", Priority.CRITICAL, created_at=1.0)
+        paused = self.create_task("paused", Priority.HIGH, created_at=2.0)
+        pending = self.create_task("pending", Priority.LOW, created_at=3.0)
+        scheduler = JobScheduler(self.manager)
+
+        self.manager.delete_task(deleted)
+        self.manager._set_task_state(self.manager.tasks[paused], TaskState.PAUSED)
+
+        scheduler._process_pending_tasks()
+        self.assertEqual(self.started, [pending])
+        self.assertEqual(scheduler._pending_set, set())
+
+    def test_new_tasks_are_queued_once(self):
+        """Test that tasks created after the scheduler are queued, and only once"""
+        scheduler = JobScheduler(self.manager)
+        task_id = self.create_task("task")
+        scheduler.enqueue_pending(task_id)
+
+        self.assertEqual(len(scheduler._pending_heap), 1)
+        self.assertTrue(scheduler._wake.is_set())
+
+
+class TestRunningTasks(SchedulerTestCase):
+    """Test cases for recording the exits of running tasks"""
+
+    def setUp(self):
+        """Set up a scheduler with two running tasks"""
+        super().setUp()
+        self.first = self.create_task("first", created_at=1.0)
+        self.second = self.create_task("second", created_at=2.0)
+        self.scheduler = JobScheduler(self.manager)
+        self.scheduler._process_pending_tasks()
+        self.containers = self.manager.client.containers
+
+    def container_id(self, task_id):
+        """Get the container a task is running in"""
+        return self.manager.tasks[task_id].container_id
+
+    def test_queued_exits_are_drained(self):
+        """Test that exits from the events stream are applied without polling"""
+        self.scheduler._events_connected = True
+        self.scheduler._exits.put((self.first, self.container_id(self.first), 0))
+        self.scheduler._exits.put((self.second, self.container_id(self.second), 2))
+        # An exit of a container the task has already left is ignored
+        self.scheduler._exits.put((self.second, "old_container", 0))
+
+        self.scheduler._check_running_tasks()
+        self.assertEqual(self.manager.tasks[self.first].state, TaskState.COMPLETED)
+        self.assertEqual(self.manager.tasks[self.second].state, TaskState.FAILED)
+        self.assertTrue(self.scheduler._exits.empty())
+        self.containers.get.assert_not_called()
+
+    def test_running_tasks_are_polled_without_events(self):
+        """Test that container states are polled while the events stream is down"""
+        exited = MagicMock(status="exited", attrs={"State": {"ExitCode": 0}})
+        running = MagicMock(status="running")
+        self.containers.get.side_effect = \
+            lambda container_id: exited if container_id == self.container_id(self.first) else running
+
+        self.scheduler._check_running_tasks()
+        self.assertEqual(self.manager.tasks[self.first].state, TaskState.COMPLETED)
+        self.assertEqual(self.manager.tasks[self.second].state, TaskState.RUNNING)
+
+    def test_poll_once_after_events_connect(self):
+        """Test that one poll after the stream connects catches exits it missed"""
+        self.containers.get.return_value = MagicMock(status="running")
+        self.scheduler._events_connected = True
+        self.scheduler._resync = True
+
+        self.scheduler._check_running_tasks()
+        self.assertEqual(self.containers.get.call_count, 2)
+        self.assertFalse(self.scheduler._resync)
+
+        self.scheduler._check_running_tasks()
+        self.assertEqual(self.containers.get.call_count, 2)
+
+    def test_events_loop_queues_task_exits(self):
+        """Test that die and destroy events for task containers are queued as exits"""
+        scheduler = self.scheduler
+        first_container = self.container_id(self.first)
+        second_container = self.container_id(self.second)
+        events = [
+            {"Action": "die", "Actor": {"ID": "unrelated", "Attributes": {"exitCode": "0"}}},
+            {"Action": "die", "Actor": {"ID": first_container, "Attributes": {"exitCode": "3"}}},
+            {"Action": "destroy", "Actor": {"ID": second_container}},
+        ]
+        calls = []
+
+        def client_events(**kwargs):
+            calls.append(kwargs)
+            if len(calls) > 1:
+                # Stop after the first stream has been read
+                scheduler.running = False
+                raise RuntimeError("stream closed")
+            return iter(events)
+
+        self.manager.client.events.side_effect = client_events
+        scheduler.check_interval = 0
+        scheduler.running = True
+        scheduler._events_loop()
+
+        exits = []
+        while not scheduler._exits.empty():
+            exits.append(scheduler._exits.get_nowait())
+        self.assertEqual(exits, [(self.first, first_container, 3), (self.second, second_container, -1)])
+        self.assertFalse(scheduler._events_connected)
+
+
+if __name__ == "__main__":
+    unittest.main()
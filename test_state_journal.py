@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Test Suite for the DockerManager state journal
+
+These tests cover how task state is persisted: the full state file, the
+journal of task changes appended after it, and how the two are read back
+when the orchestrator starts. The Docker client is stubbed out, so no Docker
+daemon is needed.
+
+Usage:
+  python test_state_journal.py
+"""
+
+import os
+import json
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from testing_utils import make_manager
+from docker_orcha.utils import json_utils
+from docker_orcha.core.docker_manager import DockerManager
+from docker_orcha.models.enums import Priority, TaskState
+from docker_orcha.models.resources import ResourceRequirements
+
+
+class TestStateJournal(unittest.TestCase):
+    """Test cases for writing and replaying the tasks state journal"""
+
+    def setUp(self):
+        """Set up a temporary state directory"""
+        self.state_dir = tempfile.mkdtemp(prefix="orcha_state_")
+        self.state_file = os.path.join(self.state_dir, "tasks_state.json")
+        self.journal_file = os.path.join(self.state_dir, "tasks_state.journal")
+
+    def tearDown(self):
+        """Remove the temporary state directory"""
+        shutil.rmtree(self.state_dir, ignore_errors=True)
+
+    def make_manager(self):
+        """Create a manager on the test state directory"""
+        return make_manager(self.state_dir)
+
+    def create_task(self, manager, name, priority=Priority.LOW):
+        """Create a pending task with small resource requirements"""
+        return manager.create_task(name, priority, ResourceRequirements(cpu_shares=512, memory="256m"))
+
+    def journal_lines(self):
+        """Get the lines of the journal file"""
+        with open(self.journal_file, "rb") as f:
+            return f.read().splitlines()
+
+    def test_full_save_starts_journal(self):
+        """Test that a full save writes the state file and an empty journal naming it"""
+        manager = self.make_manager()
+        task_id = self.create_task(manager, "first")
+        manager.flush_state()
+
+        with open(self.state_file, "rb") as f:
+            self.assertIn(task_id, json.loads(f.read()))
+
+        lines = self.journal_lines()
+        self.assertEqual(len(lines), 1)
+        header = json.loads(lines[0])
+        self.assertEqual(header["state_file"], DockerManager._state_file_id(self.state_file))
+        self.assertEqual(manager._journal_records, 0)
+
+    def test_changes_are_appended_to_journal(self):
+        """Test that single-task changes are journaled instead of rewriting the state file"""
+        manager = self.make_manager()
+        first_id = self.create_task(manager, "first")
+        manager.flush_state()
+        state_id = DockerManager._state_file_id(self.state_file)
+
+        second_id = self.create_task(manager, "second")
+        manager._write_state()
+        manager.update_task_resources(first_id, ResourceRequirements(cpu_shares=256, memory="128m"))
+        manager._write_state()
+
+        # The state file was left alone
+        self.assertEqual(DockerManager._state_file_id(self.state_file), state_id)
+
+        records = [json.loads(line) for line in self.journal_lines()[1:]]
+        self.assertEqual([record["id"] for record in records], [second_id, first_id])
+        self.assertEqual(records[1]["task"]["resources"]["cpu_shares"], 256)
+        self.assertEqual(manager._journal_records, 2)
+
+    def test_replay_applies_records_in_order(self):
+        """Test that loading replays the journal over the state file, later records winning"""
+        manager = self.make_manager()
+        kept_id = self.create_task(manager, "kept")
+        deleted_id = self.create_task(manager, "deleted")
+        manager.flush_state()
+
+        manager.update_task_resources(kept_id, ResourceRequirements(cpu_shares=256))
+        manager._write_state()
+        manager.update_task_resources(kept_id, ResourceRequirements(cpu_shares=128))
+        manager._write_state()
+        manager.delete_task(deleted_id)
+        added_id = self.create_task(manager, "added", Priority.MEDIUM)
+        manager._write_state()
+
+        loaded = self.make_manager()
+        self.assertEqual(set(loaded.tasks), {kept_id, added_id})
+        self.assertEqual(loaded.tasks[kept_id].resources.cpu_shares, 128)
+        self.assertEqual(loaded.tasks[added_id].priority, Priority.MEDIUM)
+        self.assertEqual(loaded.tasks[added_id].state, TaskState.PENDING)
+        self.assertEqual(loaded.get_task_state_counts()[TaskState.PENDING], 2)
+        # The journal was complete, so the next change can be appended to it
+        self.assertEqual(loaded._journal_records, 4)
+
+    def test_torn_final_record_is_ignored(self):
+        """Test that a record cut short mid-write ends the replay and forces a full save"""
+        manager = self.make_manager()
+        task_id = self.create_task(manager, "first")
+        manager.flush_state()
+        manager.update_task_resources(task_id, ResourceRequirements(cpu_shares=256))
+        manager._write_state()
+        manager.update_task_resources(task_id, ResourceRequirements(cpu_shares=128))
+        manager._write_state()
+
+        # Cut the last record in half, as a crash during the append would
+        with open(self.journal_file, "rb") as f:
+            data = f.read()
+        last_start = data.rstrip(b"\n").rfind(b"\n") + 1
+        with open(self.journal_file, "wb") as f:
+            f.write(data[:last_start + (len(data) - last_start) // 2])
+
+        loaded = self.make_manager()
+        self.assertEqual(loaded.tasks[task_id].resources.cpu_shares, 256)
+        self.assertIsNone(loaded._journal_records)
+
+        # With no usable journal, the next write compacts everything into the state file
+        loaded._write_state()
+        self.assertEqual(len(self.journal_lines()), 1)
+        self.assertEqual(self.make_manager().tasks[task_id].resources.cpu_shares, 256)
+
+    def test_record_missing_newline_is_torn(self):
+        """Test that a final record is only applied once its newline has been written"""
+        manager = self.make_manager()
+        task_id = self.create_task(manager, "first")
+        manager.flush_state()
+        manager.update_task_resources(task_id, ResourceRequirements(cpu_shares=256))
+        manager._write_state()
+
+        with open(self.journal_file, "rb") as f:
+            data = f.read()
+        with open(self.journal_file, "wb") as f:
+            f.write(data.rstrip(b"\n"))
+
+        loaded = self.make_manager()
+        self.assertEqual(loaded.tasks[task_id].resources.cpu_shares, 512)
+        self.assertIsNone(loaded._journal_records)
+
+    def test_journal_for_replaced_state_file_is_ignored(self):
+        """Test that a journal whose header names an older state file is not replayed"""
+        manager = self.make_manager()
+        task_id = self.create_task(manager, "first")
+        manager.flush_state()
+        manager.update_task_resources(task_id, ResourceRequirements(cpu_shares=256))
+        manager._write_state()
+
+        # Replace the state file, as a full save that crashed before
+        # starting its journal would
+        with open(self.state_file, "rb") as f:
+            data = f.read()
+        os.remove(self.state_file)
+        with open(self.state_file, "wb") as f:
+            f.write(data + b" ")
+
+        loaded = self.make_manager()
+        self.assertEqual(loaded.tasks[task_id].resources.cpu_shares, 512)
+        self.assertIsNone(loaded._journal_records)
+
+    def test_full_journal_is_compacted(self):
+        """Test that the state file is rewritten once the journal would pass journal_max_records"""
+        manager = self.make_manager()
+        manager.journal_max_records = 2
+        task_id = self.create_task(manager, "first")
+        manager.flush_state()
+
+        for cpu_shares in (100, 200):
+            manager.update_task_resources(task_id, ResourceRequirements(cpu_shares=cpu_shares))
+            manager._write_state()
+        self.assertEqual(len(self.journal_lines()), 3)
+
+        manager.update_task_resources(task_id, ResourceRequirements(cpu_shares=300))
+        manager._write_state()
+        self.assertEqual(len(self.journal_lines()), 1)
+        self.assertEqual(manager._journal_records, 0)
+
+        with open(self.state_file, "rb") as f:
+            self.assertEqual(json.loads(f.read())[task_id]["resources"]["cpu_shares"], 300)
+        self.assertEqual(self.make_manager().tasks[task_id].resources.cpu_shares, 300)
+
+
+
+class TestStateJournalWithoutOrjson(TestStateJournal):
+    """The same test cases with the json module encoding and decoding the state"""
+
+    def setUp(self):
+        """Set up a temporary state directory and hide orjson"""
+        super().setUp()
+        orjson_patch = patch.object(json_utils, "orjson", None)
+        orjson_patch.start()
+        self.addCleanup(orjson_patch.stop)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Test Suite for recording task container exits
+
+A running task's exit can be reported by its reaper thread, by the
+scheduler's Docker events stream or by its poll. All of them go through
+DockerManager._record_exit, which must only finish a task that is still
+running in that container and isn't being stopped by the manager itself.
+The Docker client is stubbed out, so no Docker daemon is needed.
+
+Usage:
+  python test_task_exits.py
+"""
+
+import time
+import shutil
+import tempfile
+import threading
+import unittest
+
+from testing_utils import make_manager
+from docker_orcha.models.enums import Priority, TaskState
+from docker_orcha.models.resources import ResourceRequirements
+
+
+class TestRecordExit(unittest.TestCase):
+    """Test cases for _record_exit and the calls that race with it"""
+
+    def setUp(self):
+        """Set up a manager whose containers only exit when released"""
+        self.state_dir = tempfile.mkdtemp(prefix="orcha_exits_")
+        self.manager = make_manager(self.state_dir)
+
+        # Reaper threads block in api.wait() until the test releases them
+        self.released = threading.Event()
+        self.exit_codes = {}
+
+        def wait(container_id):
+            self.released.wait()
+            return {"StatusCode": self.exit_codes.get(container_id, 0)}
+
+        self.manager.api.wait.side_effect = wait
+
+    def tearDown(self):
+        """Let any reaper threads finish and remove the state directory"""
+        self.released.set()
+        shutil.rmtree(self.state_dir, ignore_errors=True)
+
+    def start_task(self, name, container_id):
+        """Create a task and mark it running in container_id, as start_task would"""
+        task_id = self.manager.create_task(name, Priority.LOW, ResourceRequirements())
+        task = self.manager.tasks[task_id]
+        task.container_id = container_id
+        self.manager._set_task_state(task, TaskState.RUNNING)
+        return task
+
+    def wait_for_state(self, task, state, timeout=2.0):
+        """Wait for a reaper thread to move a task to state"""
+        deadline = time.monotonic() + timeout
+        while task.state != state and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(task.state, state)
+
+    def test_exit_code_sets_final_state(self):
+        """Test that exit code 0 completes a task and anything else fails it"""
+        completed = self.start_task("completed", "c1")
+        failed = self.start_task("failed", "c2")
+
+        self.assertTrue(self.manager._record_exit(completed.id, "c1", 0))
+        self.assertTrue(self.manager._record_exit(failed.id, "c2", 137))
+
+        self.assertEqual(completed.state, TaskState.COMPLETED)
+        self.assertEqual(failed.state, TaskState.FAILED)
+        self.assertIsNotNone(completed.completed_at)
+        self.assertEqual(self.manager.get_task_state_counts()[TaskState.RUNNING], 0)
+
+    def test_exit_is_recorded_once(self):
+        """Test that a second detector reporting the same exit changes nothing"""
+        task = self.start_task("task", "c1")
+        self.assertTrue(self.manager._record_exit(task.id, "c1", 1))
+        self.assertFalse(self.manager._record_exit(task.id, "c1", 0))
+        self.assertEqual(task.state, TaskState.FAILED)
+
+    def test_stopping_task_is_ignored(self):
+        """Test that an exit is ignored while the manager is stopping the task"""
+        task = self.start_task("task", "c1")
+        self.manager._stopping.add(task.id)
+
+        self.assertFalse(self.manager._record_exit(task.id, "c1", 137))
+        self.assertEqual(task.state, TaskState.RUNNING)
+
+    def test_other_container_is_ignored(self):
+        """Test that the exit of a task's previous container is ignored"""
+        task = self.start_task("task", "new")
+
+        self.assertFalse(self.manager._record_exit(task.id, "old", 1))
+        self.assertEqual(task.state, TaskState.RUNNING)
+
+    def test_task_no_longer_running_is_ignored(self):
+        """Test that an exit reported after the task left RUNNING is ignored"""
+        task = self.start_task("task", "c1")
+        self.manager._set_task_state(task, TaskState.PAUSED)
+
+        self.assertFalse(self.manager._record_exit(task.id, "c1", 137))
+        self.assertEqual(task.state, TaskState.PAUSED)
+        self.assertFalse(self.manager._record_exit("no-such-task", "c1", 0))
+
+    def test_stop_task_during_exit(self):
+        """Test that the exit caused by stop_task leaves the task paused"""
+        task = self.start_task("task", "c1")
+        recorded = []
+        self.manager.api.stop.side_effect = \
+            lambda container_id, timeout: recorded.append(self.manager._record_exit(task.id, container_id, 137))
+
+        self.assertTrue(self.manager.stop_task(task.id))
+        self.assertEqual(recorded, [False])
+        self.assertEqual(task.state, TaskState.PAUSED)
+        self.assertNotIn(task.id, self.manager._stopping)
+
+    def test_delete_task_during_exit(self):
+        """Test that an exit reported while delete_task stops the container doesn't bring the task back"""
+        task = self.start_task("task", "c1")
+        recorded = []
+        container = self.manager.client.containers.get.return_value
+        container.stop.side_effect = \
+            lambda timeout: recorded.append(self.manager._record_exit(task.id, "c1", 137))
+
+        self.assertTrue(self.manager.delete_task(task.id))
+        self.assertEqual(recorded, [False])
+        self.assertNotIn(task.id, self.manager.tasks)
+        self.assertNotIn(task.id, self.manager._stopping)
+        for state in TaskState:
+            self.assertNotIn(task, self.manager.get_tasks_in_state(state))
+
+        # The reaper reporting the exit afterwards changes nothing either
+        self.assertFalse(self.manager._record_exit(task.id, "c1", 137))
+        self.assertNotIn(task.id, self.manager.tasks)
+        self.assertEqual(sum(self.manager.get_task_state_counts().values()), 0)
+
+    def test_reaper_records_exit(self):
+        """Test that a task's reaper thread records its container's exit"""
+        completed = self.start_task("completed", "c1")
+        failed = self.start_task("failed", "c2")
+        self.exit_codes["c2"] = 1
+
+        self.released.set()
+        self.wait_for_state(completed, TaskState.COMPLETED)
+        self.wait_for_state(failed, TaskState.FAILED)
+
+
+if __name__ == "__main__":
+    unittest.main()
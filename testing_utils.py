@@ -0,0 +1,36 @@
+"""
+Shared helpers for the Docker Orchestration unit tests
+
+Importing this module makes docker_orcha importable without the docker
+package: the manager only needs it to build its client, which the tests
+replace. Import it before any docker_orcha.core module.
+"""
+
+import sys
+import types
+from unittest.mock import patch, MagicMock
+
+try:
+    import docker
+except ImportError:
+    docker = types.ModuleType("docker")
+    docker.DockerClient = None
+    docker.errors = types.SimpleNamespace(NotFound=LookupError, APIError=RuntimeError)
+    sys.modules["docker"] = docker
+
+from docker_orcha.core import docker_manager
+from docker_orcha.core.docker_manager import DockerManager
+
+
+def make_manager(state_dir):
+    """
+    Create a DockerManager on state_dir with a stubbed Docker client.
+
+    The client is a MagicMock, reachable as manager.client and manager.api.
+    The background writer and the exit-time flush are left out, so state
+    only reaches disk when a test calls _write_state or flush_state.
+    """
+    with patch.object(docker_manager.docker, "DockerClient", return_value=MagicMock()), \
+            patch.object(DockerManager, "_persistence_loop", lambda self: None), \
+            patch.object(docker_manager.atexit, "register"):
+        return DockerManager(state_dir=state_dir)